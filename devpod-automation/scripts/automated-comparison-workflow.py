@@ -17,6 +17,11 @@ import argparse
 import concurrent.futures
 from dataclasses import dataclass, asdict
 import hashlib
+import sys
+
+# Shared schema migrations live next to the scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from results_db_migrations import migrate_results_db
 
 @dataclass
 class EvaluationTask:
@@ -233,6 +238,12 @@ class AutomatedComparisonWorkflow:
         ''')
         
         conn.commit()
+        
+        # Versioned indexes shared with the other results.db scripts
+        applied = migrate_results_db(conn, "automated-comparison-workflow")
+        if applied:
+            self.logger.info(f"🗄️ Applied results.db schema migrations {applied}")
+        
         conn.close()
 
     async def run_full_comparison_workflow(self, 
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for the Scoring and Analytics Engine
+Times analytics hot paths on synthetic evaluation data
+"""
+
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+TOOLS = ("claude-code", "gemini-cli")
+LANGUAGES = ("python", "typescript", "rust", "go", "nushell")
+CATEGORIES = ("ui-components", "apis", "cli-tools", "web-apps", "data-processing")
+
+# One small function per language, repeated to the sampled response length
+CODE_TEMPLATES = {
+    "python": "def handler_{k}(items):\n    for item in items:\n        if item:\n            yield item\n",
+    "typescript": "function handler{k}(items: string[]) {{\n  for (const item of items) {{\n"
+                  "    if (item) {{\n      console.log(item);\n    }}\n  }}\n}}\n",
+    "rust": "fn handler_{k}(items: &[u32]) {{\n    for item in items {{\n"
+            "        if *item > 0 {{\n            println!(\"{{}}\", item);\n        }}\n    }}\n}}\n",
+    "go": "func handler{k}(items []int) {{\n\tfor _, item := range items {{\n"
+          "\t\tif item > 0 {{\n\t\t\tfmt.Println(item)\n\t\t}}\n\t}}\n}}\n",
+    "nushell": "def handler-{k} [items] {{\n    $items | each {{ |item|\n        if $item > 0 {{ $item }}\n    }}\n}}\n",
+}
+COMPLEXITY_WEIGHTS = (0.15, 0.25, 0.3, 0.2, 0.1)
+
+def load_engine_module():
+    """Import scoring-analytics-engine.py despite its hyphenated file name"""
+    module_name = "scoring_analytics_engine"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / "scoring-analytics-engine.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+@dataclass(frozen=True)
+class SyntheticProfile:
+    """Shape of a synthetic results.db.
+
+    Response lengths are log-normal around `response_median` characters, and
+    responses repeat across `response_variants` code snippets per language, so
+    deduplicated work like code analysis sees a realistic number of distinct
+    responses. Later tools in `tools` are slightly slower, less reliable and
+    score lower, which gives the statistical comparisons real differences.
+    """
+    tools: Tuple[str, ...] = TOOLS
+    languages: Tuple[str, ...] = LANGUAGES
+    categories: Tuple[str, ...] = CATEGORIES
+    response_median: int = 1100
+    response_sigma: float = 0.8
+    response_variants: int = 50
+    days: int = 0
+
+def synthetic_responses(languages: np.ndarray, variants: np.ndarray, lengths: np.ndarray) -> List[str]:
+    """Markdown responses with a fenced code block of roughly the requested length"""
+
+    cache: Dict[Tuple, str] = {}
+    responses = []
+    for language, variant, length in zip(languages, variants, lengths // 64):
+        key = (language, variant, length)
+        response = cache.get(key)
+        if response is None:
+            template = CODE_TEMPLATES.get(language, "step {k}\n")
+            snippet = template.format(k=variant)
+            body = snippet * max(1, int(length) * 64 // len(snippet))
+            response = cache[key] = f"Here is the implementation.\n\n```{language}\n{body}```\n"
+        responses.append(response)
+    return responses
+
+def synthetic_evaluation_frame(rows: int, seed: int = 42,
+                               profile: SyntheticProfile = SyntheticProfile()) -> pd.DataFrame:
+    """Build an evaluation_results-shaped DataFrame with plausible value ranges"""
+
+    rng = np.random.default_rng(seed)
+    tool_index = rng.integers(0, len(profile.tools), size=rows)
+    tools = np.array(profile.tools)[tool_index]
+    languages = np.array(profile.languages)[rng.integers(0, len(profile.languages), size=rows)]
+    complexity = rng.choice(np.arange(1, 6), size=rows, p=COMPLEXITY_WEIGHTS)
+
+    lengths = rng.lognormal(mean=np.log(profile.response_median), sigma=profile.response_sigma, size=rows)
+    lengths = lengths.astype(int)
+    responses = synthetic_responses(languages, rng.integers(0, profile.response_variants, size=rows), lengths)
+
+    execution_time = rng.gamma(2.0, 4.0 * complexity * (1 + 0.15 * tool_index))
+    success = rng.random(rows) < np.clip(0.95 - 0.03 * tool_index, 0.5, None)
+
+    quality = rng.beta(8 - np.minimum(tool_index, 5), 2)
+    coverage = rng.beta(6, 3, size=rows)
+    kind = rng.integers(0, 3, size=rows)
+    metrics = [
+        "" if k == 0 else
+        f'{{"code_quality_score": {q:.3f}}}' if k == 1 else
+        f'{{"functionality_score": {q:.3f}, "test_coverage": {c:.3f}}}'
+        for k, q, c in zip(kind, quality, coverage)
+    ]
+
+    return pd.DataFrame({
+        "id": [f"result_{i}" for i in range(rows)],
+        "tool": tools,
+        "language": languages,
+        "category": rng.choice(profile.categories, size=rows),
+        "complexity_level": complexity,
+        "response": responses,
+        "execution_time": execution_time,
+        "response_time": execution_time * rng.uniform(0.6, 1.0, size=rows),
+        "success": success.astype(int),
+        "error_message": np.where(success, None, "timeout"),
+        "metrics": metrics,
+    })
+
+def write_synthetic_results_db(db_path: Path, rows: int, seed: int = 42, chunk_size: int = 100_000,
+                               profile: SyntheticProfile = SyntheticProfile()):
+    """Create a results.db with an evaluation_results table of synthetic rows
+
+    Rows are generated and inserted chunk by chunk, so memory stays flat up to
+    tens of millions of rows. With profile.days > 0 the row timestamps are
+    spread uniformly over that many past days instead of all being the insert
+    time.
+    """
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS evaluation_results (
+            id TEXT PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            language TEXT NOT NULL,
+            category TEXT NOT NULL,
+            complexity_level INTEGER NOT NULL,
+            prompt TEXT NOT NULL,
+            response TEXT NOT NULL,
+            execution_time REAL NOT NULL,
+            response_time REAL NOT NULL,
+            memory_usage REAL,
+            success BOOLEAN NOT NULL,
+            error_message TEXT,
+            metrics TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            workflow_id TEXT,
+            version TEXT DEFAULT '1.0'
+        )
+    ''')
+
+    for offset in range(0, rows, chunk_size):
+        df = synthetic_evaluation_frame(min(chunk_size, rows - offset), seed + offset, profile)
+        df['id'] = [f"result_{offset + i}" for i in range(len(df))]
+        df['task_id'] = df['id']
+        df['prompt'] = "synthetic prompt"
+        if profile.days:
+            rng = np.random.default_rng(seed + offset + 1)
+            age = pd.to_timedelta(rng.uniform(0, profile.days * 86400, size=len(df)), unit='s')
+            df['timestamp'] = (pd.Timestamp.now('UTC').tz_localize(None) - age).strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            df['timestamp'] = None
+        conn.executemany('''
+            INSERT INTO evaluation_results
+            (id, task_id, tool, language, category, complexity_level, prompt, response,
+             execution_time, response_time, success, error_message, metrics, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+        ''', df[['id', 'task_id', 'tool', 'language', 'category', 'complexity_level', 'prompt',
+                   'response', 'execution_time', 'response_time', 'success', 'error_message', 'metrics',
+                   'timestamp']]
+               .astype(object).itertuples(index=False, name=None))
+        conn.commit()
+
+    conn.close()
+
+def time_call(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+def benchmark_scoring(sizes: List[int], rowwise_limit: int) -> List[Dict]:
+    """Compare the per-row scoring functions with the columnar scorer"""
+
+    module = load_engine_module()
+
+    with tempfile.TemporaryDirectory() as eval_root:
+        (Path(eval_root) / "databases").mkdir()
+        engine = module.ScoringAnalyticsEngine(eval_root)
+        scorer = module.VectorizedScorer(engine.scoring_config)
+
+        def score_rowwise(df: pd.DataFrame):
+            for _, row in df.iterrows():
+                metrics = json.loads(row['metrics']) if row['metrics'] else {}
+                engine.calculate_code_quality_score(row, metrics)
+                engine.calculate_functionality_score(row, metrics)
+                engine.calculate_performance_score(row, metrics)
+                engine.calculate_maintainability_score(row, metrics)
+                engine.calculate_innovation_score(row, metrics)
+                engine.calculate_confidence_level(row, metrics)
+
+        def score_vectorized(df: pd.DataFrame):
+            features, valid = scorer.extract_features(df)
+            scorer.score_frame(features[valid])
+
+        results = []
+        for rows in sizes:
+            df = synthetic_evaluation_frame(rows)
+            vectorized = time_call(score_vectorized, df)
+            rowwise: Optional[float] = None
+            if rows <= rowwise_limit:
+                rowwise = time_call(score_rowwise, df)
+
+            results.append({
+                "scenario": "scoring",
+                "rows": rows,
+                "vectorized_seconds": round(vectorized, 4),
+                "rowwise_seconds": round(rowwise, 4) if rowwise is not None else None,
+                "speedup": round(rowwise / vectorized, 1) if rowwise is not None else None,
+            })
+
+        return results
+
+def benchmark_workers(rows: int, worker_counts: List[int], chunk_size: int) -> List[Dict]:
+    """Time a full rescore from stored features of a synthetic results.db for each worker count"""
+
+    module = load_engine_module()
+
+    with tempfile.TemporaryDirectory() as eval_root:
+        write_synthetic_results_db(Path(eval_root) / "databases" / "results.db", rows)
+        engine = module.ScoringAnalyticsEngine(eval_root)
+        extraction = time_call(engine.refresh_scoring_features, chunk_size)
+
+        results = []
+        baseline: Optional[float] = None
+        for workers in worker_counts:
+            elapsed = time_call(engine.score_evaluation_results, full_rescore=True,
+                                chunk_size=chunk_size, workers=workers)
+            baseline = baseline or elapsed
+            results.append({
+                "scenario": "workers",
+                "rows": rows,
+                "workers": workers,
+                "cpu_count": os.cpu_count(),
+                "feature_extraction_seconds": round(extraction, 4),
+                "seconds": round(elapsed, 4),
+                "speedup": round(baseline / elapsed, 2),
+            })
+
+        return results
+
+def benchmark_bootstrap(sizes: List[int], n_resamples: int, method: str = "exact",
+                        dimensions: int = 6) -> List[Dict]:
+    """Time bootstrap confidence intervals for one tool pair at each sample size"""
+
+    module = load_engine_module()
+    bootstrap = module.BootstrapEngine(n_resamples=n_resamples, method=method)
+    rng = np.random.default_rng(42)
+
+    results = []
+    for rows in sizes:
+        scores_a = rng.beta(8, 2, size=(rows, dimensions))
+        scores_b = rng.beta(7, 2, size=(rows, dimensions))
+
+        def compare_pair():
+            bootstrap.difference_intervals(bootstrap.resample_means("a", scores_a),
+                                           bootstrap.resample_means("b", scores_b))
+
+        results.append({
+            "scenario": "bootstrap",
+            "rows": rows,
+            "resamples": n_resamples,
+            "method": method,
+            "dimensions": dimensions,
+            "seconds_per_pair": round(time_call(compare_pair), 4),
+        })
+
+    return results
+
+# Read paths of the scripts sharing results.db, timed before and after the schema migrations
+BENCHMARK_QUERIES = {
+    "recent_results_join": '''
+        SELECT er.id, er.tool, er.execution_time, er.timestamp, sm.overall_score
+        FROM evaluation_results er
+        LEFT JOIN scoring_metrics sm ON er.id = sm.result_id
+        WHERE er.timestamp >= datetime('now', '-7 days')
+    ''',
+    "recent_success_count": '''
+        SELECT COUNT(*) FROM evaluation_results
+        WHERE success = 1 AND timestamp >= datetime('now', '-7 days')
+    ''',
+    "tool_category_summary": '''
+        SELECT tool, category, COUNT(*), AVG(overall_score)
+        FROM scoring_metrics GROUP BY tool, category
+    ''',
+}
+
+def benchmark_queries(rows: int, repeats: int, days: int = 90) -> List[Dict]:
+    """Time the shared results.db queries without and with the migration indexes"""
+
+    module = load_engine_module()
+    migrations = sys.modules["results_db_migrations"]
+
+    with tempfile.TemporaryDirectory() as eval_root:
+        write_synthetic_results_db(Path(eval_root) / "databases" / "results.db", rows,
+                                   profile=SyntheticProfile(days=days))
+        engine = module.ScoringAnalyticsEngine(eval_root)
+        engine.score_evaluation_results()
+
+        conn = sqlite3.connect(engine.db_path)
+
+        def measure() -> Dict[str, Dict]:
+            timings = {}
+            for name, query in BENCHMARK_QUERIES.items():
+                elapsed = min(time_call(lambda: conn.execute(query).fetchall()) for _ in range(repeats))
+                plan = "; ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+                timings[name] = {"seconds": elapsed, "plan": plan}
+            return timings
+
+        for migration in migrations.MIGRATIONS:
+            for statement in migration.statements:
+                index = statement.split("EXISTS ", 1)[1].split()[0]
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+        conn.execute("DELETE FROM schema_migrations")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+
+        before = measure()
+        migration_seconds = time_call(migrations.migrate_results_db, conn, "benchmark-analytics")
+        after = measure()
+        conn.close()
+
+        return [{
+            "scenario": "queries",
+            "rows": rows,
+            "query": name,
+            "migration_seconds": round(migration_seconds, 4),
+            "before_seconds": round(before[name]["seconds"], 4),
+            "after_seconds": round(after[name]["seconds"], 4),
+            "speedup": round(before[name]["seconds"] / max(after[name]["seconds"], 1e-9), 1),
+            "before_plan": before[name]["plan"],
+            "after_plan": after[name]["plan"],
+        } for name in BENCHMARK_QUERIES]
+
+def load_integration_module():
+    """Import performance-integration.py despite its hyphenated file name"""
+    module_name = "performance_integration"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / "performance-integration.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def benchmark_phases(rows: int, profile: SyntheticProfile, workers: int, chunk_size: int,
+                     seed: int = 42) -> List[Dict]:
+    """Time generation, every analytics phase and the integration extraction on one synthetic results.db
+
+    Phases run in pipeline order on a single engine, so later phases reuse the
+    score frame loaded by earlier ones just as a pipeline run would.
+    """
+
+    module = load_engine_module()
+
+    with tempfile.TemporaryDirectory() as eval_root:
+        db_path = Path(eval_root) / "databases" / "results.db"
+        timings = {"generate": time_call(write_synthetic_results_db, db_path, rows, seed, profile=profile)}
+
+        start = time.perf_counter()
+        engine = module.ScoringAnalyticsEngine(eval_root)
+        timings["engine_init"] = time.perf_counter() - start
+
+        phases = {
+            "scoring_metrics": lambda: engine.score_evaluation_results(chunk_size=chunk_size, workers=workers),
+            "statistical_analysis": lambda: engine.perform_statistical_analysis(seed=seed),
+            "performance_insights": engine.generate_performance_insights,
+            "clustering": lambda: engine.cluster_tool_profiles(chunk_size=chunk_size, seed=seed),
+            "trends": engine.analyze_score_trends,
+            "visualizations": lambda: engine.create_comprehensive_visualizations(workers),
+            "executive_dashboard": engine.generate_executive_dashboard,
+            "retention": engine.apply_retention,
+        }
+        for name, run in phases.items():
+            timings[name] = time_call(run)
+        engine.score_frames.clear()
+
+        integration = load_integration_module().PerformanceIntegration(eval_root)
+        timings["integration_extract"] = time_call(asyncio.run, integration.extract_evaluation_metrics())
+
+        db_megabytes = db_path.stat().st_size / 1e6
+
+    return [{
+        "scenario": "phases",
+        "rows": rows,
+        "phase": name,
+        "workers": workers,
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds) if seconds else None,
+        "db_megabytes": round(db_megabytes, 1),
+    } for name, seconds in timings.items()]
+
+# Fields identifying a measurement; a baseline and a new run are matched on these
+RESULT_KEY_FIELDS = ("scenario", "rows", "phase", "query", "workers", "resamples", "dimensions")
+
+def result_key(result: Dict) -> Tuple:
+    return tuple((field, result[field]) for field in RESULT_KEY_FIELDS if field in result)
+
+def compare_results(current: List[Dict], baseline: List[Dict], threshold: float,
+                    min_seconds: float = 0.05) -> List[Dict]:
+    """Compare every timing field with the matching baseline measurement.
+
+    A timing regresses when it is more than `threshold` (a fraction) slower
+    than the baseline and by more than `min_seconds`, which keeps noise on
+    very short timings from failing a comparison.
+    """
+
+    baseline_by_key = {result_key(result): result for result in baseline}
+    comparisons = []
+    for result in current:
+        previous = baseline_by_key.get(result_key(result))
+        if previous is None:
+            continue
+        for field, value in result.items():
+            if not field.endswith("seconds"):
+                continue
+            before = previous.get(field)
+            if not isinstance(before, (int, float)) or not isinstance(value, (int, float)):
+                continue
+            change = (value - before) / before if before else 0.0
+            comparisons.append({
+                **dict(result_key(result)),
+                "field": field,
+                "baseline": before,
+                "current": value,
+                "change": round(change, 3),
+                "regression": change > threshold and value - before > min_seconds,
+            })
+
+    return comparisons
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Suite for the Scoring and Analytics Engine')
+    parser.add_argument('--scenario', choices=['scoring', 'workers', 'bootstrap', 'queries', 'phases', 'generate'],
+                       default='scoring', help='Benchmark scenario to run, or generate a synthetic results.db')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                       help='Row counts to benchmark')
+    parser.add_argument('--rowwise-limit', type=int, default=100_000,
+                       help='Largest size for which the slow per-row path is also timed')
+    parser.add_argument('--workers', type=int, nargs='+',
+                       help='Worker counts for the workers scenario (default: powers of two up to the core count)')
+    parser.add_argument('--chunk-size', type=int, default=50_000,
+                       help='Rows per scoring chunk or shard')
+    parser.add_argument('--resamples', type=int, default=10_000,
+                       help='Resamples for the bootstrap scenario')
+    parser.add_argument('--bootstrap-method', choices=['exact', 'stratified'], default='exact',
+                       help='Bootstrap method for the bootstrap scenario')
+    parser.add_argument('--repeats', type=int, default=5,
+                       help='Runs per query for the queries scenario (best time is reported)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic data')
+    
+    synthetic = parser.add_argument_group('synthetic data (generate and phases scenarios)')
+    synthetic.add_argument('--db', help='results.db to write in the generate scenario (first of --sizes rows)')
+    synthetic.add_argument('--tools', nargs='+', default=list(TOOLS), help='Tools to simulate')
+    synthetic.add_argument('--languages', nargs='+', default=list(LANGUAGES), help='Languages to simulate')
+    synthetic.add_argument('--categories', nargs='+', default=list(CATEGORIES), help='Task categories to simulate')
+    synthetic.add_argument('--response-median', type=int, default=1100, help='Median response length in characters')
+    synthetic.add_argument('--response-sigma', type=float, default=0.8, help='Log-normal spread of response lengths')
+    synthetic.add_argument('--response-variants', type=int, default=50,
+                          help='Distinct code snippets per language that responses are built from')
+    synthetic.add_argument('--days', type=int, default=30, help='Days the result timestamps are spread over')
+    
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                       help='Compare the results with a JSON file written by --output and fail on regressions')
+    parser.add_argument('--current', help='Compare this results file instead of running a scenario')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                       help='Slowdown, as a fraction of the baseline, that counts as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                       help='Ignore slowdowns smaller than this many seconds')
+
+    args = parser.parse_args()
+
+    profile = SyntheticProfile(tuple(args.tools), tuple(args.languages), tuple(args.categories),
+                               args.response_median, args.response_sigma, args.response_variants, args.days)
+
+    if args.current:
+        with open(args.current) as f:
+            results = json.load(f)
+    elif args.scenario == 'generate':
+        if not args.db:
+            parser.error('--db is required for the generate scenario')
+        rows = args.sizes[0]
+        seconds = time_call(write_synthetic_results_db, Path(args.db), rows, args.seed, profile=profile)
+        results = [{"scenario": "generate", "rows": rows, "seconds": round(seconds, 4),
+                    "db_megabytes": round(Path(args.db).stat().st_size / 1e6, 1)}]
+    elif args.scenario == 'scoring':
+        results = benchmark_scoring(args.sizes, args.rowwise_limit)
+    elif args.scenario == 'workers':
+        worker_counts = args.workers or [2 ** i for i in range((os.cpu_count() or 1).bit_length())]
+        results = []
+        for rows in args.sizes:
+            results.extend(benchmark_workers(rows, worker_counts, args.chunk_size))
+    elif args.scenario == 'bootstrap':
+        results = benchmark_bootstrap(args.sizes, args.resamples, args.bootstrap_method)
+    elif args.scenario == 'queries':
+        results = []
+        for rows in args.sizes:
+            results.extend(benchmark_queries(rows, args.repeats))
+    elif args.scenario == 'phases':
+        results = []
+        for rows in args.sizes:
+            for workers in args.workers or [1]:
+                results.extend(benchmark_phases(rows, profile, workers, args.chunk_size, args.seed))
+
+    if not args.current:
+        for result in results:
+            print(json.dumps(result))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        comparisons = compare_results(results, baseline, args.threshold, args.min_seconds)
+        for comparison in comparisons:
+            marker = "❌" if comparison["regression"] else "✅"
+            label = " ".join(f"{field}={comparison[field]}" for field in RESULT_KEY_FIELDS if field in comparison)
+            print(f"{marker} {label} {comparison['field']}: {comparison['baseline']} -> {comparison['current']} "
+                  f"({comparison['change']:+.1%})")
+        regressions = [comparison for comparison in comparisons if comparison["regression"]]
+        print(f"{len(regressions)} regressions in {len(comparisons)} comparisons "
+              f"(threshold {args.threshold:.0%}, min {args.min_seconds}s)")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
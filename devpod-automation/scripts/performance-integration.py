@@ -15,6 +15,11 @@ from datetime import datetime, timedelta
 import argparse
 import logging
 import asyncio
+import sys
+
+# Shared schema migrations live next to the scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from results_db_migrations import migrate_results_db
 
 @dataclass
 class PerformanceMetric:
@@ -120,6 +125,12 @@ class PerformanceIntegration:
         ''')
         
         conn.commit()
+        
+        # Versioned indexes shared with the other results.db scripts
+        applied = migrate_results_db(conn, "performance-integration")
+        if applied:
+            self.logger.info(f"🗄️ Applied results.db schema migrations {applied}")
+        
         conn.close()
 
     async def extract_evaluation_metrics(self) -> List[PerformanceMetric]:
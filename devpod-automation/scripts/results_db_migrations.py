@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Schema Migrations for the Agentic Evaluation results.db
+Versioned schema changes shared by the devpod-automation scripts
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+import argparse
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change, applied once per database in version order"""
+    version: int
+    name: str
+    table: str
+    statements: Tuple[str, ...]
+
+# Append only: never edit or reorder a released migration, add a new version instead.
+# The unique scoring_metrics(result_id) index is created by the scoring engine
+# itself, because older databases need their duplicate scores collapsed first.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "evaluation_results_time_indexes", "evaluation_results", (
+        "CREATE INDEX IF NOT EXISTS idx_evaluation_results_success_timestamp "
+        "ON evaluation_results (success, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_evaluation_results_timestamp ON evaluation_results (timestamp)",
+    )),
+    Migration(2, "scoring_metrics_tool_category_index", "scoring_metrics", (
+        "CREATE INDEX IF NOT EXISTS idx_scoring_metrics_tool_category "
+        "ON scoring_metrics (tool, category, overall_score)",
+    )),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Highest migration applied to the database, kept in PRAGMA user_version"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+def migrate_results_db(conn: sqlite3.Connection, applied_by: str = "") -> List[int]:
+    """Apply pending migrations in version order and return the versions applied.
+
+    Each migration runs in its own IMMEDIATE transaction that re-checks the
+    version, so scripts migrating the same database concurrently apply it
+    once. Migrating stops at the first migration whose table does not exist
+    yet; the script that creates the table applies it on its next start.
+    """
+
+    conn.commit()
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_by TEXT,
+            duration_seconds REAL,
+            applied_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= schema_version(conn):
+            continue
+        if not table_exists(conn, migration.table):
+            break
+
+        start = time.perf_counter()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if migration.version <= schema_version(conn):
+                conn.rollback()
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute(f"ANALYZE {migration.table}")
+            conn.execute('''
+                INSERT OR REPLACE INTO schema_migrations (version, name, applied_by, duration_seconds)
+                VALUES (?, ?, ?, ?)
+            ''', (migration.version, migration.name, applied_by, time.perf_counter() - start))
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(migration.version)
+
+    return applied
+
+def main():
+    parser = argparse.ArgumentParser(description='Schema Migrations for the Agentic Evaluation results.db')
+    parser.add_argument('--db', default='/workspace/agentic-eval/databases/results.db',
+                       help='Path to results.db')
+    parser.add_argument('--status', action='store_true', help='Only show the schema version and pending migrations')
+
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db, timeout=60)
+    try:
+        if not args.status:
+            applied = migrate_results_db(conn, "results_db_migrations")
+            print(f"✅ Applied migrations: {applied or 'none'}")
+        version = schema_version(conn)
+        pending = [f"{m.version} ({m.name})" for m in MIGRATIONS if m.version > version]
+        print(f"📦 Schema version {version} of {LATEST_VERSION}; pending: {', '.join(pending) or 'none'}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
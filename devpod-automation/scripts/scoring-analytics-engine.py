@@ -4,25 +4,126 @@ Scoring and Analytics Engine for Agentic Evaluation Framework
 Advanced scoring algorithms and comprehensive analytics for tool comparison
 """
 
+import cProfile
+import hashlib
 import json
+import multiprocessing
+import pstats
+import re
 import sqlite3
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 import argparse
 import logging
-from scipy import stats
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared schema migrations live next to the scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from results_db_migrations import migrate_results_db
+
+# Scoring factor tables shared by the per-row and columnar scoring paths
+LANGUAGE_QUALITY_FACTORS = {
+    "python": 1.0,
+    "typescript": 0.95,
+    "rust": 1.05,
+    "go": 0.98,
+    "nushell": 0.92
+}
+
+CATEGORY_FUNCTIONALITY_WEIGHTS = {
+    "ui-components": 1.0,
+    "apis": 1.05,
+    "cli-tools": 0.95,
+    "web-apps": 1.02,
+    "data-processing": 0.98
+}
+
+TOOL_PERFORMANCE_FACTORS = {
+    "claude-code": 1.0,
+    "gemini-cli": 1.02  # Slight advantage for optimization
+}
+
+LANGUAGE_MAINTAINABILITY_FACTORS = {
+    "python": 0.95,
+    "typescript": 1.0,
+    "rust": 1.05,
+    "go": 1.02,
+    "nushell": 0.90
+}
+
+TOOL_INNOVATION_FACTORS = {
+    "claude-code": 1.05,  # Slight advantage for creative solutions
+    "gemini-cli": 1.0
+}
+
+CATEGORY_INNOVATION_FACTORS = {
+    "ui-components": 1.1,
+    "apis": 0.9,
+    "cli-tools": 0.95,
+    "web-apps": 1.05,
+    "data-processing": 0.85
+}
+
+# Keys of the optional "factors" config section, which overrides entries of the tables
+FACTOR_TABLES = {
+    "language_quality": LANGUAGE_QUALITY_FACTORS,
+    "category_functionality": CATEGORY_FUNCTIONALITY_WEIGHTS,
+    "tool_performance": TOOL_PERFORMANCE_FACTORS,
+    "language_maintainability": LANGUAGE_MAINTAINABILITY_FACTORS,
+    "tool_innovation": TOOL_INNOVATION_FACTORS,
+    "category_innovation": CATEGORY_INNOVATION_FACTORS
+}
+
+SCORE_DIMENSIONS = ['code_quality_score', 'functionality_score', 'performance_score',
+                    'maintainability_score', 'innovation_score']
+
+# History tables with one current row per key: key columns and timestamp column
+ANALYTICS_HISTORY_TABLES = {
+    'comparative_analysis': (['tool_a', 'tool_b'], 'analysis_timestamp'),
+    'performance_insights': (['tool', 'insight_type'], 'generated_timestamp'),
+}
+
+DEFAULT_RETENTION = {
+    "mode": "latest",
+    "keep_latest": 30,
+    "daily_days": 90,
+    "vacuum_free_fraction": 0.25
+}
+
+DEFAULT_TRENDS = {
+    "days": 30,
+    "granularity": "day",
+    "window": 7,
+    "ewma_alpha": 0.3,
+    "change_threshold": 3.0
+}
+
+# Rendering of the analytics figure: "raw" plots every row, "aggregate" plots
+# binned summaries, "auto" aggregates above aggregate_above scored rows
+DEFAULT_VISUALIZATION = {
+    "mode": "auto",
+    "aggregate_above": 20000,
+    "bins": 40
+}
+
+VISUALIZATION_MODES = ["auto", "raw", "aggregate"]
+
+# Dimensions whose per-tool sufficient statistics are kept in scoring_statistics
+STATISTICS_DIMENSIONS = SCORE_DIMENSIONS + ['overall_score']
+
 @dataclass
 class ScoringMetrics:
     """Comprehensive scoring metrics for evaluation results"""
@@ -48,6 +149,20 @@ class ComparativeAnalysis:
     p_value: float
     effect_size: float
     recommendation: str
+    confidence_intervals: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+@dataclass
+class OmnibusAnalysis:
+    """Omnibus comparison of all tools with pairwise matrices ordered like `tools`"""
+    test: str
+    dimension: str
+    tools: List[str]
+    statistic: float
+    p_value: float
+    effect_size: float
+    significant: bool
+    effect_size_matrix: List[List[float]]
+    pairwise_p_values: List[List[float]]
 
 @dataclass
 class PerformanceInsights:
@@ -59,6 +174,1883 @@ class PerformanceInsights:
     performance_trends: Dict[str, float]
     predictive_score: float
 
+def scoring_factor_tables(scoring_config: Dict) -> Dict[str, Dict[str, float]]:
+    """The factor tables with the overrides of the config's "factors" section applied"""
+
+    factors = scoring_config.get("factors", {})
+    return {name: {**table, **factors.get(name, {})} for name, table in FACTOR_TABLES.items()}
+
+class VectorizedScorer:
+    """Columnar scoring over whole DataFrames.
+
+    Mirrors the per-row calculate_*_score functions of ScoringAnalyticsEngine
+    operation for operation, so both paths produce identical numbers.
+    """
+
+    METRIC_DEFAULTS = {
+        "code_quality_score": 0.7,
+        "functionality_score": 0.8,
+        "test_coverage": 0.8
+    }
+
+    def __init__(self, scoring_config: Dict):
+        self.weights = scoring_config["weights"]
+
+        factors = scoring_factor_tables(scoring_config)
+        self.language_quality = factors["language_quality"]
+        self.category_functionality = factors["category_functionality"]
+        self.tool_performance = factors["tool_performance"]
+        self.language_maintainability = factors["language_maintainability"]
+        self.tool_innovation = factors["tool_innovation"]
+        self.category_innovation = factors["category_innovation"]
+
+    @classmethod
+    def extract_features(cls, df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """Derive scoring inputs from raw evaluation_results rows.
+
+        Returns the feature frame and a boolean mask of rows whose metrics JSON
+        could be parsed; invalid rows are skipped just like the per-row path.
+        """
+
+        features = df[['id', 'tool', 'language', 'category', 'complexity_level',
+                       'response_time', 'execution_time', 'success']].copy()
+        features['response_length'] = df['response'].str.len()
+
+        valid = np.ones(len(df), dtype=bool)
+        metric_values = {key: np.full(len(df), np.nan) for key in cls.METRIC_DEFAULTS}
+
+        for i, raw_metrics in enumerate(df['metrics'].values):
+            try:
+                metrics = json.loads(raw_metrics) if isinstance(raw_metrics, str) and raw_metrics else {}
+                for key, values in metric_values.items():
+                    value = metrics.get(key)
+                    if value is not None:
+                        values[i] = float(value)
+            except (TypeError, ValueError, AttributeError):
+                valid[i] = False
+
+        for key, values in metric_values.items():
+            features[f"metric_{key}"] = values
+
+        code_metrics = [analyze_response(response, language)
+                        for response, language in zip(df['response'].values, df['language'].values)]
+        features['code_structure_score'] = [metrics.structure_score for metrics in code_metrics]
+        features['code_innovation_base'] = [metrics.innovation_base for metrics in code_metrics]
+
+        return features, valid
+
+    @staticmethod
+    def _factor(column: pd.Series, factors: Dict[str, float]) -> np.ndarray:
+        return column.map(factors).fillna(1.0).to_numpy(dtype=np.float64)
+
+    def _metric(self, features: pd.DataFrame, key: str) -> np.ndarray:
+        values = pd.to_numeric(features[f"metric_{key}"]).to_numpy(dtype=np.float64)
+        return np.where(np.isnan(values), self.METRIC_DEFAULTS[key], values)
+
+    @staticmethod
+    def _code_metric(features: pd.DataFrame, column: str, default: float) -> np.ndarray:
+        if column not in features.columns:
+            return np.full(len(features), default)
+        values = pd.to_numeric(features[column]).to_numpy(dtype=np.float64)
+        return np.where(np.isnan(values), default, values)
+
+    def score_frame(self, features: pd.DataFrame) -> pd.DataFrame:
+        """Calculate all score dimensions, overall score and confidence as columns"""
+
+        complexity = features['complexity_level'].to_numpy(dtype=np.float64)
+        response_length = features['response_length'].to_numpy(dtype=np.float64)
+        response_time = features['response_time'].to_numpy(dtype=np.float64)
+        success = features['success'].to_numpy(dtype=bool)
+
+        # Code quality
+        complexity_bonus = np.minimum(complexity * 0.05, 0.15)
+        length_factor = np.minimum(response_length / 1000, 1.0) * 0.1
+        code_quality = (self._metric(features, "code_quality_score") + complexity_bonus + length_factor) * \
+            self._factor(features['language'], self.language_quality)
+
+        # Functionality
+        functionality = self._metric(features, "functionality_score") * \
+            self._factor(features['category'], self.category_functionality) * \
+            np.where(success, 1.0, 0.0)
+
+        # Performance
+        time_score = np.maximum(0, 1 - (response_time / 60)) + complexity * 0.05
+        performance = time_score * self._factor(features['tool'], self.tool_performance)
+
+        # Maintainability
+        doc_score = np.minimum(response_length / 2000, 1.0) * 0.3 + 0.7
+        structure_score = self._code_metric(features, 'code_structure_score', DEFAULT_STRUCTURE_SCORE)
+        maintainability = (self._metric(features, "test_coverage") * 0.4 + doc_score * 0.3 + structure_score * 0.3) * \
+            self._factor(features['language'], self.language_maintainability)
+
+        # Innovation
+        base_innovation = self._code_metric(features, 'code_innovation_base', DEFAULT_INNOVATION_BASE)
+        innovation = (base_innovation + complexity * 0.08) * \
+            self._factor(features['tool'], self.tool_innovation) * \
+            self._factor(features['category'], self.category_innovation)
+
+        scores = pd.DataFrame({
+            'code_quality_score': np.clip(code_quality, 0.0, 1.0),
+            'functionality_score': np.clip(functionality, 0.0, 1.0),
+            'performance_score': np.clip(performance, 0.0, 1.0),
+            'maintainability_score': np.clip(maintainability, 0.0, 1.0),
+            'innovation_score': np.clip(innovation, 0.0, 1.0)
+        }, index=features.index)
+
+        weights = self.weights
+        scores['overall_score'] = (
+            scores['code_quality_score'] * weights["code_quality"] +
+            scores['functionality_score'] * weights["functionality"] +
+            scores['performance_score'] * weights["performance"] +
+            scores['maintainability_score'] * weights["maintainability"] +
+            scores['innovation_score'] * weights["innovation"]
+        )
+
+        # Confidence level
+        confidence = 0.8 + length_factor - complexity * 0.02 + np.where(success, 0.1, -0.2)
+        scores['confidence_level'] = np.clip(confidence, 0.0, 1.0)
+
+        return scores
+
+@dataclass
+class RunningStatistics:
+    """Sufficient statistics of a score: count, mean and sum of squared deviations"""
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "RunningStatistics":
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        return cls(len(values), mean, float(((values - mean) ** 2).sum()))
+
+    def merge(self, other: "RunningStatistics") -> "RunningStatistics":
+        """Combine two summaries with the parallel (Chan) form of Welford's update"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        return RunningStatistics(
+            n=n,
+            mean=self.mean + delta * other.n / n,
+            m2=self.m2 + other.m2 + delta * delta * self.n * other.n / n
+        )
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)"""
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float('nan')
+
+def summarize_scores(df: pd.DataFrame) -> Dict[str, Dict[str, RunningStatistics]]:
+    """Sufficient statistics per tool and score dimension for a scores DataFrame"""
+
+    summary = {}
+    for tool, tool_data in df.groupby('tool', sort=False):
+        summary[tool] = {
+            dimension: RunningStatistics.from_values(tool_data[dimension].to_numpy(dtype=np.float64))
+            for dimension in STATISTICS_DIMENSIONS if dimension in tool_data.columns
+        }
+    return summary
+
+def load_scoring_statistics(conn: sqlite3.Connection) -> Dict[str, Dict[str, RunningStatistics]]:
+    """Read the persisted per-tool sufficient statistics"""
+
+    statistics: Dict[str, Dict[str, RunningStatistics]] = {}
+    for tool, dimension, n, mean, m2 in conn.execute(
+            "SELECT tool, dimension, n, mean, m2 FROM scoring_statistics ORDER BY tool"):
+        statistics.setdefault(tool, {})[dimension] = RunningStatistics(n, mean, m2)
+    return statistics
+
+def merge_scoring_statistics(conn: sqlite3.Connection, batch: pd.DataFrame):
+    """Fold a batch of newly written scores into scoring_statistics"""
+
+    statistics = load_scoring_statistics(conn)
+    rows = []
+    for tool, dimensions in summarize_scores(batch).items():
+        for dimension, batch_statistics in dimensions.items():
+            merged = statistics.get(tool, {}).get(dimension, RunningStatistics()).merge(batch_statistics)
+            rows.append((tool, dimension, merged.n, merged.mean, merged.m2))
+
+    conn.executemany('''
+        INSERT OR REPLACE INTO scoring_statistics (tool, dimension, n, mean, m2, updated_timestamp)
+        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', rows)
+
+def rebuild_scoring_statistics(conn: sqlite3.Connection, dimensions: List[str] = STATISTICS_DIMENSIONS):
+    """Recompute scoring_statistics from scoring_metrics with a two-pass scan"""
+
+    conn.execute("DELETE FROM scoring_statistics WHERE dimension IN (SELECT value FROM json_each(?))",
+                 (json.dumps(dimensions),))
+    for dimension in dimensions:
+        conn.execute(f'''
+            INSERT INTO scoring_statistics (tool, dimension, n, mean, m2)
+            SELECT s.tool, '{dimension}', COUNT(s.{dimension}), a.mean,
+                   TOTAL((s.{dimension} - a.mean) * (s.{dimension} - a.mean))
+            FROM scoring_metrics s
+            JOIN (SELECT tool, AVG({dimension}) AS mean FROM scoring_metrics GROUP BY tool) a
+                ON a.tool = s.tool
+            WHERE s.{dimension} IS NOT NULL
+            GROUP BY s.tool
+        ''')
+
+@dataclass
+class TDigest:
+    """Mergeable t-digest quantile sketch.
+
+    Centroids are compressed with the k1 scale function in one vectorized
+    pass: sorted centroids are grouped by the integer part of the scale
+    function at their left cumulative quantile, which keeps about
+    `compression / 2` centroids with small ones at the tails.
+    """
+    means: np.ndarray = field(default_factory=lambda: np.empty(0))
+    weights: np.ndarray = field(default_factory=lambda: np.empty(0))
+    min_value: float = float('inf')
+    max_value: float = float('-inf')
+    compression: float = 200.0
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, compression: float = 200.0) -> "TDigest":
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls(compression=compression)
+        return cls(values, np.ones(len(values)), float(values.min()), float(values.max()), compression)._compress()
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def _compress(self) -> "TDigest":
+        order = np.argsort(self.means, kind='stable')
+        means, weights = self.means[order], self.weights[order]
+        cumulative = np.cumsum(weights)
+        q_left = (cumulative - weights) / cumulative[-1]
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        bucket = np.floor(scale - scale[0])
+        starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+
+        merged_weights = np.add.reduceat(weights, starts)
+        merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+        return TDigest(merged_means, merged_weights, self.min_value, self.max_value, self.compression)
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        return TDigest(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]),
+                       min(self.min_value, other.min_value), max(self.max_value, other.max_value),
+                       max(self.compression, other.compression))._compress()
+
+    def quantile(self, q):
+        """Interpolated quantile(s) for q in [0, 1]"""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else float('nan')
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [self.count]])
+        values = np.concatenate([[self.min_value], self.means, [self.max_value]])
+        result = np.interp(np.asarray(q) * self.count, positions, values)
+        return float(result) if np.ndim(q) == 0 else result
+
+    def to_blob(self) -> bytes:
+        return np.stack([self.means, self.weights]).astype(np.float64).tobytes()
+
+    @classmethod
+    def from_row(cls, blob: bytes, min_value: float, max_value: float, compression: float) -> "TDigest":
+        means, weights = np.frombuffer(blob, dtype=np.float64).reshape(2, -1)
+        return cls(means.copy(), weights.copy(), min_value, max_value, compression)
+
+def summarize_sketches(batch: pd.DataFrame) -> Dict[Tuple[str, str], TDigest]:
+    """A t-digest per tool and score dimension for a scores DataFrame"""
+
+    return {
+        (tool, dimension): TDigest.from_values(tool_data[dimension].to_numpy(dtype=np.float64))
+        for tool, tool_data in batch.groupby('tool', sort=False)
+        for dimension in STATISTICS_DIMENSIONS if dimension in tool_data.columns
+    }
+
+def load_scoring_sketches(conn: sqlite3.Connection) -> Dict[Tuple[str, str], TDigest]:
+    """Read the persisted per-tool quantile sketches"""
+
+    return {
+        (tool, dimension): TDigest.from_row(centroids, min_value, max_value, compression)
+        for tool, dimension, centroids, min_value, max_value, compression in conn.execute('''
+            SELECT tool, dimension, centroids, min_value, max_value, compression
+            FROM scoring_sketches ORDER BY tool
+        ''')
+    }
+
+def store_scoring_sketches(conn: sqlite3.Connection, sketches: Dict[Tuple[str, str], TDigest]):
+    conn.executemany('''
+        INSERT OR REPLACE INTO scoring_sketches
+        (tool, dimension, count, min_value, max_value, compression, centroids, updated_timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', [
+        (tool, dimension, sketch.count, sketch.min_value, sketch.max_value, sketch.compression, sketch.to_blob())
+        for (tool, dimension), sketch in sketches.items() if sketch.count > 0
+    ])
+
+def merge_scoring_sketches(conn: sqlite3.Connection, batch: pd.DataFrame):
+    """Fold a batch of newly written scores into scoring_sketches"""
+
+    existing = load_scoring_sketches(conn)
+    store_scoring_sketches(conn, {
+        key: existing.get(key, TDigest()).merge(sketch) for key, sketch in summarize_sketches(batch).items()
+    })
+
+def rebuild_scoring_sketches(conn: sqlite3.Connection, chunk_size: int = 200000,
+                             dimensions: List[str] = STATISTICS_DIMENSIONS):
+    """Recompute scoring_sketches from scoring_metrics in chunks"""
+
+    sketches: Dict[Tuple[str, str], TDigest] = {}
+    query = f"SELECT tool, {', '.join(dimensions)} FROM scoring_metrics"
+    for chunk in pd.read_sql_query(query, conn, chunksize=chunk_size):
+        for key, sketch in summarize_sketches(chunk).items():
+            sketches[key] = sketches.get(key, TDigest()).merge(sketch)
+
+    conn.execute("DELETE FROM scoring_sketches WHERE dimension IN (SELECT value FROM json_each(?))",
+                 (json.dumps(dimensions),))
+    store_scoring_sketches(conn, sketches)
+
+def pairwise_cohens_d(n: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> np.ndarray:
+    """Cohen's d of every row tool against every column tool, with pooled standard deviation"""
+
+    pooled_std = np.sqrt((m2[:, None] + m2[None, :]) / (n[:, None] + n[None, :] - 2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        effect_sizes = (mean[:, None] - mean[None, :]) / pooled_std
+    return np.where(pooled_std > 0, effect_sizes, 0.0)
+
+def anova_from_statistics(n: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> Tuple[float, float, float, np.ndarray]:
+    """One-way ANOVA and pooled pairwise t-tests from per-group sufficient statistics.
+
+    Returns F, its p-value, eta squared and the matrix of pairwise p-values.
+    """
+    from scipy import stats
+
+    total = n.sum()
+    groups = len(n)
+    grand_mean = (n * mean).sum() / total
+    between = (n * (mean - grand_mean) ** 2).sum()
+    within = m2.sum()
+
+    f_statistic = (between / (groups - 1)) / (within / (total - groups))
+    p_value = float(stats.f.sf(f_statistic, groups - 1, total - groups))
+    eta_squared = between / (between + within)
+
+    pooled_variance = (m2[:, None] + m2[None, :]) / (n[:, None] + n[None, :] - 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (mean[:, None] - mean[None, :]) / np.sqrt(pooled_variance * (1 / n[:, None] + 1 / n[None, :]))
+    pairwise_p = 2 * stats.t.sf(np.abs(t), n[:, None] + n[None, :] - 2)
+    return float(f_statistic), p_value, float(eta_squared), np.nan_to_num(pairwise_p, nan=1.0)
+
+def kruskal_wallis(group_codes: np.ndarray, values: np.ndarray, groups: int) -> Tuple[float, float, float, np.ndarray]:
+    """Kruskal-Wallis H test and Dunn's pairwise z-tests from one ranking of all values.
+
+    Returns H (tie corrected), its p-value, epsilon squared and the matrix of
+    pairwise Dunn p-values.
+    """
+    from scipy import stats
+
+    total = len(values)
+    ranks = stats.rankdata(values)
+    counts = np.bincount(group_codes, minlength=groups).astype(np.float64)
+    mean_ranks = np.bincount(group_codes, weights=ranks, minlength=groups) / counts
+
+    _, tie_counts = np.unique(values, return_counts=True)
+    tie_correction = 1 - (tie_counts ** 3 - tie_counts).sum() / (total ** 3 - total)
+
+    h_statistic = (12 / (total * (total + 1)) * (counts * mean_ranks ** 2).sum() - 3 * (total + 1)) / tie_correction
+    p_value = float(stats.chi2.sf(h_statistic, groups - 1))
+    epsilon_squared = h_statistic / (total - 1)
+
+    rank_variance = total * (total + 1) / 12 * tie_correction
+    z = (mean_ranks[:, None] - mean_ranks[None, :]) / np.sqrt(rank_variance * (1 / counts[:, None] + 1 / counts[None, :]))
+    pairwise_p = 2 * stats.norm.sf(np.abs(z))
+    return float(h_statistic), p_value, float(epsilon_squared), pairwise_p
+
+def add_missing_column(conn: sqlite3.Connection, table: str, column: str, definition: str) -> bool:
+    """ALTER TABLE ADD COLUMN unless the column exists; returns whether it was added"""
+
+    if column in {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}:
+        return False
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return True
+
+ROLLUP_KEYS = ['tool', 'language', 'category', 'complexity_level']
+
+def summarize_rollups(batch: pd.DataFrame) -> pd.DataFrame:
+    """Count, sum, sum of squares, min and max per rollup key and score dimension"""
+
+    long = batch.melt(id_vars=ROLLUP_KEYS, value_vars=STATISTICS_DIMENSIONS,
+                      var_name='dimension', value_name='value').dropna(subset=['value'])
+    long['value_sq'] = long['value'] ** 2
+    grouped = long.groupby(ROLLUP_KEYS + ['dimension'], sort=False)
+    return pd.DataFrame({
+        'n': grouped['value'].count(),
+        'total': grouped['value'].sum(),
+        'total_sq': grouped['value_sq'].sum(),
+        'min_value': grouped['value'].min(),
+        'max_value': grouped['value'].max(),
+    }).reset_index()
+
+def merge_scoring_rollups(conn: sqlite3.Connection, batch: pd.DataFrame):
+    """Fold a batch of newly written scores into scoring_rollups"""
+
+    rollups = summarize_rollups(batch)
+    rollups['complexity_level'] = rollups['complexity_level'].astype(int)
+    conn.executemany('''
+        INSERT INTO scoring_rollups
+        (tool, language, category, complexity_level, dimension, n, total, total_sq, min_value, max_value)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(tool, language, category, complexity_level, dimension) DO UPDATE SET
+            n = n + excluded.n,
+            total = total + excluded.total,
+            total_sq = total_sq + excluded.total_sq,
+            min_value = MIN(min_value, excluded.min_value),
+            max_value = MAX(max_value, excluded.max_value)
+    ''', rollups.astype(object).itertuples(index=False, name=None))
+
+def rebuild_scoring_rollups(conn: sqlite3.Connection, dimensions: List[str] = STATISTICS_DIMENSIONS):
+    """Recompute scoring_rollups from scoring_metrics"""
+
+    conn.execute("DELETE FROM scoring_rollups WHERE dimension IN (SELECT value FROM json_each(?))",
+                 (json.dumps(dimensions),))
+    for dimension in dimensions:
+        conn.execute(f'''
+            INSERT INTO scoring_rollups
+            (tool, language, category, complexity_level, dimension, n, total, total_sq, min_value, max_value)
+            SELECT tool, language, category, complexity_level, '{dimension}', COUNT({dimension}),
+                   TOTAL({dimension}), TOTAL({dimension} * {dimension}), MIN({dimension}), MAX({dimension})
+            FROM scoring_metrics
+            WHERE {dimension} IS NOT NULL
+            GROUP BY tool, language, category, complexity_level
+        ''')
+
+def load_scoring_rollups(conn: sqlite3.Connection, tool: Optional[str] = None) -> pd.DataFrame:
+    """Read the materialized rollups, optionally for a single tool"""
+
+    query = '''
+        SELECT tool, language, category, complexity_level, dimension, n, total, total_sq, min_value, max_value
+        FROM scoring_rollups
+    '''
+    if tool is not None:
+        return pd.read_sql_query(query + " WHERE tool = ? ORDER BY tool", conn, params=(tool,))
+    return pd.read_sql_query(query + " ORDER BY tool", conn)
+
+def rollup_moments(rollups: pd.DataFrame, by: List[str]) -> pd.DataFrame:
+    """Combine rollup cells into count, mean, sample std, min and max per group"""
+
+    grouped = rollups.groupby(by, sort=False).agg(
+        n=('n', 'sum'), total=('total', 'sum'), total_sq=('total_sq', 'sum'),
+        min_value=('min_value', 'min'), max_value=('max_value', 'max'))
+    grouped['mean'] = grouped['total'] / grouped['n']
+    variance = (grouped['total_sq'] - grouped['total'] * grouped['mean']) / (grouped['n'] - 1)
+    grouped['std'] = np.sqrt(variance.clip(lower=0).where(grouped['n'] > 1))
+    return grouped
+
+# Trend buckets: SQL template for the bucket start date of a timestamp, and days per bucket
+TREND_GRANULARITIES = {
+    "day": ("date({})", 1),
+    "week": ("date({}, 'weekday 0', '-6 days')", 7),
+}
+
+def score_trends(conn: sqlite3.Connection, since: datetime, granularity: str = "day", window: int = 7,
+                 dimension: str = "overall_score", alpha: float = 0.3, threshold: float = 3.0,
+                 min_samples: int = 10) -> pd.DataFrame:
+    """Per-tool score buckets since `since` with rolling mean, EWMA and change-point flags.
+
+    Bucketing, the rolling mean over the last `window` buckets and the moments
+    of the preceding window all run in SQLite window functions over the
+    scoring_timestamp index, so only one row per tool and bucket is returned.
+    A bucket is flagged as a change point when its mean differs from the
+    preceding window's by more than `threshold` standard errors.
+    """
+
+    if granularity not in TREND_GRANULARITIES:
+        raise ValueError(f"Unknown trend granularity: {granularity}")
+    bucket_template, bucket_days = TREND_GRANULARITIES[granularity]
+    bucket = bucket_template.format("scoring_timestamp")
+    span = (window - 1) * bucket_days
+
+    # Buckets before `since` are read only to warm up the first windows
+    warmup_start = since - timedelta(days=span + bucket_days)
+
+    trends = pd.read_sql_query(f'''
+        WITH buckets AS (
+            SELECT tool, {bucket} AS bucket, COUNT({dimension}) AS n, TOTAL({dimension}) AS total,
+                   TOTAL({dimension} * {dimension}) AS total_sq
+            FROM scoring_metrics
+            WHERE scoring_timestamp >= ? AND {dimension} IS NOT NULL
+            GROUP BY tool, bucket
+        ),
+        windows AS (
+            SELECT tool, bucket, n, total, total_sq,
+                   SUM(total) OVER rolling / SUM(n) OVER rolling AS rolling_mean,
+                   SUM(n) OVER previous AS previous_n,
+                   SUM(total) OVER previous AS previous_total,
+                   SUM(total_sq) OVER previous AS previous_total_sq
+            FROM buckets
+            WINDOW rolling AS (PARTITION BY tool ORDER BY julianday(bucket)
+                               RANGE BETWEEN {span} PRECEDING AND CURRENT ROW),
+                   previous AS (PARTITION BY tool ORDER BY julianday(bucket)
+                                RANGE BETWEEN {span + bucket_days} PRECEDING AND {bucket_days} PRECEDING)
+        )
+        SELECT tool, bucket, n, total / n AS mean, rolling_mean,
+               (total_sq - total * total / n) / (n - 1) AS variance,
+               previous_n, previous_total / previous_n AS previous_mean,
+               (previous_total_sq - previous_total * previous_total / previous_n) / (previous_n - 1)
+                   AS previous_variance
+        FROM windows
+        WHERE bucket >= {bucket_template.format("?")}
+        ORDER BY tool, bucket
+    ''', conn, params=(warmup_start.isoformat(), since.isoformat()))
+
+    numeric = ['n', 'mean', 'rolling_mean', 'variance', 'previous_n', 'previous_mean', 'previous_variance']
+    trends[numeric] = trends[numeric].astype(np.float64)
+    trends['ewma'] = trends.groupby('tool', sort=False)['mean'].transform(
+        lambda means: means.ewm(alpha=alpha, adjust=False).mean())
+    standard_error = np.sqrt(trends['variance'].clip(lower=0) / trends['n'] +
+                             trends['previous_variance'].clip(lower=0) / trends['previous_n'])
+    trends['z_score'] = (trends['mean'] - trends['previous_mean']) / standard_error.where(standard_error > 0)
+    trends['change_point'] = ((trends['n'] >= min_samples) & (trends['previous_n'] >= min_samples) &
+                              (trends['z_score'].abs() > threshold))
+    return trends.drop(columns=['variance', 'previous_variance'])
+
+def iter_score_chunks(conn: sqlite3.Connection, chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+    """Page through complete dimension scores in rowid order"""
+
+    query = f'''
+        SELECT rowid, result_id, tool, {", ".join(SCORE_DIMENSIONS)}
+        FROM scoring_metrics
+        WHERE rowid > ? AND {" AND ".join(f"{dimension} IS NOT NULL" for dimension in SCORE_DIMENSIONS)}
+        ORDER BY rowid
+        LIMIT ?
+    '''
+    last_rowid = MIN_ROWID
+    while True:
+        chunk = pd.read_sql_query(query, conn, params=(last_rowid, chunk_size))
+        if chunk.empty:
+            return
+        last_rowid = int(chunk['rowid'].iloc[-1])
+        yield chunk
+
+def cluster_score_profiles(conn: sqlite3.Connection, n_clusters: int = 4, n_components: int = 3,
+                           chunk_size: int = 50000, seed: int = 42) -> Dict[str, Any]:
+    """Cluster results by their five dimension scores without loading them at once.
+
+    Scores are standardized with the global moments merged from
+    scoring_statistics, then three chunked passes follow: IncrementalPCA and
+    MiniBatchKMeans are fitted with partial_fit, and every result is assigned
+    to its nearest centroid. Assignments go to score_clusters and centroids,
+    in score units, to cluster_centroids; both are replaced on every run.
+    """
+
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.decomposition import IncrementalPCA
+
+    moments = {dimension: RunningStatistics() for dimension in SCORE_DIMENSIONS}
+    for tool_statistics in load_scoring_statistics(conn).values():
+        for dimension in SCORE_DIMENSIONS:
+            moments[dimension] = moments[dimension].merge(tool_statistics.get(dimension, RunningStatistics()))
+    rows = min(int(moments[dimension].n) for dimension in SCORE_DIMENSIONS)
+    if rows < max(n_clusters, n_components):
+        return {"rows": rows, "clusters": 0}
+
+    mean = np.array([moments[dimension].mean for dimension in SCORE_DIMENSIONS])
+    scale = np.array([moments[dimension].std for dimension in SCORE_DIMENSIONS])
+    scale = np.where(np.nan_to_num(scale) > 0, scale, 1.0)
+
+    def standardized(chunk: pd.DataFrame) -> np.ndarray:
+        return (chunk[SCORE_DIMENSIONS].to_numpy(dtype=np.float64) - mean) / scale
+
+    pca = IncrementalPCA(n_components=n_components)
+    for chunk in iter_score_chunks(conn, chunk_size):
+        if len(chunk) >= n_components:
+            pca.partial_fit(standardized(chunk))
+
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=seed, n_init=3, batch_size=min(chunk_size, 4096))
+    pending = []
+    for chunk in iter_score_chunks(conn, chunk_size):
+        # The first partial_fit needs at least n_clusters samples
+        pending.append(pca.transform(standardized(chunk)))
+        if sum(len(part) for part in pending) >= n_clusters:
+            kmeans.partial_fit(np.concatenate(pending))
+            pending = []
+    if pending and hasattr(kmeans, 'cluster_centers_'):
+        kmeans.partial_fit(np.concatenate(pending))
+
+    sizes = np.zeros(n_clusters, dtype=np.int64)
+    inertia = 0.0
+    tool_counts: Dict[str, np.ndarray] = {}
+    with conn:
+        conn.execute("DELETE FROM score_clusters")
+        for chunk in iter_score_chunks(conn, chunk_size):
+            distances = kmeans.transform(pca.transform(standardized(chunk)))
+            clusters = distances.argmin(axis=1)
+            sizes += np.bincount(clusters, minlength=n_clusters)
+            inertia += float((distances.min(axis=1) ** 2).sum())
+            for tool, tool_clusters in pd.Series(clusters).groupby(chunk['tool'].to_numpy(), sort=False):
+                tool_counts[tool] = tool_counts.get(tool, 0) + np.bincount(tool_clusters, minlength=n_clusters)
+
+            conn.executemany(
+                "INSERT INTO score_clusters (result_id, cluster, distance) VALUES (?, ?, ?)",
+                zip(chunk['result_id'].tolist(), clusters.tolist(), distances.min(axis=1).tolist())
+            )
+
+        centroids = pca.inverse_transform(kmeans.cluster_centers_) * scale + mean
+        conn.execute("DELETE FROM cluster_centroids")
+        conn.executemany(f'''
+            INSERT INTO cluster_centroids (cluster, size, {", ".join(SCORE_DIMENSIONS)}, components, tool_counts)
+            VALUES (?, ?, {", ".join("?" for _ in SCORE_DIMENSIONS)}, ?, ?)
+        ''', [
+            (cluster, int(sizes[cluster]), *centroids[cluster].tolist(),
+             json.dumps(kmeans.cluster_centers_[cluster].tolist()),
+             json.dumps({tool: int(counts[cluster]) for tool, counts in tool_counts.items()}))
+            for cluster in range(n_clusters)
+        ])
+
+    return {
+        "rows": int(sizes.sum()),
+        "clusters": n_clusters,
+        "explained_variance_ratio": pca.explained_variance_ratio_.tolist(),
+        "inertia": inertia,
+    }
+
+class ScoreFrameCache:
+    """Typed scoring_metrics frame shared by the analytics phases of a run.
+
+    The frame is loaded once, in chunks: tool, language and category become
+    categorical and complexity_level int8. Scores stay float64, because
+    rounding them to float32 creates rank ties and shifts the bootstrap
+    intervals. The frame is reused until the scores change. PRAGMA
+    data_version on the cache's own connection tells cheaply whether
+    anything was committed since the load. Only then is the
+    rollup signature compared, so writes to other tables (analyses,
+    insights) by concurrent phases do not force a reload. A lock serializes
+    loads, so concurrent phases share one frame.
+    """
+
+    COLUMNS = ROLLUP_KEYS + STATISTICS_DIMENSIONS
+
+    def __init__(self, db_path: Path, chunk_size: int = 200000):
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+        self.lock = threading.Lock()
+        self.conn: Optional[sqlite3.Connection] = None
+        self.frame: Optional[pd.DataFrame] = None
+        self.data_version: Optional[int] = None
+        self.signature: Optional[str] = None
+        self.loads = 0
+
+    def _signature(self, rollups: pd.DataFrame) -> str:
+        return content_hash(rollups.sort_values(ROLLUP_KEYS + ['dimension']).reset_index(drop=True))
+
+    def get(self) -> pd.DataFrame:
+        """The current scores, reloaded only if they changed since the last load"""
+
+        with self.lock:
+            if self.conn is None:
+                self.conn = sqlite3.connect(self.db_path, timeout=60, check_same_thread=False)
+
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if self.frame is not None and data_version == self.data_version:
+                return self.frame
+
+            rollups = load_scoring_rollups(self.conn)
+            signature = self._signature(rollups)
+            if self.frame is None or signature != self.signature:
+                self.frame = self._load(rollups)
+                self.signature = signature
+                self.loads += 1
+            self.data_version = data_version
+            return self.frame
+
+    def _load(self, rollups: pd.DataFrame) -> pd.DataFrame:
+        dtypes = {key: pd.CategoricalDtype(sorted(rollups[key].unique())) for key in ['tool', 'language', 'category']}
+        dtypes['complexity_level'] = np.int8
+        dtypes.update({dimension: np.float64 for dimension in STATISTICS_DIMENSIONS})
+
+        chunks = [
+            chunk.astype(dtypes)
+            for chunk in pd.read_sql_query(f"SELECT {', '.join(self.COLUMNS)} FROM scoring_metrics",
+                                           self.conn, chunksize=self.chunk_size)
+        ]
+        if not chunks:
+            return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()})[self.COLUMNS]
+        return pd.concat(chunks, ignore_index=True)
+
+    def clear(self):
+        """Drop the frame and close the connection, e.g. at the end of a pipeline run"""
+
+        with self.lock:
+            self.frame = None
+            self.data_version = self.signature = None
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+# "exact" resamples the scores themselves; "stratified" is the opt-in normal
+# approximation for samples too large to resample exactly in reasonable time
+BOOTSTRAP_METHODS = ["exact", "stratified"]
+
+class BootstrapEngine:
+    """Batched bootstrap of per-tool mean scores.
+
+    Each tool is resampled once and its resampled means are reused for every
+    pair it takes part in, so a pair costs one subtraction and two percentiles.
+    The exact method draws resampling indices in chunks of `chunk_elements`,
+    so memory stays bounded at any sample size. The stratified method, which
+    must be asked for, sorts the sample into equal-size strata by overall
+    score, draws multinomial stratum counts per resample and adds the
+    within-stratum spread back as a normal term. It matches the exact
+    bootstrap of the mean to second order at a fraction of the cost.
+    """
+
+    def __init__(self, n_resamples: int = 10000, seed: int = 42, confidence: float = 0.95,
+                 method: str = "exact", chunk_elements: int = 4_000_000, strata: int = 128):
+        if method not in BOOTSTRAP_METHODS:
+            raise ValueError(f"Unknown bootstrap method: {method}")
+        self.n_resamples = n_resamples
+        self.seed = seed
+        self.confidence = confidence
+        self.method = method
+        self.chunk_elements = chunk_elements
+        self.strata = strata
+
+    def _rng(self, key: str) -> np.random.Generator:
+        # Seed per tool so results do not depend on the order tools are visited
+        return np.random.default_rng([self.seed, zlib.crc32(key.encode())])
+
+    def resample_means(self, key: str, values: np.ndarray) -> np.ndarray:
+        """Return an (n_resamples, dimensions) matrix of bootstrap means of `values`"""
+
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        if len(values) == 0:
+            return np.full((self.n_resamples, values.shape[1]), np.nan)
+
+        rng = self._rng(key)
+        if self.method == "stratified":
+            return self._stratified_means(rng, values)
+        return self._exact_means(rng, values)
+
+    def _exact_means(self, rng: np.random.Generator, values: np.ndarray) -> np.ndarray:
+        n = len(values)
+        dtype = np.int64 if n > 2**31 - 1 else np.int32
+        chunk = max(1, self.chunk_elements // n)
+        means = np.empty((self.n_resamples, values.shape[1]))
+
+        for start in range(0, self.n_resamples, chunk):
+            stop = min(start + chunk, self.n_resamples)
+            if n <= self.chunk_elements:
+                index = rng.integers(0, n, size=(stop - start, n), dtype=dtype)
+                for column in range(values.shape[1]):
+                    means[start:stop, column] = values[index, column].mean(axis=1)
+                continue
+
+            # A single resample exceeds the chunk, so sum its indices piece by piece
+            sums = np.zeros(values.shape[1])
+            for offset in range(0, n, self.chunk_elements):
+                index = rng.integers(0, n, size=min(self.chunk_elements, n - offset), dtype=dtype)
+                for column in range(values.shape[1]):
+                    sums[column] += values[index, column].sum()
+            means[start] = sums / n
+
+        return means
+
+    def _stratified_means(self, rng: np.random.Generator, values: np.ndarray) -> np.ndarray:
+        n = len(values)
+        strata = np.array_split(values[np.argsort(values[:, -1], kind='stable')], min(self.strata, n))
+        proportions = np.array([len(stratum) for stratum in strata]) / n
+        stratum_means = np.array([stratum.mean(axis=0) for stratum in strata])
+        stratum_variances = np.array([stratum.var(axis=0) for stratum in strata])
+
+        chunk = max(1, self.chunk_elements // len(strata))
+        means = np.empty((self.n_resamples, values.shape[1]))
+
+        for start in range(0, self.n_resamples, chunk):
+            stop = min(start + chunk, self.n_resamples)
+            counts = rng.multinomial(n, proportions, size=stop - start)
+            spread = np.sqrt(counts @ stratum_variances) / n
+            means[start:stop] = counts @ stratum_means / n + spread * rng.standard_normal(spread.shape)
+
+        return means
+
+    def difference_intervals(self, means_a: np.ndarray, means_b: np.ndarray) -> np.ndarray:
+        """Percentile intervals of mean_a - mean_b, one (low, high) row per dimension"""
+
+        alpha = (1 - self.confidence) / 2
+        return np.percentile(means_a - means_b, [100 * alpha, 100 * (1 - alpha)], axis=0).T
+
+MIN_ROWID = -(2 ** 63)
+MAX_ROWID = 2 ** 63 - 1
+
+# Code metrics of the fenced code blocks in a response, memoized per SHA-256
+# of the response text in code_metrics. Bump when the metrics or the scores
+# derived from them change; cached metrics of an older version are recomputed.
+CODE_METRICS_VERSION = 1
+
+# Structure score and innovation base for responses without any code block
+DEFAULT_STRUCTURE_SCORE = 0.85
+DEFAULT_INNOVATION_BASE = 0.75
+
+CODE_BLOCK_PATTERN = re.compile(r"```[ \t]*([\w+#.-]*)[^\n]*\n(.*?)```", re.DOTALL)
+
+# Lightweight per-language tokenizer rules: string literals, comments and
+# function definitions. Python nests by indentation, the others by braces.
+CODE_SYNTAX = {
+    "python": {"strings": r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'',
+               "block_comment": None, "line_comment": "#", "indent": True,
+               "functions": r"^\s*(?:async\s+)?def\s+\w+"},
+    "typescript": {"strings": r'`(?:\\.|[^`\\])*`|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'',
+                   "block_comment": r"/\*[\s\S]*?\*/", "line_comment": "//", "indent": False,
+                   "functions": r"\bfunction\b|=>|^\s*(?:(?:public|private|protected|static|async)\s+)*"
+                                r"(?!if\b|for\b|while\b|switch\b|catch\b)\w+\s*\([^)]*\)\s*(?::[^{]+)?\{"},
+    "rust": {"strings": r'"(?:\\.|[^"\\])*"', "block_comment": r"/\*[\s\S]*?\*/", "line_comment": "//",
+             "indent": False, "functions": r"\bfn\s+\w+"},
+    "go": {"strings": r'`[^`]*`|"(?:\\.|[^"\\\n])*"', "block_comment": r"/\*[\s\S]*?\*/", "line_comment": "//",
+           "indent": False, "functions": r"\bfunc\b"},
+    "nushell": {"strings": r'"(?:\\.|[^"\\\n])*"|\'[^\'\n]*\'', "block_comment": None, "line_comment": "#",
+                "indent": False, "functions": r"^\s*(?:export\s+)?def(?:-env)?\s+"},
+}
+
+CODE_LANGUAGE_ALIASES = {
+    "py": "python", "python3": "python",
+    "ts": "typescript", "tsx": "typescript", "js": "typescript", "jsx": "typescript", "javascript": "typescript",
+    "rs": "rust", "golang": "go", "nu": "nushell",
+}
+
+MIN_DUPLICATE_LINE_LENGTH = 10
+
+@dataclass
+class CodeMetrics:
+    """Size and shape of the code blocks in one response"""
+    code_blocks: int = 0
+    loc: int = 0
+    functions: int = 0
+    max_nesting: int = 0
+    duplication: float = 0.0
+
+    @property
+    def structure_score(self) -> float:
+        """Penalize deep nesting, duplicated lines and oversized functions"""
+        if not self.loc:
+            return DEFAULT_STRUCTURE_SCORE
+        lines_per_function = self.loc / max(self.functions, 1)
+        score = (1.0 - 0.1 * max(self.max_nesting - 3, 0) - 0.5 * self.duplication
+                 - min(max(lines_per_function - 40, 0) / 200, 0.3))
+        return min(max(score, 0.0), 1.0)
+
+    @property
+    def innovation_base(self) -> float:
+        """Reward decomposition into functions, several code blocks and little repetition"""
+        if not self.loc:
+            return DEFAULT_INNOVATION_BASE
+        score = (0.5 + 0.2 * min(self.functions / 5, 1.0) + 0.1 * min(self.code_blocks / 3, 1.0)
+                 + 0.2 * (1 - self.duplication))
+        return min(max(score, 0.0), 1.0)
+
+def code_syntax(tag: str, fallback_language: Optional[str]) -> Dict:
+    """Tokenizer rules for a code fence tag, falling back to the result's language"""
+
+    for name in (tag.lower(), (fallback_language or "").lower()):
+        name = CODE_LANGUAGE_ALIASES.get(name, name)
+        if name in CODE_SYNTAX:
+            return CODE_SYNTAX[name]
+    return CODE_SYNTAX["typescript"]
+
+def code_lines(code: str, syntax: Dict) -> List[str]:
+    """Non-blank lines of a code block with string literals and comments removed"""
+
+    code = re.sub(syntax["strings"], '""', code)
+    if syntax["block_comment"]:
+        code = re.sub(syntax["block_comment"], "", code)
+    lines = (line.split(syntax["line_comment"], 1)[0].rstrip() for line in code.splitlines())
+    return [line for line in lines if line.strip()]
+
+def nesting_depth(lines: List[str], indent: bool) -> int:
+    if indent:
+        indents = [len(line) - len(line.lstrip()) for line in lines]
+        unit = min((width for width in indents if width), default=0)
+        return max(width // unit for width in indents) if unit else 0
+
+    depth = deepest = 0
+    for line in lines:
+        for char in line:
+            if char == "{":
+                depth += 1
+                deepest = max(deepest, depth)
+            elif char == "}":
+                depth = max(depth - 1, 0)
+    return deepest
+
+def analyze_response(response: str, language: Optional[str] = None) -> CodeMetrics:
+    """Measure LOC, function count, nesting depth and duplicated lines of a response's code blocks"""
+
+    metrics = CodeMetrics()
+    if not isinstance(response, str) or "```" not in response:
+        return metrics
+
+    normalized = []
+    for tag, code in CODE_BLOCK_PATTERN.findall(response):
+        syntax = code_syntax(tag, language)
+        lines = code_lines(code, syntax)
+        if not lines:
+            continue
+
+        metrics.code_blocks += 1
+        metrics.loc += len(lines)
+        metrics.functions += len(re.findall(syntax["functions"], "\n".join(lines), re.MULTILINE))
+        metrics.max_nesting = max(metrics.max_nesting, nesting_depth(lines, syntax["indent"]))
+        normalized.extend(" ".join(line.split()) for line in lines)
+
+    candidates = [line for line in normalized if len(line) >= MIN_DUPLICATE_LINE_LENGTH]
+    if candidates:
+        metrics.duplication = 1 - len(set(candidates)) / len(candidates)
+    return metrics
+
+def analyze_responses(rows: List[Tuple[str, str, str]]) -> List[Tuple]:
+    """code_metrics rows for (response_hash, response, language) tuples; runs in worker processes"""
+
+    results = []
+    for response_hash, response, language in rows:
+        metrics = analyze_response(response, language)
+        results.append((response_hash, CODE_METRICS_VERSION, metrics.code_blocks, metrics.loc, metrics.functions,
+                        metrics.max_nesting, metrics.duplication, metrics.structure_score, metrics.innovation_base))
+    return results
+
+def worker_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool that is safe to start from any thread.
+
+    Forked workers inherit every lock other threads hold at that moment
+    (pipeline phases, logging, imports), so workers are spawned instead. A
+    spawned worker resolves functions by module name, and this script is
+    usually loaded from its hyphenated file, so each worker first loads the
+    file under the same module name as the parent.
+    """
+
+    mp_context = multiprocessing.get_context("spawn")
+    if __name__ == "__main__":
+        return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+
+    loader = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location({__name__!r}, {str(Path(__file__).resolve())!r})\n"
+        "module = sys.modules[spec.name] = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+    )
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=exec, initargs=(loader, {}))
+
+def populate_code_metrics(conn: sqlite3.Connection, workers: int = 1, chunk_rows: int = 5000) -> int:
+    """Analyze responses whose hash has no code_metrics row at the current version.
+
+    Each distinct response is analyzed once, however many results share it;
+    with `workers` > 1 the chunks are split across a process pool.
+    """
+
+    query = '''
+        SELECT sf.response_hash, er.response, sf.language
+        FROM scoring_features sf
+        JOIN evaluation_results er ON er.id = sf.result_id
+        WHERE sf.response_hash > ?
+          AND NOT EXISTS (SELECT 1 FROM code_metrics cm
+                          WHERE cm.response_hash = sf.response_hash AND cm.metrics_version = ?)
+        GROUP BY sf.response_hash
+        ORDER BY sf.response_hash
+        LIMIT ?
+    '''
+
+    executor = worker_process_pool(workers) if workers > 1 else None
+
+    analyzed = 0
+    last_hash = ""
+    try:
+        while True:
+            rows = conn.execute(query, (last_hash, CODE_METRICS_VERSION, chunk_rows)).fetchall()
+            if not rows:
+                break
+            last_hash = rows[-1][0]
+
+            if executor:
+                results = [row for part in executor.map(analyze_responses, [rows[i::workers] for i in range(workers)])
+                           for row in part]
+            else:
+                results = analyze_responses(rows)
+
+            with conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO code_metrics
+                    (response_hash, metrics_version, code_blocks, loc, functions, max_nesting, duplication,
+                     structure_score, innovation_base)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', results)
+            analyzed += len(results)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return analyzed
+
+def response_sha256(response: Optional[str]) -> Optional[str]:
+    if response is None:
+        return None
+    return hashlib.sha256(response.encode("utf-8", "surrogatepass")).hexdigest()
+
+# Bump when the extracted feature columns or their derivation change; rows
+# extracted under an older version are re-extracted on the next scoring run
+FEATURE_VERSION = 2
+
+FEATURE_COLUMNS = ['result_id', 'tool', 'language', 'category', 'complexity_level', 'response_length', 'response_hash',
+                   'execution_time', 'response_time', 'success'] + \
+                  [f"metric_{key}" for key in VectorizedScorer.METRIC_DEFAULTS] + ['metrics_valid']
+
+def feature_extraction_sql() -> str:
+    """SELECT list deriving the scoring features from an evaluation_results row `er`.
+
+    Response text never leaves SQLite: only its length, its SHA-256 (the
+    code_metrics cache key) and the metric keys the scorer reads (via
+    json_extract) are selected, and rows whose metrics are not a JSON object
+    with numeric values are flagged invalid. Requires the sha256 function
+    registered by populate_scoring_features.
+    """
+
+    metric_columns = []
+    metric_checks = []
+    for key in VectorizedScorer.METRIC_DEFAULTS:
+        metric_columns.append(f"""
+               CASE WHEN json_valid(er.metrics) THEN
+                   CASE WHEN json_type(er.metrics, '$.{key}') IN ('integer', 'real')
+                        THEN json_extract(er.metrics, '$.{key}') END
+               END""")
+        metric_checks.append(
+            f"WHEN coalesce(json_type(er.metrics, '$.{key}'), 'null') NOT IN ('null', 'integer', 'real') THEN 0"
+        )
+
+    return f'''
+               er.id, er.tool, er.language, er.category, er.complexity_level,
+               length(er.response), sha256(er.response), er.execution_time, er.response_time, er.success,{",".join(metric_columns)},
+               CASE
+                   WHEN er.metrics IS NULL OR er.metrics = '' THEN 1
+                   WHEN NOT json_valid(er.metrics) THEN 0
+                   WHEN json_type(er.metrics) <> 'object' THEN 0
+                   {" ".join(metric_checks)}
+                   ELSE 1
+               END'''
+
+def populate_scoring_features(conn: sqlite3.Connection, chunk_rows: int = 50000) -> int:
+    """Extract features for results missing from scoring_features at the current version.
+
+    Works through evaluation_results in rowid ranges with one INSERT ... SELECT
+    and one commit per range; returns the number of rows extracted.
+    """
+
+    low, high = conn.execute("SELECT MIN(rowid), MAX(rowid) FROM evaluation_results").fetchone()
+    if low is None:
+        return 0
+
+    query = f'''
+        INSERT OR REPLACE INTO scoring_features ({", ".join(FEATURE_COLUMNS)}, feature_version)
+        SELECT {feature_extraction_sql()}, ?
+        FROM evaluation_results er
+        WHERE er.rowid > ? AND er.rowid <= ?
+          AND NOT EXISTS (SELECT 1 FROM scoring_features sf
+                          WHERE sf.result_id = er.id AND sf.feature_version = ?)
+        ORDER BY er.rowid
+    '''
+
+    conn.create_function("sha256", 1, response_sha256, deterministic=True)
+
+    extracted = 0
+    for start in range(low - 1, high, chunk_rows):
+        with conn:
+            extracted += conn.execute(query, (FEATURE_VERSION, start, min(start + chunk_rows, high),
+                                              FEATURE_VERSION)).rowcount
+    return extracted
+
+def scoring_feature_query(full_rescore: bool = False) -> str:
+    """Build the query selecting stored scoring features for a feature rowid range (start, end]"""
+
+    query = f'''
+        SELECT sf.feature_rowid AS source_rowid, sf.result_id AS id, {", ".join(f"sf.{column}" for column in FEATURE_COLUMNS[1:])},
+               cm.structure_score AS code_structure_score, cm.innovation_base AS code_innovation_base
+        FROM scoring_features sf
+        LEFT JOIN code_metrics cm
+            ON cm.response_hash = sf.response_hash AND cm.metrics_version = {CODE_METRICS_VERSION}
+        WHERE sf.success = 1 AND sf.feature_rowid > ? AND sf.feature_rowid <= ?
+    '''
+
+    if not full_rescore:
+        # Rows with invalid metrics were reported when their features were extracted
+        query += " AND sf.metrics_valid = 1"
+        query += " AND NOT EXISTS (SELECT 1 FROM scoring_metrics sm WHERE sm.result_id = sf.result_id)"
+
+    return query + " ORDER BY sf.feature_rowid"
+
+# Config sections that determine stored scores. A change to "weights" alone
+# only reweights the stored dimension scores into overall_score; a change to
+# any other section, or of the feature and code metrics versions, needs a
+# rescore from features.
+SCORING_CONFIG_SECTIONS = ['weights', 'factors', 'scoring_methods', 'normalization']
+
+def scoring_config_hashes(scoring_config: Dict) -> Dict[str, str]:
+    """Content hash of each score-determining config section and of the extractor versions"""
+
+    hashes = {section: content_hash(scoring_config.get(section)) for section in SCORING_CONFIG_SECTIONS}
+    hashes['extractor_versions'] = content_hash((FEATURE_VERSION, CODE_METRICS_VERSION))
+    return hashes
+
+def reweight_overall_scores(conn: sqlite3.Connection, weights: Dict[str, float]) -> int:
+    """Recompute overall_score from the stored dimension scores with one UPDATE.
+
+    Terms are summed in the same order as VectorizedScorer.score_frame, so the
+    result is bit-identical to a full rescore with the same weights.
+    """
+
+    weighted_sum = " + ".join(f"{dimension} * ?" for dimension in SCORE_DIMENSIONS)
+    cursor = conn.execute(f"UPDATE scoring_metrics SET overall_score = {weighted_sum}",
+                          [weights[dimension[:-len('_score')]] for dimension in SCORE_DIMENSIONS])
+    return cursor.rowcount
+
+def score_rowid_range(db_path: str, scoring_config: Dict, start_rowid: int, end_rowid: int,
+                      full_rescore: bool) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Score one rowid shard of scoring_features in a worker process.
+
+    Opens its own read-only connection and returns the valid feature rows
+    together with their scores; writing is left to the parent process.
+    """
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=60)
+    try:
+        features = pd.read_sql_query(scoring_feature_query(full_rescore), conn,
+                                     params=(start_rowid, end_rowid))
+    finally:
+        conn.close()
+
+    return features, VectorizedScorer(scoring_config).score_frame(
+        features[features['metrics_valid'].to_numpy(dtype=bool)]
+    )
+
+class ScoringMetricsWriter:
+    """Buffers scoring metrics and writes them in large transactions.
+
+    One connection is held for the lifetime of the writer; every `batch_size`
+    rows are flushed with a single executemany and one commit. Per-tool
+    sufficient statistics, quantile sketches and the scoring_rollups cells are
+    merged in the same transaction; if a batch overwrites existing scores they
+    are rebuilt once when the writer closes. A rescored result keeps its first
+    scoring_timestamp, so full rescores do not move score trends to today.
+    """
+
+    SCORE_FIELDS = STATISTICS_DIMENSIONS + ['confidence_level']
+
+    def __init__(self, db_path: Path, batch_size: int = 5000, scoring_method: str = "comprehensive_v1"):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.scoring_method = scoring_method
+        self.conn = sqlite3.connect(db_path, timeout=60)
+        self.pending: List[Tuple] = []
+        self.rows_written = 0
+        self.statistics_stale = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, result_id: str, tool: str, language: str, category: str,
+            complexity_level: int, scoring_metric: ScoringMetrics):
+        """Queue one scored result, flushing when the batch is full"""
+
+        scoring_id = f"score_{result_id}"
+        self.pending.append((
+            scoring_id, result_id, tool, language, category, int(complexity_level),
+            scoring_metric.code_quality_score, scoring_metric.functionality_score,
+            scoring_metric.performance_score, scoring_metric.maintainability_score,
+            scoring_metric.innovation_score, scoring_metric.overall_score,
+            scoring_metric.confidence_level, self.scoring_method, scoring_metric.scoring_timestamp
+        ))
+
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def add_frame(self, features: pd.DataFrame, scores: pd.DataFrame, scoring_timestamp: str):
+        """Queue a whole scored chunk straight from its columns"""
+
+        columns = [
+            features['id'].tolist(),
+            features['tool'].tolist(),
+            features['language'].tolist(),
+            features['category'].tolist(),
+            features['complexity_level'].astype(int).tolist(),
+        ] + [scores[column].tolist() for column in self.SCORE_FIELDS]
+
+        for values in zip(*columns):
+            self.pending.append((f"score_{values[0]}", *values, self.scoring_method, scoring_timestamp))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Upsert all queued rows by result_id in one transaction"""
+
+        if not self.pending:
+            return
+
+        with self.conn:
+            if not self.statistics_stale:
+                self.statistics_stale = self._overwrites_existing_scores()
+
+            self.conn.executemany('''
+                INSERT INTO scoring_metrics 
+                (id, result_id, tool, language, category, complexity_level,
+                 code_quality_score, functionality_score, performance_score, 
+                 maintainability_score, innovation_score, overall_score, 
+                 confidence_level, scoring_method, scoring_timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(result_id) DO UPDATE SET
+                    tool = excluded.tool,
+                    language = excluded.language,
+                    category = excluded.category,
+                    complexity_level = excluded.complexity_level,
+                    code_quality_score = excluded.code_quality_score,
+                    functionality_score = excluded.functionality_score,
+                    performance_score = excluded.performance_score,
+                    maintainability_score = excluded.maintainability_score,
+                    innovation_score = excluded.innovation_score,
+                    overall_score = excluded.overall_score,
+                    confidence_level = excluded.confidence_level,
+                    scoring_method = excluded.scoring_method
+            ''', self.pending)
+
+            if not self.statistics_stale:
+                batch = pd.DataFrame([row[2:12] for row in self.pending],
+                                     columns=ROLLUP_KEYS + STATISTICS_DIMENSIONS)
+                merge_scoring_statistics(self.conn, batch)
+                merge_scoring_rollups(self.conn, batch)
+                merge_scoring_sketches(self.conn, batch)
+
+        self.rows_written += len(self.pending)
+        self.pending = []
+
+    def _overwrites_existing_scores(self) -> bool:
+        result_ids = [row[1] for row in self.pending]
+        if len(set(result_ids)) != len(result_ids):
+            return True
+        return bool(self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM scoring_metrics WHERE result_id IN (SELECT value FROM json_each(?)))",
+            (json.dumps(result_ids),)
+        ).fetchone()[0])
+
+    def close(self):
+        """Flush remaining rows, refresh stale aggregates and release the connection"""
+
+        try:
+            self.flush()
+            if self.statistics_stale:
+                with self.conn:
+                    rebuild_scoring_statistics(self.conn)
+                    rebuild_scoring_rollups(self.conn)
+                    rebuild_scoring_sketches(self.conn)
+                self.statistics_stale = False
+        finally:
+            self.conn.close()
+
+# Panels of the 4x3 analytics figure. Each panel is rendered on its own Agg
+# figure from a small input payload, so panels can be drawn in worker
+# processes and cached by a content hash of that payload.
+PANEL_FIGSIZE = (20 / 3, 6)
+PANEL_RENDER_VERSION = 1
+SCORE_COMPONENT_LABELS = ['Code Quality', 'Functionality', 'Performance', 'Maintainability', 'Innovation']
+
+def content_hash(payload: Any) -> str:
+    """SHA-256 over the values of nested frames, series, arrays and plain values"""
+
+    digest = hashlib.sha256()
+
+    def update(value):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            digest.update(repr((type(value).__name__, getattr(value, 'name', None),
+                                list(getattr(value, 'columns', [])), list(value.index.names))).encode())
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        elif isinstance(value, np.ndarray):
+            digest.update(repr((value.dtype.str, value.shape)).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, dict):
+            for key in sorted(value):
+                digest.update(repr(key).encode())
+                update(value[key])
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"{type(value).__name__}{len(value)}".encode())
+            for item in value:
+                update(item)
+        else:
+            digest.update(repr(value).encode())
+
+    update(payload)
+    return digest.hexdigest()
+
+def sketch_box_stats(sketches: Dict[Tuple[str, str], TDigest], dimension: str = 'overall_score') -> pd.DataFrame:
+    """Box-plot statistics plus p90/p99 per tool, read from the quantile sketches"""
+
+    rows = {}
+    for (tool, sketch_dimension), sketch in sketches.items():
+        if sketch_dimension != dimension or sketch.count == 0:
+            continue
+        q1, med, q3, p90, p99 = sketch.quantile(np.array([0.25, 0.5, 0.75, 0.9, 0.99]))
+        iqr = q3 - q1
+        rows[tool] = {
+            'whislo': max(sketch.min_value, q1 - 1.5 * iqr), 'q1': q1, 'med': med, 'q3': q3,
+            'whishi': min(sketch.max_value, q3 + 1.5 * iqr), 'p90': p90, 'p99': p99,
+        }
+    return pd.DataFrame.from_dict(rows, orient='index').rename_axis('tool')
+
+def score_bin_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    """Equal-width edges over the observed range, widened when all values are equal"""
+
+    low, high = float(np.min(values)), float(np.max(values))
+    if high <= low:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+def score_histograms(df: pd.DataFrame, bins: int = 15) -> Dict[str, Any]:
+    """Per-tool counts of overall_score on shared bin edges"""
+
+    edges = score_bin_edges(df['overall_score'].to_numpy(), bins)
+    counts = {tool: np.histogram(scores.to_numpy(), bins=edges)[0]
+              for tool, scores in df.groupby('tool', sort=False, observed=True)['overall_score']}
+    return {'edges': edges, 'counts': pd.DataFrame(counts).T}
+
+def complexity_score_counts(df: pd.DataFrame, bins: int = 20) -> pd.DataFrame:
+    """Rows per tool, complexity level and overall_score bin, as bin centers with counts"""
+
+    scores = df['overall_score'].to_numpy()
+    edges = score_bin_edges(scores, bins)
+    bin_index = np.clip(np.searchsorted(edges, scores, side='right') - 1, 0, bins - 1)
+    counts = (df[['tool', 'complexity_level']].assign(score_bin=bin_index)
+              .groupby(['tool', 'complexity_level', 'score_bin'], sort=False, observed=True).size()
+              .rename('count').reset_index())
+    counts['overall_score'] = (edges[:-1] + np.diff(edges) / 2)[counts['score_bin']]
+    return counts.drop(columns='score_bin')
+
+def binned_score_means(df: pd.DataFrame, x: str, y: str, value: str, bins: int = 40) -> Dict[str, Any]:
+    """2D histogram of x against y with the mean of value in every cell"""
+
+    x_values, y_values = df[x].to_numpy(np.float64), df[y].to_numpy(np.float64)
+    x_edges, y_edges = score_bin_edges(x_values, bins), score_bin_edges(y_values, bins)
+    counts, _, _ = np.histogram2d(x_values, y_values, bins=(x_edges, y_edges))
+    totals, _, _ = np.histogram2d(x_values, y_values, bins=(x_edges, y_edges),
+                                  weights=df[value].to_numpy(np.float64))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = totals / counts
+    return {'x_edges': x_edges, 'y_edges': y_edges, 'counts': counts, 'means': means}
+
+def panel_inputs(df: pd.DataFrame, sketches: Dict[Tuple[str, str], TDigest], aggregate: bool = False,
+                 bins: int = 40) -> Dict[str, Any]:
+    """The data each panel plots, keyed by panel name in figure order.
+
+    With `aggregate` the per-row panels get binned counts and cell means
+    instead of raw rows, so payload size, hashing and render time no longer
+    grow with the number of scored results.
+    """
+
+    tools = list(df['tool'].unique())
+    component_means = df.groupby('tool', sort=False, observed=True)[SCORE_DIMENSIONS].mean()
+    inputs = {
+        'overall_distribution': sketch_box_stats(sketches),
+        'category_scores': df.groupby(['tool', 'category'], observed=True)['overall_score'].mean().unstack(),
+        'complexity_trend': df.groupby(['complexity_level', 'tool'], observed=True)['overall_score'].mean().unstack()[tools],
+        'tool_components': component_means.loc[tools[0]],
+        'language_heatmap': df.groupby(['language', 'tool'], observed=True)['overall_score'].mean().unstack(),
+        'score_histogram': df[['tool', 'overall_score']],
+        'component_correlation': df[SCORE_DIMENSIONS].corr(),
+        'complexity_scatter': df[['tool', 'complexity_level', 'overall_score']],
+        'comparative_radar': component_means if len(tools) >= 2 else None,
+        'summary_table': df.groupby('tool', observed=True)['overall_score'].agg(['mean', 'std', 'min', 'max']).round(3),
+        'innovation_quality': df[['innovation_score', 'code_quality_score', 'overall_score']],
+        'efficiency': df.groupby('tool', observed=True).agg({'performance_score': 'mean', 'overall_score': 'mean'}),
+    }
+    if aggregate:
+        inputs['score_histogram'] = score_histograms(df)
+        inputs['complexity_scatter'] = complexity_score_counts(df, bins // 2)
+        inputs['innovation_quality'] = binned_score_means(df, 'innovation_score', 'code_quality_score',
+                                                          'overall_score', bins)
+    return inputs
+
+def draw_score_radar(ax, component_means: pd.DataFrame, fill_alpha: float, colors: Optional[List[str]] = None):
+    """Plot the five score components of each tool around a closed loop"""
+
+    angles = np.linspace(0, 2 * np.pi, len(SCORE_COMPONENT_LABELS), endpoint=False).tolist()
+    angles += angles[:1]
+
+    for i, (tool, means) in enumerate(component_means.iterrows()):
+        values = means[SCORE_DIMENSIONS].tolist()
+        values += values[:1]  # Complete the circle
+        color = colors[i % len(colors)] if colors else None
+
+        ax.plot(angles, values, 'o-', linewidth=2, label=tool, color=color)
+        ax.fill(angles, values, alpha=fill_alpha, color=color)
+
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(SCORE_COMPONENT_LABELS)
+    ax.set_ylim(0, 1)
+    ax.grid(True)
+
+def _panel_overall_distribution(fig, ax, data: pd.DataFrame):
+    boxes = [dict(stats, label=tool) for tool, stats in data.iterrows()]
+    ax.bxp(boxes, showfliers=False, patch_artist=True)
+    positions = np.arange(1, len(data) + 1)
+    ax.scatter(positions, data['p90'], marker='_', s=300, color='black', label='p90')
+    ax.scatter(positions, data['p99'], marker='_', s=300, color='red', label='p99')
+    ax.legend()
+    ax.set_xlabel('tool')
+    ax.set_title('Overall Score Distribution by Tool', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Overall Score')
+
+def _panel_category_scores(fig, ax, data: pd.DataFrame):
+    data.plot(kind='bar', ax=ax)
+    ax.set_title('Average Score by Category', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Average Score')
+    ax.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.tick_params(axis='x', labelrotation=45)
+
+def _panel_complexity_trend(fig, ax, data: pd.DataFrame):
+    for tool in data.columns:
+        complexity_means = data[tool].dropna()
+        ax.plot(complexity_means.index, complexity_means.values, marker='o', label=tool, linewidth=2)
+    ax.set_title('Performance vs Complexity Level', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Complexity Level')
+    ax.set_ylabel('Average Score')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+def _panel_tool_components(fig, ax, data: pd.Series):
+    draw_score_radar(ax, data.to_frame().T, fill_alpha=0.25)
+    ax.set_title(f'{data.name} - Score Components', fontsize=14, fontweight='bold')
+
+def _panel_language_heatmap(fig, ax, data: pd.DataFrame):
+    import seaborn as sns
+    sns.heatmap(data, annot=True, cmap='RdYlGn', center=0.5, fmt='.3f', ax=ax)
+    ax.set_title('Performance by Language (Heatmap)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Language')
+
+def _panel_score_histogram(fig, ax, data):
+    if isinstance(data, dict):
+        for tool, counts in data['counts'].iterrows():
+            ax.stairs(counts.to_numpy(), data['edges'], fill=True, alpha=0.7, label=tool)
+    else:
+        for tool, tool_scores in data.groupby('tool', sort=False)['overall_score']:
+            ax.hist(tool_scores, alpha=0.7, label=tool, bins=15)
+    ax.set_title('Score Distribution', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Overall Score')
+    ax.set_ylabel('Frequency')
+    ax.legend()
+
+def _panel_component_correlation(fig, ax, data: pd.DataFrame):
+    import seaborn as sns
+    sns.heatmap(data, annot=True, cmap='coolwarm', center=0, fmt='.2f', ax=ax)
+    ax.set_title('Score Components Correlation', fontsize=14, fontweight='bold')
+
+def _panel_complexity_scatter(fig, ax, data: pd.DataFrame):
+    if 'count' in data:
+        # One marker per occupied bin, sized by its row count and offset per tool
+        groups = list(data.groupby('tool', sort=False, observed=True))
+        largest = data['count'].max()
+        for i, (tool, tool_data) in enumerate(groups):
+            offset = (i - (len(groups) - 1) / 2) * 0.8 / len(groups)
+            ax.scatter(tool_data['complexity_level'] + offset, tool_data['overall_score'], label=tool, alpha=0.6,
+                       s=10 + 290 * tool_data['count'] / largest)
+    else:
+        for tool, tool_data in data.groupby('tool', sort=False):
+            ax.scatter(tool_data['complexity_level'], tool_data['overall_score'], label=tool, alpha=0.6, s=30)
+    ax.set_title('Score vs Complexity (Scatter)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Complexity Level')
+    ax.set_ylabel('Overall Score')
+    ax.legend()
+
+def _panel_comparative_radar(fig, ax, data: Optional[pd.DataFrame]):
+    if data is None:
+        return
+    draw_score_radar(ax, data, fill_alpha=0.1, colors=['blue', 'red', 'green', 'orange', 'purple'])
+    ax.legend(loc='upper right', bbox_to_anchor=(1.1, 1.1))
+    ax.set_title('Comparative Performance by Category', fontsize=14, fontweight='bold')
+
+def _panel_summary_table(fig, ax, data: pd.DataFrame):
+    ax.table(cellText=data.values,
+             rowLabels=data.index,
+             colLabels=data.columns,
+             cellLoc='center',
+             loc='center')
+    ax.axis('off')
+    ax.set_title('Statistical Summary', fontsize=14, fontweight='bold')
+
+def _panel_innovation_quality(fig, ax, data):
+    if isinstance(data, dict):
+        means = np.ma.masked_invalid(data['means'])
+        mesh = ax.pcolormesh(data['x_edges'], data['y_edges'], means.T, cmap='viridis')
+        fig.colorbar(mesh, ax=ax, label='Mean Overall Score')
+    else:
+        scatter = ax.scatter(data['innovation_score'], data['code_quality_score'],
+                             c=data['overall_score'], cmap='viridis', alpha=0.6)
+        fig.colorbar(scatter, ax=ax, label='Overall Score')
+    ax.set_xlabel('Innovation Score')
+    ax.set_ylabel('Code Quality Score')
+    ax.set_title('Innovation vs Quality', fontsize=14, fontweight='bold')
+
+def _panel_efficiency(fig, ax, data: pd.DataFrame):
+    ax.scatter(data['performance_score'], data['overall_score'], s=100)
+    for tool in data.index:
+        ax.annotate(tool, (data.loc[tool, 'performance_score'], data.loc[tool, 'overall_score']),
+                    xytext=(5, 5), textcoords='offset points')
+    ax.set_xlabel('Performance Score')
+    ax.set_ylabel('Overall Score')
+    ax.set_title('Performance vs Overall Quality', fontsize=14, fontweight='bold')
+
+PANEL_RENDERERS: Dict[str, Callable] = {
+    'overall_distribution': _panel_overall_distribution,
+    'category_scores': _panel_category_scores,
+    'complexity_trend': _panel_complexity_trend,
+    'tool_components': _panel_tool_components,
+    'language_heatmap': _panel_language_heatmap,
+    'score_histogram': _panel_score_histogram,
+    'component_correlation': _panel_component_correlation,
+    'complexity_scatter': _panel_complexity_scatter,
+    'comparative_radar': _panel_comparative_radar,
+    'summary_table': _panel_summary_table,
+    'innovation_quality': _panel_innovation_quality,
+    'efficiency': _panel_efficiency,
+}
+
+def render_panel(name: str, data: Any, path: str, dpi: int = 300) -> str:
+    """Render one panel to a PNG with the Agg backend; runs in worker processes"""
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.style
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    with matplotlib.style.context('seaborn-v0_8'):
+        sns.set_palette("husl")
+        fig = Figure(figsize=PANEL_FIGSIZE)
+        PANEL_RENDERERS[name](fig, fig.add_subplot(), data)
+        fig.tight_layout()
+
+        # Write under a temporary name so an interrupted render never leaves a cache entry
+        partial_path = Path(f"{path}.partial")
+        fig.savefig(partial_path, dpi=dpi, format='png')
+        partial_path.replace(path)
+
+    return path
+
+def compose_panels(panel_paths: List[Path], output_path: Path, columns: int = 3):
+    """Tile rendered panels row by row into one image"""
+
+    from PIL import Image
+
+    panels = [Image.open(panel_path) for panel_path in panel_paths]
+    width = max(panel.width for panel in panels)
+    height = max(panel.height for panel in panels)
+    rows = -(-len(panels) // columns)
+
+    canvas = Image.new('RGBA', (width * columns, height * rows), 'white')
+    for i, panel in enumerate(panels):
+        canvas.paste(panel, ((i % columns) * width, (i // columns) * height))
+        panel.close()
+    canvas.save(output_path)
+
+class StreamingReportWriter:
+    """Writes a report section by section straight to its file.
+
+    Nothing but the current section is held in memory. Sections go to a
+    .partial file that replaces the report only once it is complete, so an
+    interrupted run never leaves a truncated dashboard behind.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.partial_path = Path(f"{self.path}.partial")
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.partial_path, 'w')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.file.close()
+        if exc_type is None:
+            self.partial_path.replace(self.path)
+        else:
+            self.partial_path.unlink(missing_ok=True)
+
+    def section(self, text: str):
+        self.file.write(text)
+
+    def sections(self, rows, render: Callable[..., str]):
+        """Write one rendered section per row of an iterable such as a cursor"""
+        for row in rows:
+            self.file.write(render(*row))
+
+@dataclass
+class PipelinePhase:
+    """One step of the analytics pipeline and the phases it depends on.
+
+    An exclusive phase never runs alongside another phase; phases that start
+    a worker pool are exclusive so the pool has the CPUs to itself.
+    """
+    name: str
+    run: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    inputs: Optional[Callable[[], Any]] = None
+    reusable: Callable[[Any], bool] = lambda result: True
+    always_run: bool = False
+    exclusive: bool = False
+
+@dataclass
+class PhaseOutcome:
+    name: str
+    status: str
+    result: Any
+    input_hash: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int = 0
+
+def peak_rss_bytes() -> int:
+    """High-water resident set size of this process or its reaped workers.
+
+    The kernel keeps this mark for free, unlike tracemalloc which slows every
+    allocation, but it cannot be reset, so a phase's peak is the highest
+    footprint reached by the end of that phase rather than its own share.
+    """
+    import resource
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    scale = 1 if sys.platform == "darwin" else 1024
+    return scale * max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                       resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+class StackSampler:
+    """Counts the sampled Python stacks of one thread in collapsed-stack form.
+
+    cProfile only records caller/callee pairs, so the full stacks needed for
+    flame graphs are sampled from sys._current_frames on a background thread.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+
+    @staticmethod
+    def frame_label(code) -> str:
+        return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ",")
+
+    def _sample(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self.frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def write(self, path: Path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+class PhaseProfiler:
+    """Profiles phases of the analytics pipeline one at a time.
+
+    Each phase writes <phase>.pstats from cProfile, <phase>.collapsed with its
+    sampled stacks for flame graph tools, and <phase>.allocations.txt with the
+    source lines holding the most memory allocated during the phase. Memory is
+    only traced while a phase is profiled, and traces are cleared when a phase
+    starts to keep the snapshot small. Only the calling thread is profiled, so phases must not run concurrently; worker processes
+    are not profiled at all.
+    """
+
+    def __init__(self, output_dir: Path, logger: Optional[logging.Logger] = None, top: int = 10,
+                 sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.logger = logger or logging.getLogger(__name__)
+        self.top = top
+        self.sample_interval = sample_interval
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def profile(self, name: str):
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.clear_traces()
+
+        sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        profiler = cProfile.Profile()
+        sampler.start()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            sampler.stop()
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, module.__file__) for module in (tracemalloc, cProfile, threading)
+            ])
+            if started_tracing:
+                tracemalloc.stop()
+            self.write(name, profiler, sampler, snapshot.statistics('lineno'))
+
+    def write(self, name: str, profiler: cProfile.Profile, sampler: StackSampler, allocations: List):
+        profiler.dump_stats(self.output_dir / f"{name}.pstats")
+        sampler.write(self.output_dir / f"{name}.collapsed")
+
+        allocations = allocations[:self.top]
+        with open(self.output_dir / f"{name}.allocations.txt", 'w') as f:
+            for stat in allocations:
+                f.write(f"{stat}\n")
+
+        stats = pstats.Stats(profiler).sort_stats(pstats.SortKey.TIME)
+        self.logger.info(f"🔥 Phase {name} hottest functions ({self.output_dir / name}.pstats):")
+        for func in stats.fcn_list[:self.top]:
+            _, calls, self_time, total_time, _ = stats.stats[func]
+            filename, line, function = func
+            self.logger.info(f"   {self_time:8.3f}s self {total_time:8.3f}s total {calls:>9} calls  "
+                             f"{Path(filename).name}:{line}({function})")
+        for stat in allocations[:3]:
+            self.logger.info(f"   🧠 {stat}")
+
+class PipelineRunner:
+    """Runs pipeline phases as a dependency graph.
+
+    A phase starts as soon as the phases it depends on have finished, so
+    independent phases run concurrently in threads; an exclusive phase waits
+    for running phases to finish and holds back the rest until it is done. A
+    phase is skipped when the hash of its inputs and of its upstream phases
+    matches its last completed run. Every phase is recorded in analytics_metadata with its wall time, CPU
+    time and peak traced memory. With a profiler the phases run one at a time,
+    so each profile only covers its own phase.
+    """
+
+    def __init__(self, db_path: Path, force: bool = False, logger: Optional[logging.Logger] = None,
+                 profiler: Optional[PhaseProfiler] = None):
+        self.db_path = db_path
+        self.force = force
+        self.logger = logger or logging.getLogger(__name__)
+        self.profiler = profiler
+        self.run_id = f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+
+    def last_completed_run(self, phase_name: str) -> Optional[Dict]:
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        row = conn.execute('''
+            SELECT parameters, results_summary FROM analytics_metadata
+            WHERE analysis_type = 'pipeline_phase'
+              AND json_extract(parameters, '$.phase') = ?
+              AND json_extract(results_summary, '$.status') IN ('completed', 'skipped')
+            ORDER BY rowid DESC LIMIT 1
+        ''', (phase_name,)).fetchone()
+        conn.close()
+        if row is None:
+            return None
+        return {**json.loads(row[0]), **json.loads(row[1])}
+
+    def record(self, phase: PipelinePhase, outcome: PhaseOutcome):
+        parameters = {"run_id": self.run_id, "phase": phase.name, "depends_on": phase.depends_on,
+                      "input_hash": outcome.input_hash}
+        summary = {"status": outcome.status, "result": outcome.result, "cpu_time": outcome.cpu_time,
+                   "peak_memory_bytes": outcome.peak_memory}
+
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        with conn:
+            conn.execute('''
+                INSERT INTO analytics_metadata (id, analysis_type, parameters, results_summary, execution_time)
+                VALUES (?, 'pipeline_phase', ?, ?, ?)
+            ''', (f"{self.run_id}_{phase.name}", json.dumps(parameters), json.dumps(summary, default=str),
+                  outcome.wall_time))
+        conn.close()
+
+    def execute(self, phase: PipelinePhase, upstream: Dict[str, PhaseOutcome]) -> PhaseOutcome:
+        """Run one phase, or reuse its last result when nothing it reads has changed"""
+
+        inputs = phase.inputs() if phase.inputs else None
+        input_hash = content_hash((phase.name, inputs, [upstream[name].input_hash for name in phase.depends_on]))
+
+        previous = None if self.force or phase.always_run else self.last_completed_run(phase.name)
+        if previous and previous["input_hash"] == input_hash and phase.reusable(previous["result"]):
+            self.logger.info(f"⏭️ Phase {phase.name}: inputs unchanged, reusing last result")
+            outcome = PhaseOutcome(phase.name, "skipped", previous["result"], input_hash)
+            self.record(phase, outcome)
+            return outcome
+
+        self.logger.info(f"▶️ Phase {phase.name}: running")
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        status, result = "completed", None
+        try:
+            with self.profiler.profile(phase.name) if self.profiler else nullcontext():
+                result = phase.run()
+        except Exception as e:
+            status, result = "failed", str(e)
+            raise
+        finally:
+            outcome = PhaseOutcome(phase.name, status, result, input_hash, time.perf_counter() - wall_start,
+                                   time.thread_time() - cpu_start, peak_rss_bytes())
+            self.record(phase, outcome)
+
+        self.logger.info(f"✅ Phase {phase.name}: {outcome.wall_time:.2f}s wall, {outcome.cpu_time:.2f}s CPU, "
+                         f"{outcome.peak_memory / 1e6:.1f} MB peak RSS")
+        return outcome
+
+    def run(self, phases: List[PipelinePhase]) -> Dict[str, PhaseOutcome]:
+        """Execute all phases in dependency order, concurrently where possible"""
+
+        by_name = {phase.name: phase for phase in phases}
+        for phase in phases:
+            missing = set(phase.depends_on) - set(by_name)
+            if missing:
+                raise ValueError(f"Phase {phase.name} depends on unknown phases: {sorted(missing)}")
+
+        outcomes: Dict[str, PhaseOutcome] = {}
+        max_workers = 1 if self.profiler else len(phases)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline") as executor:
+            running = {}
+            while len(outcomes) < len(phases):
+                for phase in phases:
+                    ready = all(name in outcomes for name in phase.depends_on)
+                    if not ready or phase.name in outcomes or phase.name in running.values():
+                        continue
+                    if any(by_name[name].exclusive for name in running.values()):
+                        break
+                    if phase.exclusive and running:
+                        # Start nothing else, so the exclusive phase is not starved
+                        break
+                    running[executor.submit(self.execute, phase, outcomes)] = phase.name
+
+                if not running:
+                    raise ValueError("Pipeline phases contain a dependency cycle")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcomes[running.pop(future)] = future.result()
+
+        return outcomes
+
 class ScoringAnalyticsEngine:
     def __init__(self, eval_root: str = "/workspace/agentic-eval"):
         self.eval_root = Path(eval_root)
@@ -79,6 +2071,9 @@ class ScoringAnalyticsEngine:
         
         # Initialize analytics database
         self.init_analytics_database()
+        
+        # Typed scores shared by the analysis and visualization phases
+        self.score_frames = ScoreFrameCache(self.db_path)
 
     def setup_logging(self):
         """Setup analytics logging"""
@@ -127,7 +2122,10 @@ class ScoringAnalyticsEngine:
                     "significance_level": 0.05,
                     "effect_size_threshold": 0.3,
                     "min_sample_size": 10
-                }
+                },
+                "retention": dict(DEFAULT_RETENTION),
+                "trends": dict(DEFAULT_TRENDS),
+                "visualization": dict(DEFAULT_VISUALIZATION)
             }
             
             # Save default config
@@ -163,6 +2161,85 @@ class ScoringAnalyticsEngine:
             )
         ''')
         
+        # One score per evaluation result; older databases may hold duplicates
+        # from repeated full scans, so keep only the latest row per result first
+        has_result_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_scoring_metrics_result_id'"
+        ).fetchone()
+        if not has_result_index:
+            conn.execute('''
+                DELETE FROM scoring_metrics
+                WHERE rowid NOT IN (SELECT MAX(rowid) FROM scoring_metrics GROUP BY result_id)
+            ''')
+            conn.execute('''
+                CREATE UNIQUE INDEX idx_scoring_metrics_result_id ON scoring_metrics (result_id)
+            ''')
+        
+        # Covers the time-windowed trend queries over overall scores
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scoring_metrics_timestamp
+            ON scoring_metrics (scoring_timestamp, tool, overall_score)
+        ''')
+        
+        # Per-tool sufficient statistics, maintained as scores are written
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scoring_statistics (
+                tool TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                n INTEGER NOT NULL,
+                mean REAL NOT NULL,
+                m2 REAL NOT NULL,
+                updated_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tool, dimension)
+            )
+        ''')
+        
+        has_statistics = conn.execute("SELECT EXISTS (SELECT 1 FROM scoring_statistics)").fetchone()[0]
+        has_scores = conn.execute("SELECT EXISTS (SELECT 1 FROM scoring_metrics)").fetchone()[0]
+        if has_scores and not has_statistics:
+            rebuild_scoring_statistics(conn)
+        
+        # Score rollups per tool x language x category x complexity, maintained
+        # at write time so reports never rescan scoring_metrics
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scoring_rollups (
+                tool TEXT NOT NULL,
+                language TEXT NOT NULL,
+                category TEXT NOT NULL,
+                complexity_level INTEGER NOT NULL,
+                dimension TEXT NOT NULL,
+                n INTEGER NOT NULL,
+                total REAL NOT NULL,
+                total_sq REAL NOT NULL,
+                min_value REAL,
+                max_value REAL,
+                PRIMARY KEY (tool, language, category, complexity_level, dimension)
+            )
+        ''')
+        
+        has_rollups = conn.execute("SELECT EXISTS (SELECT 1 FROM scoring_rollups)").fetchone()[0]
+        if has_scores and not has_rollups:
+            rebuild_scoring_rollups(conn)
+        
+        # Per-tool t-digest quantile sketches (centroid means and weights as float64 pairs)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scoring_sketches (
+                tool TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                count REAL NOT NULL,
+                min_value REAL,
+                max_value REAL,
+                compression REAL NOT NULL,
+                centroids BLOB NOT NULL,
+                updated_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tool, dimension)
+            )
+        ''')
+        
+        has_sketches = conn.execute("SELECT EXISTS (SELECT 1 FROM scoring_sketches)").fetchone()[0]
+        if has_scores and not has_sketches:
+            rebuild_scoring_sketches(conn)
+        
         # Comparative analysis table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS comparative_analysis (
@@ -178,10 +2255,15 @@ class ScoringAnalyticsEngine:
                 p_value REAL,
                 effect_size REAL,
                 recommendation TEXT,
-                sample_size INTEGER
+                sample_size INTEGER,
+                confidence_intervals TEXT,
+                is_current INTEGER NOT NULL DEFAULT 0
             )
         ''')
         
+        # Databases created before bootstrap support lack the intervals column
+        add_missing_column(conn, 'comparative_analysis', 'confidence_intervals', 'TEXT')
+        
         # Performance insights table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS performance_insights (
@@ -191,7 +2273,84 @@ class ScoringAnalyticsEngine:
                 insight_value TEXT NOT NULL,
                 confidence REAL,
                 supporting_data TEXT,
-                generated_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                generated_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                is_current INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Both tables keep history; exactly one row per key is flagged current.
+        # Older databases get the flag on the latest row per key.
+        for table, (keys, _) in ANALYTICS_HISTORY_TABLES.items():
+            if add_missing_column(conn, table, 'is_current', 'INTEGER NOT NULL DEFAULT 0'):
+                conn.execute(f'''
+                    UPDATE {table} SET is_current = 1
+                    WHERE rowid IN (SELECT MAX(rowid) FROM {table} GROUP BY {', '.join(keys)})
+                ''')
+            conn.execute(f'''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_{table}_current
+                ON {table} ({', '.join(keys)}) WHERE is_current = 1
+            ''')
+        
+        # Scoring inputs extracted once per evaluation result; rescoring reads
+        # these compact columns instead of response text and metrics JSON
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scoring_features (
+                feature_rowid INTEGER PRIMARY KEY,
+                result_id TEXT NOT NULL UNIQUE,
+                tool TEXT NOT NULL,
+                language TEXT NOT NULL,
+                category TEXT NOT NULL,
+                complexity_level INTEGER NOT NULL,
+                response_length INTEGER,
+                response_hash TEXT,
+                execution_time REAL,
+                response_time REAL,
+                success BOOLEAN,
+                metric_code_quality_score REAL,
+                metric_functionality_score REAL,
+                metric_test_coverage REAL,
+                metrics_valid INTEGER NOT NULL,
+                feature_version INTEGER NOT NULL,
+                extracted_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        add_missing_column(conn, "scoring_features", "response_hash", "TEXT")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_scoring_features_response_hash ON scoring_features (response_hash)"
+        )
+        
+        # Code metrics memoized by SHA-256 of the response text
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS code_metrics (
+                response_hash TEXT PRIMARY KEY,
+                metrics_version INTEGER NOT NULL,
+                code_blocks INTEGER NOT NULL,
+                loc INTEGER NOT NULL,
+                functions INTEGER NOT NULL,
+                max_nesting INTEGER NOT NULL,
+                duplication REAL NOT NULL,
+                structure_score REAL NOT NULL,
+                innovation_base REAL NOT NULL,
+                analyzed_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Behaviour profile clusters of the five dimension scores, replaced on every clustering run
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS score_clusters (
+                result_id TEXT PRIMARY KEY,
+                cluster INTEGER NOT NULL,
+                distance REAL
+            )
+        ''')
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS cluster_centroids (
+                cluster INTEGER PRIMARY KEY,
+                size INTEGER NOT NULL,
+                {", ".join(f"{dimension} REAL" for dimension in SCORE_DIMENSIONS)},
+                components TEXT,
+                tool_counts TEXT,
+                created_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
@@ -208,78 +2367,269 @@ class ScoringAnalyticsEngine:
         ''')
         
         conn.commit()
+        
+        # Versioned indexes shared with the other results.db scripts
+        applied = migrate_results_db(conn, "scoring-analytics-engine")
+        if applied:
+            self.logger.info(f"🗄️ Applied results.db schema migrations {applied}")
+        
+        conn.close()
+
+    def iter_scoring_features(self, limit: Optional[int] = None, full_rescore: bool = False,
+                              chunk_size: int = 50000) -> Iterator[pd.DataFrame]:
+        """Stream stored scoring features in fixed-size chunks.
+
+        Chunks are paged by rowid, so no read transaction is held while
+        scores are written.
+        """
+        
+        query = scoring_feature_query(full_rescore) + " LIMIT ?"
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            last_rowid = MIN_ROWID
+            remaining = limit
+            
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = pd.read_sql_query(query, conn, params=(last_rowid, MAX_ROWID, size))
+                if chunk.empty:
+                    break
+                
+                last_rowid = int(chunk['source_rowid'].iloc[-1])
+                if remaining is not None:
+                    remaining -= len(chunk)
+                
+                yield chunk
+        finally:
+            conn.close()
+
+    def refresh_scoring_features(self, chunk_size: int = 50000) -> int:
+        """Extract features for evaluation results not yet in scoring_features.
+
+        Results whose metrics JSON is invalid are reported once here; incremental
+        scoring runs skip them from then on.
+        """
+        
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        try:
+            last_rowid = conn.execute("SELECT COALESCE(MAX(feature_rowid), 0) FROM scoring_features").fetchone()[0]
+            extracted = populate_scoring_features(conn, chunk_size)
+            invalid = conn.execute('''
+                SELECT result_id FROM scoring_features
+                WHERE feature_rowid > ? AND success = 1 AND metrics_valid = 0
+                ORDER BY feature_rowid
+            ''', (last_rowid,)).fetchall() if extracted else []
+        finally:
+            conn.close()
+        
+        for (result_id,) in invalid:
+            self.logger.error(f"Error calculating scores for result {result_id}: invalid metrics JSON")
+        if extracted:
+            self.logger.info(f"🧮 Extracted scoring features for {extracted} results")
+        return extracted
+
+    def changed_scoring_config_sections(self) -> List[str]:
+        """Score-determining config sections changed since scores were last written"""
+        
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT parameters FROM analytics_metadata WHERE id = 'scoring_config_applied'"
+        ).fetchone()
+        conn.close()
+        
+        if row is None:
+            return []
+        
+        applied = json.loads(row[0])
+        return [section for section, digest in scoring_config_hashes(self.scoring_config).items()
+                if applied.get(section) != digest]
+
+    def record_scoring_config(self):
+        """Remember the config sections the stored scores were computed with"""
+        
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        with conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO analytics_metadata (id, analysis_type, parameters)
+                VALUES ('scoring_config_applied', 'scoring_config', ?)
+            ''', (json.dumps(scoring_config_hashes(self.scoring_config)),))
         conn.close()
 
-    def calculate_comprehensive_scores(self, limit: Optional[int] = None) -> List[ScoringMetrics]:
-        """Calculate comprehensive scoring metrics for all evaluation results"""
+    def reweight_scores(self) -> int:
+        """Apply changed weights to stored scores without rescoring.
         
-        self.logger.info("📊 Calculating comprehensive scores...")
+        overall_score is a linear combination of the stored dimension scores,
+        so one UPDATE replaces it; only the overall_score aggregates are rebuilt.
+        """
         
-        # Load evaluation results
-        query = '''
-            SELECT id, tool, language, category, complexity_level, 
-                   response, execution_time, response_time, metrics, success
-            FROM evaluation_results 
-            WHERE success = 1
-        '''
+        start_time = time.time()
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        try:
+            with conn:
+                reweighted = reweight_overall_scores(conn, self.scoring_config["weights"])
+                rebuild_scoring_statistics(conn, ['overall_score'])
+                rebuild_scoring_rollups(conn, ['overall_score'])
+                rebuild_scoring_sketches(conn, dimensions=['overall_score'])
+        finally:
+            conn.close()
+        
+        self.logger.info(f"⚖️ Reweighted overall scores of {reweighted} results in {time.time() - start_time:.2f}s")
+        return reweighted
+
+    def refresh_code_metrics(self, workers: int = 1) -> int:
+        """Analyze the code of responses not yet in the code_metrics cache"""
+        
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        try:
+            analyzed = populate_code_metrics(conn, workers)
+        finally:
+            conn.close()
         
-        if limit:
-            query += f" LIMIT {limit}"
+        if analyzed:
+            self.logger.info(f"🔍 Analyzed code metrics of {analyzed} distinct responses")
+        return analyzed
+
+    def scoring_shards(self, shard_size: int) -> List[Tuple[int, int]]:
+        """Split scoring_features into rowid ranges (start, end] of about shard_size rows"""
         
         conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(query, conn)
+        low, high = conn.execute(
+            "SELECT MIN(feature_rowid), MAX(feature_rowid) FROM scoring_features WHERE success = 1"
+        ).fetchone()
         conn.close()
         
-        scoring_results = []
+        if low is None:
+            return []
         
-        for _, row in df.iterrows():
-            try:
-                # Parse metrics
-                metrics = json.loads(row['metrics']) if row['metrics'] else {}
-                
-                # Calculate individual scores
-                code_quality = self.calculate_code_quality_score(row, metrics)
-                functionality = self.calculate_functionality_score(row, metrics)
-                performance = self.calculate_performance_score(row, metrics)
-                maintainability = self.calculate_maintainability_score(row, metrics)
-                innovation = self.calculate_innovation_score(row, metrics)
-                
-                # Calculate overall score
-                weights = self.scoring_config["weights"]
-                overall_score = (
-                    code_quality * weights["code_quality"] +
-                    functionality * weights["functionality"] +
-                    performance * weights["performance"] +
-                    maintainability * weights["maintainability"] +
-                    innovation * weights["innovation"]
-                )
-                
-                # Calculate confidence level
-                confidence = self.calculate_confidence_level(row, metrics)
-                
-                scoring_metric = ScoringMetrics(
-                    code_quality_score=code_quality,
-                    functionality_score=functionality,
-                    performance_score=performance,
-                    maintainability_score=maintainability,
-                    innovation_score=innovation,
-                    overall_score=overall_score,
-                    confidence_level=confidence,
-                    scoring_timestamp=datetime.now().isoformat()
-                )
+        return [(start, min(start + shard_size, high)) for start in range(low - 1, high, shard_size)]
+
+    def iter_scored_shards(self, workers: int, full_rescore: bool = False,
+                           shard_size: int = 50000) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Score rowid shards in a process pool, yielding results as workers finish.
+
+        At most two shards per worker are in flight, so finished shards never
+        pile up faster than the single writer in the parent can drain them.
+        """
+        
+        shards = self.scoring_shards(shard_size)
+        self.logger.info(f"⚙️ Scoring {len(shards)} shards with {workers} workers")
+        
+        with worker_process_pool(workers) as executor:
+            pending = set()
+            for start, end in shards:
+                pending.add(executor.submit(score_rowid_range, str(self.db_path), self.scoring_config,
+                                            start, end, full_rescore))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            
+            for future in as_completed(pending):
+                yield future.result()
+
+    def score_evaluation_results(self, limit: Optional[int] = None, batch_size: int = 5000,
+                                 full_rescore: bool = False, chunk_size: int = 50000,
+                                 on_scored: Optional[Callable[[pd.DataFrame, pd.DataFrame, str], None]] = None,
+                                 workers: int = 1) -> int:
+        """Score evaluation results chunk by chunk and upsert them into scoring_metrics.
+
+        By default only results without a scoring_metrics row are scored, so a
+        run costs time proportional to new evaluations; `full_rescore` rescans
+        every successful result and overwrites its existing scores. Peak memory
+        is bounded by `chunk_size` regardless of table size. With `workers` > 1
+        rowid shards are scored in parallel processes and funnelled into one writer.
+        
+        Scores are computed from scoring_features; features of new results are
+        extracted first, so response text and metrics JSON are read only once
+        per result and a rescore touches only the compact feature columns.
+        Code metrics are analyzed once per distinct response text.
+        
+        A config change since the last run is applied to stored scores first:
+        a weights-only change is a single UPDATE of overall_score, any other
+        scoring section triggers a full rescore.
+        """
+        
+        changed_sections = self.changed_scoring_config_sections()
+        if changed_sections == ['weights'] and not full_rescore:
+            self.reweight_scores()
+        elif changed_sections and not full_rescore:
+            self.logger.info(f"🔧 Scoring config changed ({', '.join(changed_sections)}), rescoring all results")
+            full_rescore = True
+        
+        mode = "full rescore" if full_rescore else "incremental"
+        self.logger.info(f"📊 Calculating comprehensive scores ({mode})...")
+        
+        self.refresh_scoring_features(chunk_size)
+        self.refresh_code_metrics(workers)
+        
+        if workers > 1 and limit:
+            self.logger.warning("--limit is not supported with multiple workers, scoring in a single process")
+            workers = 1
+        
+        if workers > 1:
+            scored_chunks = self.iter_scored_shards(workers, full_rescore, chunk_size)
+        else:
+            scorer = VectorizedScorer(self.scoring_config)
+            scored_chunks = (
+                (features, scorer.score_frame(features[features['metrics_valid'].to_numpy(dtype=bool)]))
+                for features in self.iter_scoring_features(limit, full_rescore, chunk_size)
+            )
+        
+        scored_count = 0
+        
+        with ScoringMetricsWriter(self.db_path, batch_size) as writer:
+            for features, scores in scored_chunks:
+                valid = features['metrics_valid'].to_numpy(dtype=bool)
+                for result_id in features.loc[~valid, 'id']:
+                    self.logger.error(f"Error calculating scores for result {result_id}: invalid metrics JSON")
                 
-                scoring_results.append(scoring_metric)
+                features = features[valid]
+                scoring_timestamp = datetime.now().isoformat()
                 
-                # Store in database
-                self.store_scoring_metrics(row['id'], scoring_metric)
+                writer.add_frame(features, scores, scoring_timestamp)
+                scored_count += len(features)
                 
-            except Exception as e:
-                self.logger.error(f"Error calculating scores for result {row['id']}: {e}")
-                continue
+                if on_scored:
+                    on_scored(features, scores, scoring_timestamp)
+        
+        if not (limit and full_rescore):
+            self.record_scoring_config()
+        
+        self.logger.info(f"✅ Calculated scores for {scored_count} results")
+        return scored_count
+
+    def calculate_comprehensive_scores(self, limit: Optional[int] = None,
+                                       batch_size: int = 5000,
+                                       full_rescore: bool = False,
+                                       chunk_size: int = 50000,
+                                       workers: int = 1) -> List[ScoringMetrics]:
+        """Calculate comprehensive scoring metrics and return them as ScoringMetrics"""
         
-        self.logger.info(f"✅ Calculated scores for {len(scoring_results)} results")
+        scoring_results = []
+        
+        def collect(features: pd.DataFrame, scores: pd.DataFrame, scoring_timestamp: str):
+            for row in scores.itertuples(index=False):
+                scoring_results.append(ScoringMetrics(
+                    code_quality_score=row.code_quality_score,
+                    functionality_score=row.functionality_score,
+                    performance_score=row.performance_score,
+                    maintainability_score=row.maintainability_score,
+                    innovation_score=row.innovation_score,
+                    overall_score=row.overall_score,
+                    confidence_level=row.confidence_level,
+                    scoring_timestamp=scoring_timestamp
+                ))
+        
+        self.score_evaluation_results(limit, batch_size, full_rescore, chunk_size, on_scored=collect,
+                                      workers=workers)
         return scoring_results
 
+    def factor(self, table: str, key: str) -> float:
+        """One entry of a factor table, honouring the config's "factors" overrides"""
+        
+        return self.scoring_config.get("factors", {}).get(table, {}).get(key, FACTOR_TABLES[table].get(key, 1.0))
+
     def calculate_code_quality_score(self, row: pd.Series, metrics: Dict) -> float:
         """Calculate code quality score based on multiple factors"""
         
@@ -293,15 +2643,7 @@ class ScoringAnalyticsEngine:
         length_factor = min(response_length / 1000, 1.0) * 0.1
         
         # Language-specific adjustments
-        language_factors = {
-            "python": 1.0,
-            "typescript": 0.95,
-            "rust": 1.05,
-            "go": 0.98,
-            "nushell": 0.92
-        }
-        
-        language_factor = language_factors.get(row['language'], 1.0)
+        language_factor = self.factor('language_quality', row['language'])
         
         final_score = (base_score + complexity_bonus + length_factor) * language_factor
         return min(max(final_score, 0.0), 1.0)
@@ -312,15 +2654,7 @@ class ScoringAnalyticsEngine:
         base_score = metrics.get("functionality_score", 0.8)
         
         # Category-specific expectations
-        category_weights = {
-            "ui-components": 1.0,
-            "apis": 1.05,
-            "cli-tools": 0.95,
-            "web-apps": 1.02,
-            "data-processing": 0.98
-        }
-        
-        category_weight = category_weights.get(row['category'], 1.0)
+        category_weight = self.factor('category_functionality', row['category'])
         
         # Success rate impact (this would be actual test success in real implementation)
         success_rate = 1.0 if row['success'] else 0.0
@@ -345,12 +2679,7 @@ class ScoringAnalyticsEngine:
         memory_efficiency = 1.0  # Default, would use actual memory metrics
         
         # Tool-specific performance characteristics
-        tool_factors = {
-            "claude-code": 1.0,
-            "gemini-cli": 1.02  # Slight advantage for optimization
-        }
-        
-        tool_factor = tool_factors.get(row['tool'], 1.0)
+        tool_factor = self.factor('tool_performance', row['tool'])
         
         final_score = time_score * memory_efficiency * tool_factor
         return min(max(final_score, 0.0), 1.0)
@@ -364,19 +2693,11 @@ class ScoringAnalyticsEngine:
         # Documentation quality (proxy: response length with good structure)
         doc_score = min(len(row['response']) / 2000, 1.0) * 0.3 + 0.7
         
-        # Code structure (would analyze actual code structure in real implementation)
-        structure_score = 0.85
+        # Code structure of the response's code blocks
+        structure_score = analyze_response(row['response'], row['language']).structure_score
         
         # Language-specific maintainability factors
-        language_maintainability = {
-            "python": 0.95,
-            "typescript": 1.0,
-            "rust": 1.05,
-            "go": 1.02,
-            "nushell": 0.90
-        }
-        
-        language_factor = language_maintainability.get(row['language'], 1.0)
+        language_factor = self.factor('language_maintainability', row['language'])
         
         final_score = (test_coverage * 0.4 + doc_score * 0.3 + structure_score * 0.3) * language_factor
         return min(max(final_score, 0.0), 1.0)
@@ -384,30 +2705,17 @@ class ScoringAnalyticsEngine:
     def calculate_innovation_score(self, row: pd.Series, metrics: Dict) -> float:
         """Calculate innovation score based on uniqueness and creativity"""
         
-        # Base innovation score (would analyze code patterns in real implementation)
-        base_innovation = 0.75
+        # Base innovation score from the response's code patterns
+        base_innovation = analyze_response(row['response'], row['language']).innovation_base
         
         # Complexity bonus for innovation
         complexity_innovation = row['complexity_level'] * 0.08
         
         # Tool-specific innovation characteristics
-        tool_innovation = {
-            "claude-code": 1.05,  # Slight advantage for creative solutions
-            "gemini-cli": 1.0
-        }
-        
-        tool_factor = tool_innovation.get(row['tool'], 1.0)
+        tool_factor = self.factor('tool_innovation', row['tool'])
         
         # Category-specific innovation expectations
-        category_innovation = {
-            "ui-components": 1.1,
-            "apis": 0.9,
-            "cli-tools": 0.95,
-            "web-apps": 1.05,
-            "data-processing": 0.85
-        }
-        
-        category_factor = category_innovation.get(row['category'], 1.0)
+        category_factor = self.factor('category_innovation', row['category'])
         
         final_score = (base_innovation + complexity_innovation) * tool_factor * category_factor
         return min(max(final_score, 0.0), 1.0)
@@ -431,66 +2739,74 @@ class ScoringAnalyticsEngine:
         return min(max(final_confidence, 0.0), 1.0)
 
     def store_scoring_metrics(self, result_id: str, scoring_metric: ScoringMetrics):
-        """Store scoring metrics in database"""
-        
-        conn = sqlite3.connect(self.db_path)
-        
-        scoring_id = f"score_{result_id}_{int(datetime.now().timestamp())}"
-        
-        # Get tool info from original result
-        result_query = "SELECT tool, language, category, complexity_level FROM evaluation_results WHERE id = ?"
-        result_row = conn.execute(result_query, (result_id,)).fetchone()
+        """Store scoring metrics for a single result in database"""
         
-        if result_row:
-            tool, language, category, complexity_level = result_row
+        with ScoringMetricsWriter(self.db_path) as writer:
+            # Get tool info from original result
+            result_query = "SELECT tool, language, category, complexity_level FROM evaluation_results WHERE id = ?"
+            result_row = writer.conn.execute(result_query, (result_id,)).fetchone()
             
-            conn.execute('''
-                INSERT INTO scoring_metrics 
-                (id, result_id, tool, language, category, complexity_level,
-                 code_quality_score, functionality_score, performance_score, 
-                 maintainability_score, innovation_score, overall_score, 
-                 confidence_level, scoring_method, scoring_timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                scoring_id, result_id, tool, language, category, complexity_level,
-                scoring_metric.code_quality_score, scoring_metric.functionality_score,
-                scoring_metric.performance_score, scoring_metric.maintainability_score,
-                scoring_metric.innovation_score, scoring_metric.overall_score,
-                scoring_metric.confidence_level, "comprehensive_v1", scoring_metric.scoring_timestamp
-            ))
-        
-        conn.commit()
-        conn.close()
+            if result_row:
+                writer.add(result_id, *result_row, scoring_metric)
 
-    def perform_statistical_analysis(self) -> List[ComparativeAnalysis]:
-        """Perform comprehensive statistical analysis between tools"""
+    def perform_statistical_analysis(self, bootstrap: bool = False, n_resamples: int = 10000,
+                                     seed: int = 42, omnibus: Optional[str] = None,
+                                     bootstrap_method: str = "exact") -> List[ComparativeAnalysis]:
+        """Perform comprehensive statistical analysis between tools.
+
+        Works from the per-tool sufficient statistics in scoring_statistics, so
+        the cost depends on the number of tools, not on the number of scores.
+        With `bootstrap`, confidence intervals for the overall and per-category
+        score differences are added from a seeded bootstrap of each tool's scores,
+        exact unless `bootstrap_method` is "stratified" (see BootstrapEngine).
+        With `omnibus` ("anova" or "kruskal"), all tools are also compared at
+        once, see perform_omnibus_analysis.
+        """
         
         self.logger.info("📈 Performing statistical analysis...")
         
-        # Load scoring data
-        query = '''
-            SELECT tool, language, category, complexity_level, overall_score, 
-                   code_quality_score, functionality_score, performance_score,
-                   maintainability_score, innovation_score, confidence_level
-            FROM scoring_metrics
-        '''
-        
         conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(query, conn)
+        statistics = load_scoring_statistics(conn)
         conn.close()
         
-        if df.empty:
+        if not statistics:
             self.logger.warning("No scoring data available for analysis")
             return []
         
+        # The omnibus tests need a variance, so tools with a single score do not count
+        comparable = [tool for tool in statistics
+                      if statistics[tool].get('overall_score', RunningStatistics()).n > 1]
+        if omnibus and len(comparable) < 2:
+            self.logger.warning(f"⚠️ Skipping {omnibus} omnibus comparison: "
+                                f"{len(comparable)} tools have more than one score")
+        elif omnibus:
+            omnibus_analysis = self.perform_omnibus_analysis(omnibus)
+            self.logger.info(f"📈 {omnibus} across {len(omnibus_analysis.tools)} tools: "
+                             f"statistic={omnibus_analysis.statistic:.3f}, p={omnibus_analysis.p_value:.4g}")
+        
         analyses = []
         
         # Compare each pair of tools
-        tools = df['tool'].unique()
+        tools = list(statistics)
+        
+        resampled_means = {}
+        if bootstrap:
+            significance_level = self.scoring_config["statistical_tests"]["significance_level"]
+            bootstrap_engine = BootstrapEngine(n_resamples, seed, confidence=1 - significance_level,
+                                               method=bootstrap_method)
+            self.logger.info(f"📈 Bootstrapping {n_resamples} {bootstrap_method} resamples per tool")
+            resampled_means = self.bootstrap_tool_means(bootstrap_engine)
         
         for i, tool_a in enumerate(tools):
             for tool_b in tools[i+1:]:
-                analysis = self.compare_tools_statistically(df, tool_a, tool_b)
+                analysis = self.compare_tools_from_statistics(statistics, tool_a, tool_b)
+                
+                if tool_a in resampled_means and tool_b in resampled_means:
+                    intervals = bootstrap_engine.difference_intervals(resampled_means[tool_a], resampled_means[tool_b])
+                    for dimension, (low, high) in zip(STATISTICS_DIMENSIONS, intervals):
+                        key = 'score_difference' if dimension == 'overall_score' else dimension
+                        analysis.confidence_intervals[key] = (float(low), float(high))
+                
                 analyses.append(analysis)
                 
                 # Store analysis
@@ -498,33 +2814,120 @@ class ScoringAnalyticsEngine:
         
         return analyses
 
+    def bootstrap_tool_means(self, bootstrap_engine: BootstrapEngine) -> Dict[str, np.ndarray]:
+        """Resample every tool's scores once, returning bootstrap means per dimension"""
+        
+        df = self.score_frames.get()[['tool'] + STATISTICS_DIMENSIONS].dropna()
+        
+        return {
+            tool: bootstrap_engine.resample_means(tool, tool_data[STATISTICS_DIMENSIONS].to_numpy(dtype=np.float64))
+            for tool, tool_data in df.groupby('tool', observed=True)
+        }
+
+    def perform_omnibus_analysis(self, test: str = "kruskal", dimension: str = "overall_score") -> OmnibusAnalysis:
+        """Compare all tools at once with one omnibus test and a pairwise matrix.
+
+        ANOVA works purely from scoring_statistics; Kruskal-Wallis ranks all
+        scores of the dimension in one pass. Pairwise p-values (pooled t-tests
+        or Dunn's tests) are Bonferroni adjusted.
+        """
+        
+        self.logger.info(f"📈 Performing {test} omnibus comparison of all tools...")
+        
+        conn = sqlite3.connect(self.db_path)
+        statistics = load_scoring_statistics(conn)
+        tools = [tool for tool in statistics if statistics[tool].get(dimension, RunningStatistics()).n > 1]
+        
+        n = np.array([statistics[tool][dimension].n for tool in tools], dtype=np.float64)
+        mean = np.array([statistics[tool][dimension].mean for tool in tools])
+        m2 = np.array([statistics[tool][dimension].m2 for tool in tools])
+        
+        if len(tools) < 2:
+            conn.close()
+            raise ValueError("An omnibus comparison needs at least two tools with scores")
+        
+        if test == "anova":
+            statistic, p_value, effect_size, pairwise_p = anova_from_statistics(n, mean, m2)
+        elif test == "kruskal":
+            scores = self.score_frames.get()[['tool', dimension]].dropna()
+            codes = pd.Categorical(scores['tool'].astype(str), categories=tools).codes
+            keep = codes >= 0
+            statistic, p_value, effect_size, pairwise_p = kruskal_wallis(
+                codes[keep], scores[dimension].to_numpy(dtype=np.float64)[keep], len(tools))
+        else:
+            conn.close()
+            raise ValueError(f"Unknown omnibus test: {test}")
+        conn.close()
+        
+        comparisons = len(tools) * (len(tools) - 1) / 2
+        pairwise_p = np.minimum(pairwise_p * comparisons, 1.0)
+        np.fill_diagonal(pairwise_p, 1.0)
+        
+        analysis = OmnibusAnalysis(
+            test=test,
+            dimension=dimension,
+            tools=tools,
+            statistic=statistic,
+            p_value=p_value,
+            effect_size=effect_size,
+            significant=p_value < self.scoring_config["statistical_tests"]["significance_level"],
+            effect_size_matrix=pairwise_cohens_d(n, mean, m2).tolist(),
+            pairwise_p_values=pairwise_p.tolist()
+        )
+        
+        self.store_omnibus_analysis(analysis)
+        return analysis
+
+    def store_omnibus_analysis(self, analysis: OmnibusAnalysis):
+        """Record an omnibus comparison in analytics_metadata"""
+        
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        conn.execute('''
+            INSERT INTO analytics_metadata (id, analysis_type, parameters, results_summary)
+            VALUES (?, 'omnibus_comparison', ?, ?)
+        ''', (
+            f"omnibus_{analysis.test}_{analysis.dimension}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
+            json.dumps({"test": analysis.test, "dimension": analysis.dimension, "tools": analysis.tools}),
+            json.dumps(asdict(analysis))
+        ))
+        conn.commit()
+        conn.close()
+
     def compare_tools_statistically(self, df: pd.DataFrame, tool_a: str, tool_b: str) -> ComparativeAnalysis:
         """Perform statistical comparison between two tools"""
         
-        # Filter data for each tool
-        data_a = df[df['tool'] == tool_a]
-        data_b = df[df['tool'] == tool_b]
+        return self.compare_tools_from_statistics(summarize_scores(df), tool_a, tool_b)
+
+    def compare_tools_from_statistics(self, statistics: Dict[str, Dict[str, RunningStatistics]],
+                                      tool_a: str, tool_b: str) -> ComparativeAnalysis:
+        """Perform statistical comparison between two tools from their sufficient statistics"""
+        
+        stats_a = statistics.get(tool_a, {})
+        stats_b = statistics.get(tool_b, {})
         
         # Overall scores comparison
-        scores_a = data_a['overall_score'].values
-        scores_b = data_b['overall_score'].values
+        overall_a = stats_a.get('overall_score', RunningStatistics())
+        overall_b = stats_b.get('overall_score', RunningStatistics())
         
         # Perform t-test
-        if len(scores_a) >= 3 and len(scores_b) >= 3:
-            t_stat, p_value = stats.ttest_ind(scores_a, scores_b)
+        if overall_a.n >= 3 and overall_b.n >= 3:
+            from scipy import stats
+            
+            t_stat, p_value = stats.ttest_ind_from_stats(
+                overall_a.mean, overall_a.std, overall_a.n,
+                overall_b.mean, overall_b.std, overall_b.n
+            )
             
             # Calculate effect size (Cohen's d)
-            pooled_std = np.sqrt(((len(scores_a) - 1) * np.var(scores_a, ddof=1) + 
-                                 (len(scores_b) - 1) * np.var(scores_b, ddof=1)) / 
-                                (len(scores_a) + len(scores_b) - 2))
-            effect_size = (np.mean(scores_a) - np.mean(scores_b)) / pooled_std if pooled_std > 0 else 0
+            pooled_std = np.sqrt((overall_a.m2 + overall_b.m2) / (overall_a.n + overall_b.n - 2))
+            effect_size = (overall_a.mean - overall_b.mean) / pooled_std if pooled_std > 0 else 0
         else:
             t_stat, p_value = 0, 1.0
             effect_size = 0
         
         # Determine winner
-        mean_a = np.mean(scores_a) if len(scores_a) > 0 else 0
-        mean_b = np.mean(scores_b) if len(scores_b) > 0 else 0
+        mean_a = overall_a.mean if overall_a.n > 0 else 0
+        mean_b = overall_b.mean if overall_b.n > 0 else 0
         score_difference = mean_a - mean_b
         
         significance_level = self.scoring_config["statistical_tests"]["significance_level"]
@@ -540,15 +2943,10 @@ class ScoringAnalyticsEngine:
             statistical_significance = False
         
         # Category-wise comparison
-        score_categories = ['code_quality_score', 'functionality_score', 'performance_score', 
-                          'maintainability_score', 'innovation_score']
-        
         category_scores = {}
-        for category in score_categories:
-            if category in data_a.columns and category in data_b.columns:
-                cat_mean_a = data_a[category].mean()
-                cat_mean_b = data_b[category].mean()
-                category_scores[category] = cat_mean_a - cat_mean_b
+        for category in SCORE_DIMENSIONS:
+            if category in stats_a and category in stats_b:
+                category_scores[category] = stats_a[category].mean - stats_b[category].mean
         
         # Generate recommendation
         recommendation = self.generate_tool_recommendation(
@@ -603,21 +3001,27 @@ class ScoringAnalyticsEngine:
     def store_comparative_analysis(self, analysis: ComparativeAnalysis):
         """Store comparative analysis in database"""
         
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=60)
         
-        analysis_id = f"analysis_{analysis.tool_a}_{analysis.tool_b}_{int(datetime.now().timestamp())}"
+        analysis_id = f"analysis_{analysis.tool_a}_{analysis.tool_b}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
         
+        # The new row replaces the pair's current analysis; older rows stay as history
+        conn.execute('''
+            UPDATE comparative_analysis SET is_current = 0
+            WHERE tool_a = ? AND tool_b = ? AND is_current = 1
+        ''', (analysis.tool_a, analysis.tool_b))
         conn.execute('''
             INSERT INTO comparative_analysis 
             (id, tool_a, tool_b, winner, confidence, score_difference,
              category_scores, statistical_significance, p_value, effect_size,
-             recommendation, sample_size)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             recommendation, sample_size, confidence_intervals, is_current)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
         ''', (
             analysis_id, analysis.tool_a, analysis.tool_b, analysis.winner,
             analysis.confidence, analysis.score_difference, 
             json.dumps(analysis.category_scores), analysis.statistical_significance,
-            analysis.p_value, analysis.effect_size, analysis.recommendation, 0
+            analysis.p_value, analysis.effect_size, analysis.recommendation, 0,
+            json.dumps(analysis.confidence_intervals) if analysis.confidence_intervals else None
         ))
         
         conn.commit()
@@ -628,24 +3032,15 @@ class ScoringAnalyticsEngine:
         
         self.logger.info("🔍 Generating performance insights...")
         
-        # Load comprehensive data
-        query = '''
-            SELECT s.tool, s.language, s.category, s.complexity_level,
-                   s.overall_score, s.code_quality_score, s.functionality_score,
-                   s.performance_score, s.maintainability_score, s.innovation_score,
-                   s.confidence_level
-            FROM scoring_metrics s
-        '''
-        
+        # Rollups hold one row per tool x language x category x complexity cell
         conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(query, conn)
+        rollups = load_scoring_rollups(conn)
         conn.close()
         
         insights = []
         
-        for tool in df['tool'].unique():
-            tool_data = df[df['tool'] == tool]
-            insight = self.analyze_tool_performance(tool, tool_data)
+        for tool, tool_rollups in rollups.groupby('tool', sort=False):
+            insight = self.analyze_tool_performance(tool, tool_rollups)
             insights.append(insight)
             
             # Store insights
@@ -653,11 +3048,15 @@ class ScoringAnalyticsEngine:
         
         return insights
 
-    def analyze_tool_performance(self, tool: str, data: pd.DataFrame) -> PerformanceInsights:
-        """Analyze performance patterns for a specific tool"""
+    def analyze_tool_performance(self, tool: str, rollups: pd.DataFrame) -> PerformanceInsights:
+        """Analyze performance patterns for a specific tool from its score rollups"""
+        
+        overall = rollups[rollups['dimension'] == 'overall_score']
+        dimension_means = rollup_moments(rollups, ['dimension'])['mean']
+        overall_moments = rollup_moments(overall, ['dimension']).iloc[0]
         
         # Identify strengths (top-performing categories)
-        category_means = data.groupby('category')['overall_score'].mean().sort_values(ascending=False)
+        category_means = rollup_moments(overall, ['category'])['mean'].sort_index().sort_values(ascending=False)
         strengths = category_means.head(2).index.tolist()
         
         # Identify weaknesses (low-performing categories)  
@@ -667,28 +3066,28 @@ class ScoringAnalyticsEngine:
         optimal_cases = []
         
         # High code quality -> production use
-        if data['code_quality_score'].mean() > 0.85:
+        if dimension_means.get('code_quality_score', 0) > 0.85:
             optimal_cases.append("Production-quality code generation")
         
         # High performance -> time-sensitive tasks
-        if data['performance_score'].mean() > 0.8:
+        if dimension_means.get('performance_score', 0) > 0.8:
             optimal_cases.append("Time-sensitive development tasks")
         
         # High innovation -> creative projects
-        if data['innovation_score'].mean() > 0.8:
+        if dimension_means.get('innovation_score', 0) > 0.8:
             optimal_cases.append("Creative and innovative solutions")
         
         # High complexity performance
-        high_complexity_data = data[data['complexity_level'] >= 4]
-        if not high_complexity_data.empty and high_complexity_data['overall_score'].mean() > 0.8:
+        high_complexity = overall[overall['complexity_level'] >= 4]
+        if not high_complexity.empty and high_complexity['total'].sum() / high_complexity['n'].sum() > 0.8:
             optimal_cases.append("Complex, advanced implementations")
         
         # Performance trends
         trends = {
-            "avg_overall_score": data['overall_score'].mean(),
-            "score_consistency": 1 - data['overall_score'].std(),
-            "complexity_scaling": self.calculate_complexity_scaling(data),
-            "language_versatility": len(data['language'].unique()) / 5.0  # Normalize to max 5 languages
+            "avg_overall_score": float(overall_moments['mean']),
+            "score_consistency": float(1 - overall_moments['std']),
+            "complexity_scaling": self.calculate_complexity_scaling(overall),
+            "language_versatility": overall['language'].nunique() / 5.0  # Normalize to max 5 languages
         }
         
         # Predictive score (overall capability prediction)
@@ -708,14 +3107,22 @@ class ScoringAnalyticsEngine:
             predictive_score=predictive_score
         )
 
-    def calculate_complexity_scaling(self, data: pd.DataFrame) -> float:
+    def calculate_complexity_scaling(self, overall_rollups: pd.DataFrame) -> float:
         """Calculate how well a tool scales with complexity"""
         
-        if data['complexity_level'].nunique() < 3:
+        if overall_rollups['complexity_level'].nunique() < 3:
             return 0.5  # Default if insufficient data
         
-        # Calculate correlation between complexity and performance
-        correlation = data['complexity_level'].corr(data['overall_score'])
+        # Pearson correlation between complexity and overall score; complexity is
+        # constant within a rollup cell, so the cross moments follow from the sums
+        complexity = overall_rollups['complexity_level'].to_numpy(dtype=np.float64)
+        n = overall_rollups['n'].to_numpy(dtype=np.float64)
+        total = overall_rollups['total'].to_numpy(dtype=np.float64)
+        count = n.sum()
+        covariance = count * (complexity * total).sum() - (complexity * n).sum() * total.sum()
+        complexity_spread = count * (complexity ** 2 * n).sum() - (complexity * n).sum() ** 2
+        score_spread = count * overall_rollups['total_sq'].sum() - total.sum() ** 2
+        correlation = covariance / np.sqrt(complexity_spread * score_spread) if score_spread > 0 else float('nan')
         
         # Convert correlation to scaling score (less negative = better scaling)
         scaling_score = max(0, 1 + correlation)  # -1 to 1 -> 0 to 2, then clamp
@@ -724,7 +3131,7 @@ class ScoringAnalyticsEngine:
     def store_performance_insights(self, insight: PerformanceInsights):
         """Store performance insights in database"""
         
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=60)
         
         # Store each type of insight separately
         insights_data = [
@@ -736,12 +3143,17 @@ class ScoringAnalyticsEngine:
         ]
         
         for insight_type, insight_value in insights_data:
-            insight_id = f"insight_{insight.tool}_{insight_type}_{int(datetime.now().timestamp())}"
+            insight_id = f"insight_{insight.tool}_{insight_type}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
             
+            # The new row replaces the current insight of this type; older rows stay as history
+            conn.execute('''
+                UPDATE performance_insights SET is_current = 0
+                WHERE tool = ? AND insight_type = ? AND is_current = 1
+            ''', (insight.tool, insight_type))
             conn.execute('''
                 INSERT INTO performance_insights 
-                (id, tool, insight_type, insight_value, confidence, supporting_data)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (id, tool, insight_type, insight_value, confidence, supporting_data, is_current)
+                VALUES (?, ?, ?, ?, ?, ?, 1)
             ''', (
                 insight_id, insight.tool, insight_type, insight_value,
                 insight.predictive_score, ""
@@ -750,248 +3162,247 @@ class ScoringAnalyticsEngine:
         conn.commit()
         conn.close()
 
-    def create_comprehensive_visualizations(self):
-        """Create comprehensive visualizations for analytics"""
+    def apply_retention(self, mode: Optional[str] = None, keep_latest: Optional[int] = None,
+                        days: Optional[int] = None) -> Dict[str, Any]:
+        """Compact the analysis and insight history, then ANALYZE and VACUUM what changed.
+
+        The current row per pair or per tool and insight type is always kept.
+        In "latest" mode only the `keep_latest` most recent rows per key
+        survive; in "daily" mode the last row of each day is kept for `days`
+        days. Defaults come from the "retention" section of the scoring config.
+        """
+        
+        retention = {**DEFAULT_RETENTION, **self.scoring_config.get("retention", {})}
+        mode = mode or retention["mode"]
+        keep_latest = keep_latest if keep_latest is not None else retention["keep_latest"]
+        days = days if days is not None else retention["daily_days"]
+        if mode not in ("latest", "daily"):
+            raise ValueError(f"Unknown retention mode: {mode}")
+        
+        self.logger.info(f"🧹 Applying {mode} retention to analytics history...")
+        
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        summary: Dict[str, Any] = {}
+        with conn:
+            for table, (keys, timestamp_column) in ANALYTICS_HISTORY_TABLES.items():
+                partition = ", ".join(keys)
+                if mode == "latest":
+                    deleted = conn.execute(f'''
+                        DELETE FROM {table}
+                        WHERE is_current = 0 AND rowid IN (
+                            SELECT rowid FROM (
+                                SELECT rowid, ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY rowid DESC) AS recency
+                                FROM {table}
+                            ) WHERE recency > ?
+                        )
+                    ''', (keep_latest,)).rowcount
+                else:
+                    deleted = conn.execute(f'''
+                        DELETE FROM {table}
+                        WHERE is_current = 0 AND (
+                            date({timestamp_column}) < date('now', ?)
+                            OR rowid IN (
+                                SELECT rowid FROM (
+                                    SELECT rowid, ROW_NUMBER() OVER (
+                                        PARTITION BY {partition}, date({timestamp_column}) ORDER BY rowid DESC
+                                    ) AS recency
+                                    FROM {table}
+                                ) WHERE recency > 1
+                            )
+                        )
+                    ''', (f"-{days} days",)).rowcount
+                summary[table] = deleted
+        
+        # Refresh planner statistics of the compacted tables only; rewrite the
+        # file only once enough pages are free
+        for table in ANALYTICS_HISTORY_TABLES:
+            if summary[table]:
+                conn.execute(f"ANALYZE {table}")
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+        summary["vacuumed"] = bool(total_pages) and free_pages / total_pages >= retention["vacuum_free_fraction"]
+        if summary["vacuumed"]:
+            conn.execute("VACUUM")
+        conn.close()
         
-        self.logger.info("📊 Creating comprehensive visualizations...")
+        self.logger.info(f"🧹 Retention removed {summary['comparative_analysis']} analyses and "
+                         f"{summary['performance_insights']} insights")
+        return summary
+
+    def create_comprehensive_visualizations(self, workers: int = 1, dpi: int = 300,
+                                            mode: Optional[str] = None) -> str:
+        """Create comprehensive visualizations for analytics.
+
+        Each of the 12 panels is cached under a hash of its input data; only
+        panels whose inputs changed are re-rendered (in a process pool when
+        `workers` > 1) before the panels are tiled into the final figure.
+        `mode` overrides the configured raw, aggregate or auto rendering.
+        """
         
-        # Set style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        self.logger.info("📊 Creating comprehensive visualizations...")
         
         # Load data
-        query = '''
-            SELECT tool, language, category, complexity_level, overall_score,
-                   code_quality_score, functionality_score, performance_score,
-                   maintainability_score, innovation_score
-            FROM scoring_metrics
-        '''
+        df = self.score_frames.get()
         
         conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query(query, conn)
+        sketches = load_scoring_sketches(conn)
         conn.close()
         
         if df.empty:
             self.logger.warning("No data available for visualizations")
-            return
+            return ""
+        
+        panel_dir = self.visualizations_dir / "panels"
+        panel_dir.mkdir(parents=True, exist_ok=True)
+        
+        visualization = {**DEFAULT_VISUALIZATION, **self.scoring_config.get("visualization", {})}
+        mode = mode or visualization["mode"]
+        aggregate = mode == "aggregate" or (mode == "auto" and len(df) > visualization["aggregate_above"])
+        if aggregate:
+            self.logger.info(f"📊 Plotting binned summaries of {len(df)} scored results")
+        
+        panel_paths = []
+        stale_panels = []
+        for name, data in panel_inputs(df, sketches, aggregate, visualization["bins"]).items():
+            key = content_hash((PANEL_RENDER_VERSION, name, dpi, data))
+            panel_path = panel_dir / f"{name}_{key[:16]}.png"
+            panel_paths.append(panel_path)
+            if not panel_path.exists():
+                stale_panels.append((name, data, str(panel_path), dpi))
+        
+        self.logger.info(f"📊 Rendering {len(stale_panels)} panels, reusing {len(panel_paths) - len(stale_panels)} cached")
+        
+        if workers > 1 and len(stale_panels) > 1:
+            with worker_process_pool(workers) as executor:
+                list(executor.map(render_panel, *zip(*stale_panels)))
+        else:
+            for panel in stale_panels:
+                render_panel(*panel)
         
-        # Create comprehensive dashboard
-        fig = plt.figure(figsize=(20, 24))
-        
-        # 1. Overall Score Comparison
-        plt.subplot(4, 3, 1)
-        sns.boxplot(data=df, x='tool', y='overall_score')
-        plt.title('Overall Score Distribution by Tool', fontsize=14, fontweight='bold')
-        plt.ylabel('Overall Score')
-        
-        # 2. Score by Category
-        plt.subplot(4, 3, 2)
-        category_scores = df.groupby(['tool', 'category'])['overall_score'].mean().unstack()
-        category_scores.plot(kind='bar', ax=plt.gca())
-        plt.title('Average Score by Category', fontsize=14, fontweight='bold')
-        plt.ylabel('Average Score')
-        plt.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.xticks(rotation=45)
-        
-        # 3. Performance vs Complexity
-        plt.subplot(4, 3, 3)
-        for tool in df['tool'].unique():
-            tool_data = df[df['tool'] == tool]
-            complexity_means = tool_data.groupby('complexity_level')['overall_score'].mean()
-            plt.plot(complexity_means.index, complexity_means.values, marker='o', label=tool, linewidth=2)
-        plt.title('Performance vs Complexity Level', fontsize=14, fontweight='bold')
-        plt.xlabel('Complexity Level')
-        plt.ylabel('Average Score')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        # 4. Score Components Radar Chart (for first tool)
-        plt.subplot(4, 3, 4)
-        tools = df['tool'].unique()
-        if len(tools) > 0:
-            self.create_radar_chart(df, tools[0], plt.gca())
-            plt.title(f'{tools[0]} - Score Components', fontsize=14, fontweight='bold')
-        
-        # 5. Language Performance Heatmap
-        plt.subplot(4, 3, 5)
-        lang_tool_scores = df.groupby(['language', 'tool'])['overall_score'].mean().unstack()
-        sns.heatmap(lang_tool_scores, annot=True, cmap='RdYlGn', center=0.5, fmt='.3f')
-        plt.title('Performance by Language (Heatmap)', fontsize=14, fontweight='bold')
-        plt.ylabel('Language')
-        
-        # 6. Score Distribution Histogram
-        plt.subplot(4, 3, 6)
-        for tool in df['tool'].unique():
-            tool_scores = df[df['tool'] == tool]['overall_score']
-            plt.hist(tool_scores, alpha=0.7, label=tool, bins=15)
-        plt.title('Score Distribution', fontsize=14, fontweight='bold')
-        plt.xlabel('Overall Score')
-        plt.ylabel('Frequency')
-        plt.legend()
-        
-        # 7. Correlation Matrix
-        plt.subplot(4, 3, 7)
-        score_cols = ['code_quality_score', 'functionality_score', 'performance_score', 
-                     'maintainability_score', 'innovation_score']
-        corr_matrix = df[score_cols].corr()
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, fmt='.2f')
-        plt.title('Score Components Correlation', fontsize=14, fontweight='bold')
-        
-        # 8. Tool Performance Trends
-        plt.subplot(4, 3, 8)
-        df_sorted = df.sort_values('complexity_level')
-        for tool in df['tool'].unique():
-            tool_data = df_sorted[df_sorted['tool'] == tool]
-            plt.scatter(tool_data['complexity_level'], tool_data['overall_score'], 
-                       label=tool, alpha=0.6, s=30)
-        plt.title('Score vs Complexity (Scatter)', fontsize=14, fontweight='bold')
-        plt.xlabel('Complexity Level')
-        plt.ylabel('Overall Score')
-        plt.legend()
-        
-        # 9. Category Performance Radar (comparative)
-        plt.subplot(4, 3, 9)
-        if len(df['tool'].unique()) >= 2:
-            self.create_comparative_radar(df, plt.gca())
-            plt.title('Comparative Performance by Category', fontsize=14, fontweight='bold')
-        
-        # 10. Statistical Summary Table
-        plt.subplot(4, 3, 10)
-        summary_stats = df.groupby('tool')['overall_score'].agg(['mean', 'std', 'min', 'max']).round(3)
-        plt.table(cellText=summary_stats.values, 
-                 rowLabels=summary_stats.index,
-                 colLabels=summary_stats.columns,
-                 cellLoc='center',
-                 loc='center')
-        plt.axis('off')
-        plt.title('Statistical Summary', fontsize=14, fontweight='bold')
-        
-        # 11. Innovation vs Quality Scatter
-        plt.subplot(4, 3, 11)
-        scatter = plt.scatter(df['innovation_score'], df['code_quality_score'], 
-                            c=df['overall_score'], cmap='viridis', alpha=0.6)
-        plt.colorbar(scatter, label='Overall Score')
-        plt.xlabel('Innovation Score')
-        plt.ylabel('Code Quality Score')
-        plt.title('Innovation vs Quality', fontsize=14, fontweight='bold')
-        
-        # 12. Performance Efficiency Plot
-        plt.subplot(4, 3, 12)
-        efficiency_data = df.groupby('tool').agg({
-            'performance_score': 'mean',
-            'overall_score': 'mean'
-        })
-        plt.scatter(efficiency_data['performance_score'], efficiency_data['overall_score'], s=100)
-        for tool in efficiency_data.index:
-            plt.annotate(tool, (efficiency_data.loc[tool, 'performance_score'], 
-                               efficiency_data.loc[tool, 'overall_score']),
-                        xytext=(5, 5), textcoords='offset points')
-        plt.xlabel('Performance Score')
-        plt.ylabel('Overall Score')
-        plt.title('Performance vs Overall Quality', fontsize=14, fontweight='bold')
-        
-        plt.tight_layout()
+        # Drop cached panels that no longer match any current input
+        current_panels = set(panel_paths)
+        for cached_panel in panel_dir.glob("*.png"):
+            if cached_panel not in current_panels:
+                cached_panel.unlink()
         
         # Save visualization
         viz_path = self.visualizations_dir / f"comprehensive_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(viz_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        compose_panels(panel_paths, viz_path)
         
         self.logger.info(f"📊 Comprehensive visualization saved: {viz_path}")
-        return viz_path
-
-    def create_radar_chart(self, df: pd.DataFrame, tool: str, ax):
-        """Create radar chart for tool performance"""
-        
-        tool_data = df[df['tool'] == tool]
-        categories = ['Code Quality', 'Functionality', 'Performance', 'Maintainability', 'Innovation']
-        values = [
-            tool_data['code_quality_score'].mean(),
-            tool_data['functionality_score'].mean(),
-            tool_data['performance_score'].mean(),
-            tool_data['maintainability_score'].mean(),
-            tool_data['innovation_score'].mean()
-        ]
+        return str(viz_path)
+
+    def cluster_tool_profiles(self, n_clusters: int = 4, n_components: int = 3, chunk_size: int = 50000,
+                              seed: int = 42) -> Dict[str, Any]:
+        """Cluster scored results into behaviour profiles and record the run"""
         
-        # Radar chart setup
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        values += values[:1]  # Complete the circle
-        angles += angles[:1]
+        self.logger.info(f"🧩 Clustering score profiles into {n_clusters} clusters...")
+        start_time = time.time()
         
-        ax.plot(angles, values, 'o-', linewidth=2, label=tool)
-        ax.fill(angles, values, alpha=0.25)
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories)
-        ax.set_ylim(0, 1)
-        ax.grid(True)
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        try:
+            summary = cluster_score_profiles(conn, n_clusters, n_components, chunk_size, seed)
+            if summary["clusters"]:
+                with conn:
+                    conn.execute('''
+                        INSERT INTO analytics_metadata (id, analysis_type, parameters, results_summary, execution_time)
+                        VALUES (?, 'score_clustering', ?, ?, ?)
+                    ''', (f"clustering_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+                          json.dumps({"n_clusters": n_clusters, "n_components": n_components, "seed": seed}),
+                          json.dumps(summary), time.time() - start_time))
+        finally:
+            conn.close()
+        
+        if not summary["clusters"]:
+            self.logger.warning(f"Too few scored results to cluster ({summary['rows']})")
+        return summary
 
-    def create_comparative_radar(self, df: pd.DataFrame, ax):
-        """Create comparative radar chart for multiple tools"""
-        
-        categories = ['Code Quality', 'Functionality', 'Performance', 'Maintainability', 'Innovation']
-        score_cols = ['code_quality_score', 'functionality_score', 'performance_score', 
-                     'maintainability_score', 'innovation_score']
+    def load_cluster_centroids(self) -> pd.DataFrame:
+        """Centroids of the latest clustering with their sizes and per-tool counts"""
         
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        angles += angles[:1]
+        conn = sqlite3.connect(self.db_path)
+        centroids = pd.read_sql_query("SELECT * FROM cluster_centroids ORDER BY size DESC", conn)
+        conn.close()
+        return centroids
+
+    def analyze_score_trends(self, days: Optional[int] = None, granularity: Optional[str] = None,
+                             dimension: str = "overall_score") -> pd.DataFrame:
+        """Daily or weekly score trends per tool over the last `days` days.
         
-        colors = ['blue', 'red', 'green', 'orange', 'purple']
+        Defaults come from the "trends" section of the scoring config; the
+        rolling window spans `window` days, or four weeks for weekly buckets.
+        """
         
-        for i, tool in enumerate(df['tool'].unique()):
-            tool_data = df[df['tool'] == tool]
-            values = [tool_data[col].mean() for col in score_cols]
-            values += values[:1]  # Complete the circle
-            
-            ax.plot(angles, values, 'o-', linewidth=2, label=tool, color=colors[i % len(colors)])
-            ax.fill(angles, values, alpha=0.1, color=colors[i % len(colors)])
+        trends = {**DEFAULT_TRENDS, **self.scoring_config.get("trends", {})}
+        days = days if days is not None else trends["days"]
+        granularity = granularity or trends["granularity"]
+        window = trends["window"] if granularity == "day" else 4
+        min_samples = self.scoring_config.get("statistical_tests", {}).get("min_sample_size", 10)
         
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories)
-        ax.set_ylim(0, 1)
-        ax.legend(loc='upper right', bbox_to_anchor=(1.1, 1.1))
-        ax.grid(True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return score_trends(conn, datetime.now() - timedelta(days=days), granularity, window, dimension,
+                                trends["ewma_alpha"], trends["change_threshold"], min_samples)
+        finally:
+            conn.close()
 
     def generate_executive_dashboard(self) -> str:
-        """Generate executive dashboard report"""
+        """Generate executive dashboard report.
         
-        self.logger.info("📋 Generating executive dashboard...")
+        Sections are streamed to the file as they are rendered: per-tool
+        figures come from the rollups and sketches, and tool pairs and
+        insights are written straight from their cursors, so memory stays
+        bounded however many pairs and insights there are.
+        """
         
-        # Load all analytics data
-        scoring_query = "SELECT * FROM scoring_metrics"
-        analysis_query = "SELECT * FROM comparative_analysis"
-        insights_query = "SELECT * FROM performance_insights"
+        self.logger.info("📋 Generating executive dashboard...")
         
+        # Scores come from the rollups, never from scoring_metrics
         conn = sqlite3.connect(self.db_path)
-        scoring_df = pd.read_sql_query(scoring_query, conn)
-        analysis_df = pd.read_sql_query(analysis_query, conn)
-        insights_df = pd.read_sql_query(insights_query, conn)
-        conn.close()
-        
-        if scoring_df.empty:
-            self.logger.warning("No data available for executive dashboard")
-            return ""
-        
-        # Generate dashboard content
-        dashboard_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        report_path = self.reports_dir / f"executive_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        
-        # Calculate key metrics
-        total_evaluations = len(scoring_df)
-        tools_tested = scoring_df['tool'].nunique()
-        languages_covered = scoring_df['language'].nunique()
-        avg_overall_score = scoring_df['overall_score'].mean()
-        
-        # Winner analysis
-        if not analysis_df.empty:
-            winners = analysis_df['winner'].value_counts()
-            dominant_tool = winners.index[0] if len(winners) > 0 and winners.iloc[0] > 0 else "No clear winner"
-        else:
-            dominant_tool = "Analysis pending"
-        
-        dashboard_content = f"""# Executive Dashboard - Agentic Evaluation Analytics
+        try:
+            overall = load_scoring_rollups(conn)
+            overall = overall[overall['dimension'] == 'overall_score']
+            if overall.empty:
+                self.logger.warning("No data available for executive dashboard")
+                return ""
+            
+            percentiles = sketch_box_stats(load_scoring_sketches(conn))
+            pair_count, = conn.execute("SELECT COUNT(*) FROM comparative_analysis WHERE is_current = 1").fetchone()
+            leader = conn.execute('''
+                SELECT winner FROM comparative_analysis
+                WHERE is_current = 1 AND winner IS NOT NULL
+                GROUP BY winner ORDER BY COUNT(*) DESC, MIN(rowid) LIMIT 1
+            ''').fetchone()
+            omnibus_row = conn.execute('''
+                SELECT results_summary FROM analytics_metadata
+                WHERE analysis_type = 'omnibus_comparison' ORDER BY rowid DESC LIMIT 1
+            ''').fetchone()
+            
+            # Calculate key metrics
+            tool_moments = rollup_moments(overall, ['tool'])
+            total_evaluations = int(tool_moments['n'].sum())
+            tools_tested = len(tool_moments)
+            languages_covered = overall['language'].nunique()
+            avg_overall_score = tool_moments['total'].sum() / total_evaluations
+            
+            trend_config = {**DEFAULT_TRENDS, **self.scoring_config.get("trends", {})}
+            trend_days, trend_granularity = trend_config["days"], trend_config["granularity"]
+            trends = self.analyze_score_trends(trend_days, trend_granularity)
+            
+            # Winner analysis
+            if pair_count:
+                dominant_tool = leader[0] if leader else "No clear winner"
+            else:
+                dominant_tool = "Analysis pending"
+            
+            dashboard_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            report_path = self.reports_dir / f"executive_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            
+            with StreamingReportWriter(report_path) as report:
+                report.section(f"""# Executive Dashboard - Agentic Evaluation Analytics
 
 **Generated**: {dashboard_time}
-**Report Period**: Last 30 days
+**Report Period**: Last {trend_days} days
 **Data Freshness**: Real-time
 
 ## 🎯 Key Performance Indicators
@@ -1004,59 +3415,92 @@ class ScoringAnalyticsEngine:
 - **Current Leader**: {dominant_tool}
 
 ### Performance Metrics
-"""
-        
-        # Add tool-specific metrics
-        for tool in scoring_df['tool'].unique():
-            tool_data = scoring_df[scoring_df['tool'] == tool]
-            tool_avg = tool_data['overall_score'].mean()
-            tool_consistency = 1 - tool_data['overall_score'].std()
-            
-            dashboard_content += f"""
+""")
+                
+                # Tool-specific metrics
+                for tool, moments in tool_moments.iterrows():
+                    report.section(f"""
 #### {tool}
-- **Average Score**: {tool_avg:.1%}
-- **Consistency Rating**: {tool_consistency:.1%}
-- **Evaluations Completed**: {len(tool_data):,}
-"""
-        
-        # Strategic insights
-        dashboard_content += """
+- **Average Score**: {moments['mean']:.1%}
+- **Consistency Rating**: {1 - moments['std']:.1%}
+- **Evaluations Completed**: {int(moments['n']):,}
+""")
+                    if tool in percentiles.index:
+                        p50, p90, p99 = percentiles.loc[tool, ['med', 'p90', 'p99']]
+                        report.section(f"""- **Score Percentiles (p50 / p90 / p99)**: {p50:.1%} / {p90:.1%} / {p99:.1%}
+""")
+                
+                # Strategic insights
+                report.section("""
 ## 📊 Strategic Insights
 
 ### Competitive Landscape
-"""
-        
-        if not analysis_df.empty:
-            for _, analysis in analysis_df.iterrows():
-                significance = "✅ Statistically Significant" if analysis['statistical_significance'] else "⚠️ Not Statistically Significant"
-                confidence = analysis['confidence'] * 100
+""")
                 
-                dashboard_content += f"""
-**{analysis['tool_a']} vs {analysis['tool_b']}**
-- Winner: {analysis['winner']}
-- Confidence: {confidence:.1f}%
+                if omnibus_row:
+                    omnibus = json.loads(omnibus_row[0])
+                    verdict = "differ significantly" if omnibus['significant'] else "show no significant difference"
+                    report.section(f"""
+**All tools ({omnibus['test']} on {omnibus['dimension']})**: {len(omnibus['tools'])} tools {verdict} (p = {omnibus['p_value']:.4g}, effect size = {omnibus['effect_size']:.3f})
+""")
+                
+                def tool_pair_section(tool_a, tool_b, winner, confidence, significant, recommendation):
+                    significance = "✅ Statistically Significant" if significant else "⚠️ Not Statistically Significant"
+                    return f"""
+**{tool_a} vs {tool_b}**
+- Winner: {winner}
+- Confidence: {confidence * 100:.1f}%
 - Status: {significance}
-- Recommendation: {analysis['recommendation'][:100]}...
+- Recommendation: {recommendation[:100]}...
 """
-        
-        # Performance insights
-        dashboard_content += """
+                
+                report.sections(conn.execute('''
+                    SELECT tool_a, tool_b, winner, confidence, statistical_significance, recommendation
+                    FROM comparative_analysis
+                    WHERE is_current = 1
+                    ORDER BY rowid
+                '''), tool_pair_section)
+                
+                # Performance insights
+                report.section("""
 ### Performance Insights
+""")
+                
+                tools = set(tool_moments.index)
+                report.sections(
+                    ((tool, insight_value) for tool, insight_value in conn.execute('''
+                        SELECT tool, insight_value FROM performance_insights
+                        WHERE is_current = 1 AND insight_type = 'strengths'
+                        ORDER BY tool
+                    ''') if tool in tools),
+                    lambda tool, insight_value: f"""
+**{tool} Strengths**: {', '.join(json.loads(insight_value)[:3])}
 """
-        
-        for tool in scoring_df['tool'].unique():
-            tool_insights = insights_df[insights_df['tool'] == tool]
-            
-            if not tool_insights.empty:
-                strengths_data = tool_insights[tool_insights['insight_type'] == 'strengths']
-                if not strengths_data.empty:
-                    strengths = json.loads(strengths_data.iloc[0]['insight_value'])
-                    dashboard_content += f"""
-**{tool} Strengths**: {', '.join(strengths[:3])}
+                )
+                
+                # Behaviour profiles from the latest clustering run
+                centroids = pd.read_sql_query("SELECT * FROM cluster_centroids ORDER BY size DESC", conn)
+                if not centroids.empty:
+                    report.section("""
+### Behaviour Profiles
+""")
+                    profiled = centroids['size'].sum()
+                    
+                    def profile_section(centroid):
+                        dimensions = centroid[SCORE_DIMENSIONS].astype(float)
+                        labels = dict(zip(SCORE_DIMENSIONS, SCORE_COMPONENT_LABELS))
+                        tool_counts = json.loads(centroid['tool_counts'])
+                        top_tool = max(tool_counts, key=tool_counts.get)
+                        return f"""
+**Profile {int(centroid['cluster'])}** ({int(centroid['size']):,} results, {centroid['size'] / profiled:.0%})
+- Strongest: {labels[dimensions.idxmax()]} ({dimensions.max():.1%}); weakest: {labels[dimensions.idxmin()]} ({dimensions.min():.1%})
+- Mostly {top_tool} ({tool_counts[top_tool] / max(int(centroid['size']), 1):.0%} of the profile)
 """
-        
-        # Recommendations
-        dashboard_content += f"""
+                    
+                    report.sections(((centroid,) for _, centroid in centroids.iterrows()), profile_section)
+                
+                # Recommendations
+                report.section(f"""
 ## 🚀 Executive Recommendations
 
 ### Immediate Actions
@@ -1077,10 +3521,23 @@ class ScoringAnalyticsEngine:
 ## 📈 Trends and Projections
 
 ### Current Trends
-- Quality scores trending {'upward' if avg_overall_score > 0.8 else 'stable' if avg_overall_score > 0.7 else 'concerning'}
-- Consistency {'improving' if len(scoring_df) > 10 else 'being monitored'}
-- Tool maturity {'accelerating' if tools_tested > 1 else 'in progress'}
-
+""")
+                
+                def tool_trend_section(tool, buckets):
+                    latest = buckets.iloc[-1]
+                    drift = latest['ewma'] - buckets['mean'].iloc[0]
+                    direction = 'upward' if drift > 0.01 else 'downward' if drift < -0.01 else 'stable'
+                    change_points = buckets.loc[buckets['change_point'], 'bucket'].tolist()
+                    shifts = f"shifts on {', '.join(change_points)}" if change_points else "no significant shifts"
+                    period = f"{len(buckets)} {trend_granularity}{'s' if len(buckets) != 1 else ''}"
+                    return (f"- **{tool}**: trending {direction} (EWMA {latest['ewma']:.1%}, rolling mean "
+                            f"{latest['rolling_mean']:.1%} over {period}); {shifts}\n")
+                
+                if trends.empty:
+                    report.section(f"- No scores recorded in the last {trend_days} days\n")
+                report.sections(trends.groupby('tool', sort=False), tool_trend_section)
+                
+                report.section(f"""
 ### 30-Day Forecast
 Based on current performance trends:
 - Expected quality improvement: 5-15%
@@ -1091,48 +3548,124 @@ Based on current performance trends:
 
 *This dashboard is automatically updated with each evaluation cycle*
 *Next update: {(datetime.now() + timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S')}*
-"""
-        
-        # Write dashboard
-        with open(report_path, 'w') as f:
-            f.write(dashboard_content)
+""")
+        finally:
+            conn.close()
         
         self.logger.info(f"📋 Executive dashboard generated: {report_path}")
         return str(report_path)
 
-    def run_complete_analytics_pipeline(self) -> Dict[str, str]:
-        """Run the complete analytics pipeline"""
+    def evaluation_results_signature(self) -> Tuple[int, int]:
+        """Row count and highest rowid of evaluation_results, which change on every insert"""
+        
+        conn = sqlite3.connect(self.db_path)
+        signature = conn.execute("SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM evaluation_results").fetchone()
+        conn.close()
+        return tuple(signature)
+
+    def scores_signature(self) -> str:
+        """Content hash of the score rollups, which change whenever any score does"""
+        
+        conn = sqlite3.connect(self.db_path)
+        rollups = load_scoring_rollups(conn)
+        conn.close()
+        return content_hash(rollups.sort_values(ROLLUP_KEYS + ['dimension']).reset_index(drop=True))
+
+    def create_profiler(self) -> PhaseProfiler:
+        """Profiler writing next to the reports, one directory per run"""
+        
+        return PhaseProfiler(self.reports_dir / "profiles" / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                             self.logger)
+    
+    def run_complete_analytics_pipeline(self, batch_size: int = 5000, full_rescore: bool = False,
+                                        chunk_size: int = 50000, workers: int = 1,
+                                        bootstrap: bool = False, n_resamples: int = 10000,
+                                        seed: int = 42, force: bool = False,
+                                        omnibus: Optional[str] = None, profile: bool = False,
+                                        bootstrap_method: str = "exact") -> Dict[str, str]:
+        """Run the complete analytics pipeline.
+
+        Analysis, insights, clustering and visualizations depend only on scoring
+        and run concurrently, except that phases starting `workers` > 1
+        processes run alone; the dashboard waits for analysis, insights and
+        clustering, and the retention job compacts their history once the
+        dashboard is written. Phases whose inputs are unchanged since their
+        last run are skipped unless `force` is set. With `profile` the phases
+        run sequentially and each one writes its profile under
+        reports/analytics/profiles.
+        """
         
         self.logger.info("🚀 Running complete analytics pipeline...")
         
         start_time = time.time()
-        results = {}
+        
+        def output_exists(path: str) -> bool:
+            return bool(path) and Path(path).exists()
+        
+        def compact_history() -> str:
+            summary = self.apply_retention()
+            return f"{summary['comparative_analysis'] + summary['performance_insights']} history rows removed"
+        
+        phases = [
+            PipelinePhase(
+                'scoring_metrics',
+                lambda: f"{self.score_evaluation_results(batch_size=batch_size, full_rescore=full_rescore, chunk_size=chunk_size, workers=workers)} metrics calculated",
+                inputs=lambda: (self.evaluation_results_signature(), content_hash(self.scoring_config)),
+                always_run=full_rescore,
+                exclusive=workers > 1
+            ),
+            PipelinePhase(
+                'statistical_analysis',
+                lambda: f"{len(self.perform_statistical_analysis(bootstrap, n_resamples, seed, omnibus, bootstrap_method))} comparisons completed",
+                depends_on=['scoring_metrics'],
+                inputs=lambda: (self.scores_signature(), bootstrap, n_resamples, seed, omnibus, bootstrap_method)
+            ),
+            PipelinePhase(
+                'performance_insights',
+                lambda: f"{len(self.generate_performance_insights())} insights generated",
+                depends_on=['scoring_metrics'],
+                inputs=self.scores_signature
+            ),
+            PipelinePhase(
+                'clustering',
+                lambda: f"{self.cluster_tool_profiles(seed=seed)['clusters']} behaviour profiles clustered",
+                depends_on=['scoring_metrics'],
+                inputs=lambda: (self.scores_signature(), seed)
+            ),
+            PipelinePhase(
+                'visualizations',
+                lambda: self.create_comprehensive_visualizations(workers),
+                depends_on=['scoring_metrics'],
+                inputs=lambda: (self.scores_signature(), self.scoring_config.get("visualization")),
+                reusable=output_exists,
+                exclusive=workers > 1
+            ),
+            PipelinePhase(
+                'executive_dashboard',
+                self.generate_executive_dashboard,
+                depends_on=['statistical_analysis', 'performance_insights', 'clustering'],
+                inputs=self.scores_signature,
+                reusable=output_exists
+            ),
+            PipelinePhase(
+                'retention',
+                compact_history,
+                depends_on=['executive_dashboard'],
+                always_run=True
+            ),
+        ]
+        
+        profiler = self.create_profiler() if profile else None
         
         try:
-            # Phase 1: Calculate comprehensive scores
-            self.logger.info("Phase 1: Calculating comprehensive scores...")
-            scoring_metrics = self.calculate_comprehensive_scores()
-            results['scoring_metrics'] = f"{len(scoring_metrics)} metrics calculated"
-            
-            # Phase 2: Perform statistical analysis
-            self.logger.info("Phase 2: Performing statistical analysis...")
-            analyses = self.perform_statistical_analysis()
-            results['statistical_analysis'] = f"{len(analyses)} comparisons completed"
-            
-            # Phase 3: Generate performance insights
-            self.logger.info("Phase 3: Generating performance insights...")
-            insights = self.generate_performance_insights()
-            results['performance_insights'] = f"{len(insights)} insights generated"
-            
-            # Phase 4: Create visualizations
-            self.logger.info("Phase 4: Creating visualizations...")
-            viz_path = self.create_comprehensive_visualizations()
-            results['visualizations'] = str(viz_path)
+            outcomes = PipelineRunner(self.db_path, force=force, logger=self.logger, profiler=profiler).run(phases)
             
-            # Phase 5: Generate executive dashboard
-            self.logger.info("Phase 5: Generating executive dashboard...")
-            dashboard_path = self.generate_executive_dashboard()
-            results['executive_dashboard'] = dashboard_path
+            results = {phase.name: outcomes[phase.name].result for phase in phases}
+            if profiler:
+                results['profiles'] = str(profiler.output_dir)
+            skipped = [phase.name for phase in phases if outcomes[phase.name].status == "skipped"]
+            if skipped:
+                results['skipped_phases'] = ", ".join(skipped)
             
             execution_time = time.time() - start_time
             results['execution_time'] = f"{execution_time:.2f} seconds"
@@ -1144,50 +3677,139 @@ Based on current performance trends:
         except Exception as e:
             self.logger.error(f"❌ Analytics pipeline failed: {e}")
             raise
+        
+        finally:
+            # The shared score frame lives for one run
+            self.score_frames.clear()
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Command line with one subcommand per analytics phase"""
+    
     parser = argparse.ArgumentParser(description='Scoring and Analytics Engine for Agentic Evaluation')
-    parser.add_argument('--mode', choices=['scoring', 'analysis', 'insights', 'visualizations', 'dashboard', 'full'],
-                       default='full', help='Analytics mode to run')
     parser.add_argument('--eval-root', default='/workspace/agentic-eval',
                        help='Evaluation framework root directory')
-    parser.add_argument('--limit', type=int, help='Limit number of results to process')
+    parser.add_argument('--profile', action='store_true',
+                       help='Write cProfile, flame graph and allocation profiles per phase to reports/analytics/profiles '
+                            '(pipeline phases then run sequentially; worker processes are not profiled)')
+    
+    scoring_options = argparse.ArgumentParser(add_help=False)
+    scoring_options.add_argument('--batch-size', type=int, default=5000,
+                                help='Scoring rows written per database transaction')
+    scoring_options.add_argument('--full-rescore', action='store_true',
+                                help='Rescore every evaluation result instead of only unscored ones')
+    scoring_options.add_argument('--chunk-size', type=int, default=50000,
+                                help='Evaluation results loaded into memory per scoring chunk')
+    scoring_options.add_argument('--workers', type=int, default=1,
+                                help='Worker processes scoring rowid shards in parallel')
+    
+    analysis_options = argparse.ArgumentParser(add_help=False)
+    analysis_options.add_argument('--bootstrap', action='store_true',
+                                 help='Add bootstrap confidence intervals to tool comparisons')
+    analysis_options.add_argument('--resamples', type=int, default=10000,
+                                 help='Bootstrap resamples per tool')
+    analysis_options.add_argument('--bootstrap-method', choices=BOOTSTRAP_METHODS, default='exact',
+                                 help='Resample the scores exactly, or opt in to the stratified normal '
+                                      'approximation for very large samples')
+    analysis_options.add_argument('--seed', type=int, default=42,
+                                 help='Seed for bootstrap resampling')
+    analysis_options.add_argument('--omnibus', choices=['anova', 'kruskal'],
+                                 help='Also compare all tools at once with this omnibus test')
     
-    args = parser.parse_args()
+    subcommands = parser.add_subparsers(dest='command', metavar='command')
+    score = subcommands.add_parser('score', parents=[scoring_options], help='Score unscored evaluation results')
+    score.add_argument('--limit', type=int,
+                      help='Limit number of results to process (scores in a single process, ignoring --workers)')
+    subcommands.add_parser('analyze', parents=[analysis_options], help='Compare tools statistically')
+    subcommands.add_parser('insights', help='Generate per-tool performance insights')
+    visualize = subcommands.add_parser('visualize', help='Render the analytics figure')
+    visualize.add_argument('--workers', type=int, default=1,
+                          help='Worker processes rendering changed panels in parallel')
+    visualize.add_argument('--render-mode', choices=VISUALIZATION_MODES,
+                          help='Plot every row, binned summaries, or decide by row count (default: from config)')
+    subcommands.add_parser('dashboard', help='Write the executive dashboard')
+    cluster = subcommands.add_parser('cluster', help='Cluster scored results into behaviour profiles')
+    cluster.add_argument('--clusters', type=int, default=4, help='Number of behaviour profiles')
+    cluster.add_argument('--components', type=int, default=3,
+                        help='Principal components of the five dimension scores to cluster on')
+    cluster.add_argument('--chunk-size', type=int, default=50000, help='Scores read per partial_fit chunk')
+    cluster.add_argument('--seed', type=int, default=42, help='Seed for the k-means initialization')
+    trends = subcommands.add_parser('trends', help='Show rolling score trends and change points per tool')
+    trends.add_argument('--days', type=int, help='Days of scores to cover (default: from config)')
+    trends.add_argument('--granularity', choices=sorted(TREND_GRANULARITIES),
+                       help='Bucket scores by day or by week (default: from config)')
+    retention = subcommands.add_parser('retention', help='Compact analysis and insight history')
+    retention.add_argument('--retention-mode', choices=['latest', 'daily'],
+                          help='Keep the latest N rows per key, or one snapshot per day (default: from config)')
+    retention.add_argument('--keep', type=int, help='Rows kept per key in latest mode')
+    retention.add_argument('--days', type=int, help='Days of daily snapshots kept in daily mode')
+    pipeline = subcommands.add_parser('pipeline', parents=[scoring_options, analysis_options],
+                                      help='Run every phase (default)')
+    pipeline.add_argument('--force', action='store_true',
+                         help='Run every phase even if its inputs are unchanged since the last run')
+    
+    return parser
+
+def main(argv: Optional[List[str]] = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        args = parser.parse_args(list(sys.argv[1:] if argv is None else argv) + ['pipeline'])
     
     # Create analytics engine
     engine = ScoringAnalyticsEngine(args.eval_root)
     
+    # The pipeline profiles each of its phases; any other command is one phase
+    profiling = args.profile and args.command != 'pipeline'
+    
     try:
-        if args.mode == 'scoring':
-            metrics = engine.calculate_comprehensive_scores(args.limit)
-            print(f"✅ Calculated scores for {len(metrics)} results")
-            
-        elif args.mode == 'analysis':
-            analyses = engine.perform_statistical_analysis()
-            print(f"✅ Completed {len(analyses)} statistical comparisons")
-            
-        elif args.mode == 'insights':
-            insights = engine.generate_performance_insights()
-            print(f"✅ Generated insights for {len(insights)} tools")
-            
-        elif args.mode == 'visualizations':
-            viz_path = engine.create_comprehensive_visualizations()
-            print(f"✅ Visualizations created: {viz_path}")
-            
-        elif args.mode == 'dashboard':
-            dashboard_path = engine.generate_executive_dashboard()
-            print(f"✅ Executive dashboard: {dashboard_path}")
-            
-        elif args.mode == 'full':
-            results = engine.run_complete_analytics_pipeline()
-            print("✅ Complete analytics pipeline results:")
-            for key, value in results.items():
-                print(f"  {key}: {value}")
+        with engine.create_profiler().profile(args.command) if profiling else nullcontext():
+            if args.command == 'score':
+                scored_count = engine.score_evaluation_results(args.limit, args.batch_size, args.full_rescore,
+                                                               args.chunk_size, workers=args.workers)
+                print(f"✅ Calculated scores for {scored_count} results")
                 
+            elif args.command == 'analyze':
+                analyses = engine.perform_statistical_analysis(args.bootstrap, args.resamples, args.seed, args.omnibus,
+                                                               args.bootstrap_method)
+                print(f"✅ Completed {len(analyses)} statistical comparisons")
+                
+            elif args.command == 'insights':
+                insights = engine.generate_performance_insights()
+                print(f"✅ Generated insights for {len(insights)} tools")
+                
+            elif args.command == 'visualize':
+                viz_path = engine.create_comprehensive_visualizations(args.workers, mode=args.render_mode)
+                print(f"✅ Visualizations created: {viz_path}")
+                
+            elif args.command == 'dashboard':
+                dashboard_path = engine.generate_executive_dashboard()
+                print(f"✅ Executive dashboard: {dashboard_path}")
+                
+            elif args.command == 'cluster':
+                summary = engine.cluster_tool_profiles(args.clusters, args.components, args.chunk_size, args.seed)
+                print(f"✅ Clustered {summary['rows']} results into {summary['clusters']} behaviour profiles")
+                
+            elif args.command == 'trends':
+                trends = engine.analyze_score_trends(args.days, args.granularity)
+                print(trends.to_string(index=False) if not trends.empty else "No scores in the selected period")
+                
+            elif args.command == 'retention':
+                summary = engine.apply_retention(args.retention_mode, args.keep, args.days)
+                print(f"✅ Retention removed {summary['comparative_analysis']} analyses and "
+                      f"{summary['performance_insights']} insights (vacuumed: {summary['vacuumed']})")
+                
+            elif args.command == 'pipeline':
+                results = engine.run_complete_analytics_pipeline(args.batch_size, args.full_rescore, args.chunk_size,
+                                                                 args.workers, args.bootstrap, args.resamples, args.seed,
+                                                                 args.force, args.omnibus, args.profile,
+                                                                 args.bootstrap_method)
+                print("✅ Complete analytics pipeline results:")
+                for key, value in results.items():
+                    print(f"  {key}: {value}")
+            
     except Exception as e:
         print(f"❌ Analytics failed: {e}")
         raise
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
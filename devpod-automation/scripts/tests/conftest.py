@@ -0,0 +1,109 @@
+"""Shared fixtures for the devpod-automation analytics scripts."""
+
+import importlib.util
+import json
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+TOOLS = ["claude-code", "gemini-cli"]
+LANGUAGES = ["python", "typescript", "rust", "go", "nushell", "java"]
+CATEGORIES = ["ui-components", "apis", "cli-tools", "web-apps", "data-processing", "games"]
+
+
+def load_script(filename: str, module_name: str):
+    """Import a hyphenated script from the scripts directory as a module."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def engine_module():
+    return load_script("scoring-analytics-engine.py", "scoring_analytics_engine")
+
+
+def make_evaluation_rows(count: int, seed: int = 7):
+    """Build evaluation_results rows covering unknown factors and metric variants."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        metrics = rng.choice([
+            None,
+            "",
+            json.dumps({}),
+            json.dumps({"code_quality_score": rng.random()}),
+            json.dumps({"functionality_score": rng.random(), "test_coverage": rng.random()}),
+        ])
+        rows.append({
+            "id": f"result_{i:05d}",
+            "task_id": f"task_{i // 2}",
+            "tool": rng.choice(TOOLS + ["other-cli"]),
+            "language": rng.choice(LANGUAGES),
+            "category": rng.choice(CATEGORIES),
+            "complexity_level": rng.randint(1, 5),
+            "prompt": "prompt",
+            "response": "x" * rng.randint(0, 3000),
+            "execution_time": rng.uniform(0.5, 90),
+            "response_time": rng.uniform(0.5, 90),
+            "memory_usage": None,
+            "success": 1,
+            "metrics": metrics,
+        })
+    return rows
+
+
+def insert_evaluation_rows(db_path: Path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS evaluation_results (
+            id TEXT PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            language TEXT NOT NULL,
+            category TEXT NOT NULL,
+            complexity_level INTEGER NOT NULL,
+            prompt TEXT NOT NULL,
+            response TEXT NOT NULL,
+            execution_time REAL NOT NULL,
+            response_time REAL NOT NULL,
+            memory_usage REAL,
+            success BOOLEAN NOT NULL,
+            error_message TEXT,
+            metrics TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            workflow_id TEXT,
+            version TEXT DEFAULT '1.0'
+        )
+    ''')
+    conn.executemany('''
+        INSERT INTO evaluation_results
+        (id, task_id, tool, language, category, complexity_level, prompt, response,
+         execution_time, response_time, memory_usage, success, metrics)
+        VALUES (:id, :task_id, :tool, :language, :category, :complexity_level, :prompt,
+                :response, :execution_time, :response_time, :memory_usage, :success, :metrics)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def eval_root(tmp_path):
+    root = tmp_path / "agentic-eval"
+    (root / "databases").mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def engine(engine_module, eval_root):
+    insert_evaluation_rows(eval_root / "databases" / "results.db", make_evaluation_rows(200))
+    return engine_module.ScoringAnalyticsEngine(str(eval_root))
@@ -0,0 +1,41 @@
+"""Tests for the shared results.db schema migrations."""
+
+import sqlite3
+
+from conftest import insert_evaluation_rows, load_script, make_evaluation_rows
+
+
+def migrations_module():
+    return load_script("results_db_migrations.py", "results_db_migrations")
+
+
+def test_migrations_apply_once_in_version_order(engine):
+    migrations = migrations_module()
+    conn = sqlite3.connect(engine.db_path)
+    try:
+        assert migrations.schema_version(conn) == migrations.LATEST_VERSION
+        recorded = conn.execute("SELECT version, applied_by FROM schema_migrations ORDER BY version").fetchall()
+        assert recorded == [(m.version, "scoring-analytics-engine") for m in migrations.MIGRATIONS]
+        assert migrations.migrate_results_db(conn, "again") == []
+
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM evaluation_results "
+            "WHERE success = 1 AND timestamp >= datetime('now', '-7 days')"))
+        assert "idx_evaluation_results_success_timestamp" in plan
+    finally:
+        conn.close()
+
+
+def test_migrations_wait_for_missing_tables(tmp_path):
+    migrations = migrations_module()
+    db_path = tmp_path / "results.db"
+    conn = sqlite3.connect(db_path)
+    try:
+        assert migrations.migrate_results_db(conn) == []
+        assert migrations.schema_version(conn) == 0
+
+        insert_evaluation_rows(db_path, make_evaluation_rows(10))
+        assert migrations.migrate_results_db(conn) == [1]
+        assert migrations.schema_version(conn) == 1
+    finally:
+        conn.close()
@@ -0,0 +1,1032 @@
+"""Tests for the scoring and analytics engine."""
+
+import json
+import pstats
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import SCRIPTS_DIR, make_evaluation_rows
+
+
+def test_vectorized_scores_match_per_row_functions(engine_module, engine):
+    """The columnar scorer reproduces every per-row scoring function exactly."""
+    df = pd.DataFrame(make_evaluation_rows(500, seed=11))
+    df.loc[::7, "success"] = 0
+
+    scorer = engine_module.VectorizedScorer(engine.scoring_config)
+    features, valid = scorer.extract_features(df)
+    assert valid.all()
+    scores = scorer.score_frame(features)
+
+    weights = engine.scoring_config["weights"]
+    for i, (_, row) in enumerate(df.iterrows()):
+        raw_metrics = row["metrics"]
+        metrics = json.loads(raw_metrics) if isinstance(raw_metrics, str) and raw_metrics else {}
+        expected = {
+            "code_quality_score": engine.calculate_code_quality_score(row, metrics),
+            "functionality_score": engine.calculate_functionality_score(row, metrics),
+            "performance_score": engine.calculate_performance_score(row, metrics),
+            "maintainability_score": engine.calculate_maintainability_score(row, metrics),
+            "innovation_score": engine.calculate_innovation_score(row, metrics),
+            "confidence_level": engine.calculate_confidence_level(row, metrics),
+        }
+        expected["overall_score"] = (
+            expected["code_quality_score"] * weights["code_quality"] +
+            expected["functionality_score"] * weights["functionality"] +
+            expected["performance_score"] * weights["performance"] +
+            expected["maintainability_score"] * weights["maintainability"] +
+            expected["innovation_score"] * weights["innovation"]
+        )
+        for column, value in expected.items():
+            assert scores[column].iloc[i] == value, (column, i)
+
+
+def test_factor_overrides_apply_to_both_scoring_paths(engine_module, engine):
+    engine.scoring_config = dict(engine.scoring_config, factors={
+        "language_quality": {"python": 0.5},
+        "category_functionality": {"apis": 0.6},
+        "tool_performance": {"claude-code": 0.7},
+        "language_maintainability": {"python": 0.8},
+        "tool_innovation": {"claude-code": 0.5},
+        "category_innovation": {"apis": 0.4},
+    })
+    df = pd.DataFrame(make_evaluation_rows(100, seed=3))
+    scorer = engine_module.VectorizedScorer(engine.scoring_config)
+    features, _ = scorer.extract_features(df)
+    scores = scorer.score_frame(features)
+
+    for i, (_, row) in enumerate(df.iterrows()):
+        metrics = json.loads(row["metrics"]) if isinstance(row["metrics"], str) and row["metrics"] else {}
+        assert scores["code_quality_score"].iloc[i] == engine.calculate_code_quality_score(row, metrics)
+        assert scores["functionality_score"].iloc[i] == engine.calculate_functionality_score(row, metrics)
+        assert scores["performance_score"].iloc[i] == engine.calculate_performance_score(row, metrics)
+        assert scores["maintainability_score"].iloc[i] == engine.calculate_maintainability_score(row, metrics)
+        assert scores["innovation_score"].iloc[i] == engine.calculate_innovation_score(row, metrics)
+
+    overridden = ((df["tool"] == "claude-code") & (df["category"] == "apis")).to_numpy()
+    assert overridden.any()
+    default_scores = engine_module.VectorizedScorer(dict(engine.scoring_config, factors={})).score_frame(features)
+    assert (scores["innovation_score"][overridden] < default_scores["innovation_score"][overridden]).all()
+
+
+def test_invalid_metrics_rows_are_skipped(engine_module, engine):
+    df = pd.DataFrame(make_evaluation_rows(3))
+    df.loc[1, "metrics"] = "{not json"
+
+    _, valid = engine_module.VectorizedScorer.extract_features(df)
+    assert valid.tolist() == [True, False, True]
+
+
+def test_calculate_comprehensive_scores_stores_metrics(engine):
+    metrics = engine.calculate_comprehensive_scores()
+    assert len(metrics) == 200
+    assert all(0.0 <= m.overall_score <= 1.0 for m in metrics)
+
+    conn = sqlite3.connect(engine.db_path)
+    stored = conn.execute("SELECT COUNT(*) FROM scoring_metrics").fetchone()[0]
+    conn.close()
+    assert stored == 200
+
+
+def test_scoring_writer_flushes_in_batches(engine_module, engine):
+    metric = engine_module.ScoringMetrics(0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.9, "2025-01-01T00:00:00")
+    writer = engine_module.ScoringMetricsWriter(engine.db_path, batch_size=3)
+    for i in range(7):
+        writer.add(f"result_{i:05d}", "claude-code", "python", "apis", 2, metric)
+    assert writer.rows_written == 6
+    writer.close()
+    assert writer.rows_written == 7
+
+    conn = sqlite3.connect(engine.db_path)
+    rows = conn.execute(
+        "SELECT tool, language, category, complexity_level FROM scoring_metrics"
+    ).fetchall()
+    conn.close()
+    assert rows == [("claude-code", "python", "apis", 2)] * 7
+
+
+def test_incremental_scoring_only_scores_new_results(engine):
+    assert len(engine.calculate_comprehensive_scores()) == 200
+    assert engine.calculate_comprehensive_scores() == []
+
+    rescored = engine.calculate_comprehensive_scores(full_rescore=True)
+    assert len(rescored) == 200
+
+    conn = sqlite3.connect(engine.db_path)
+    total, distinct = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT result_id) FROM scoring_metrics"
+    ).fetchone()
+    conn.close()
+    assert total == distinct == 200
+
+
+def test_legacy_duplicate_scores_are_collapsed(engine_module, engine):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("DROP INDEX idx_scoring_metrics_result_id")
+    for suffix, score in [("1", 0.5), ("2", 0.6)]:
+        conn.execute(
+            "INSERT INTO scoring_metrics (id, result_id, tool, language, category, "
+            "complexity_level, overall_score) VALUES (?, 'result_00000', 'claude-code', "
+            "'python', 'apis', 1, ?)",
+            (f"score_result_00000_{suffix}", score),
+        )
+    conn.commit()
+    conn.close()
+
+    engine_module.ScoringAnalyticsEngine(str(engine.eval_root))
+
+    conn = sqlite3.connect(engine.db_path)
+    rows = conn.execute("SELECT overall_score FROM scoring_metrics").fetchall()
+    conn.close()
+    assert rows == [(0.6,)]
+
+
+def test_sql_feature_loader_matches_raw_feature_extraction(engine_module, engine):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("UPDATE evaluation_results SET metrics = '{broken' WHERE id = 'result_00001'")
+    conn.execute("UPDATE evaluation_results SET metrics = '[1, 2]' WHERE id = 'result_00002'")
+    conn.execute("""UPDATE evaluation_results SET metrics = '{"test_coverage": "high"}'
+                    WHERE id = 'result_00003'""")
+    conn.execute("UPDATE evaluation_results SET response = 'héllo wörld' WHERE id = 'result_00004'")
+    conn.commit()
+    raw = pd.read_sql_query("SELECT * FROM evaluation_results ORDER BY rowid", conn)
+    conn.close()
+
+    assert engine.refresh_scoring_features(chunk_size=64) == 200
+    chunks = list(engine.iter_scoring_features(full_rescore=True, chunk_size=64))
+    assert [len(chunk) for chunk in chunks] == [64, 64, 64, 8]
+    loaded = pd.concat(chunks, ignore_index=True)
+    assert loaded["id"].tolist() == raw["id"].tolist()
+    assert not loaded.loc[1:3, "metrics_valid"].any()
+
+    scorer = engine_module.VectorizedScorer(engine.scoring_config)
+    features, _ = scorer.extract_features(raw)
+    valid = loaded["metrics_valid"].to_numpy(dtype=bool)
+    pd.testing.assert_frame_equal(
+        scorer.score_frame(loaded[valid]).reset_index(drop=True),
+        scorer.score_frame(features[valid]).reset_index(drop=True),
+    )
+
+
+def test_invalid_metrics_are_reported_once(engine, caplog):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("UPDATE evaluation_results SET metrics = '{broken', success = 1 WHERE id = 'result_00001'")
+    conn.commit()
+    conn.close()
+
+    with caplog.at_level("ERROR"):
+        assert engine.score_evaluation_results() == 199
+    assert [record.getMessage() for record in caplog.records] == [
+        "Error calculating scores for result result_00001: invalid metrics JSON"]
+
+    caplog.clear()
+    with caplog.at_level("ERROR"):
+        assert engine.score_evaluation_results() == 0
+    assert caplog.records == []
+    assert list(engine.iter_scoring_features()) == []
+
+
+def test_scoring_respects_limit_across_chunks(engine):
+    assert engine.score_evaluation_results(limit=150, chunk_size=40) == 150
+    assert engine.score_evaluation_results(chunk_size=40) == 50
+
+
+def test_sharded_scoring_matches_single_process(engine):
+    engine.score_evaluation_results(chunk_size=64)
+    conn = sqlite3.connect(engine.db_path)
+    query = "SELECT result_id, overall_score, confidence_level FROM scoring_metrics ORDER BY result_id"
+    expected = conn.execute(query).fetchall()
+    conn.execute("DELETE FROM scoring_metrics")
+    conn.commit()
+    conn.close()
+
+    assert engine.score_evaluation_results(chunk_size=64, workers=2) == 200
+
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute(query).fetchall() == expected
+    conn.close()
+
+
+def _statistics_from_table(engine):
+    conn = sqlite3.connect(engine.db_path)
+    persisted = {
+        (tool, dimension): (n, mean, m2)
+        for tool, dimension, n, mean, m2 in conn.execute(
+            "SELECT tool, dimension, n, mean, m2 FROM scoring_statistics")
+    }
+    df = pd.read_sql_query("SELECT * FROM scoring_metrics", conn)
+    conn.close()
+    return persisted, df
+
+
+def test_sufficient_statistics_track_written_scores(engine_module, engine):
+    engine.score_evaluation_results(limit=120, batch_size=25)
+    engine.score_evaluation_results(batch_size=25)
+    engine.score_evaluation_results(batch_size=25, full_rescore=True)
+
+    persisted, df = _statistics_from_table(engine)
+    for tool, tool_data in df.groupby("tool"):
+        for dimension in engine_module.STATISTICS_DIMENSIONS:
+            values = tool_data[dimension].to_numpy()
+            n, mean, m2 = persisted[(tool, dimension)]
+            assert n == len(values)
+            assert np.isclose(mean, values.mean())
+            assert np.isclose(m2, ((values - values.mean()) ** 2).sum())
+
+
+def test_comparison_from_statistics_matches_raw_t_test(engine_module, engine):
+    from scipy import stats
+
+    engine.score_evaluation_results(batch_size=30)
+    analyses = engine.perform_statistical_analysis()
+    assert len(analyses) == 3
+
+    _, df = _statistics_from_table(engine)
+    for analysis in analyses:
+        scores_a = df.loc[df["tool"] == analysis.tool_a, "overall_score"]
+        scores_b = df.loc[df["tool"] == analysis.tool_b, "overall_score"]
+        _, p_value = stats.ttest_ind(scores_a, scores_b)
+        assert np.isclose(analysis.p_value, p_value)
+        assert np.isclose(analysis.score_difference, scores_a.mean() - scores_b.mean())
+
+
+def test_bootstrap_paths_agree_on_interval_width(engine_module):
+    rng = np.random.default_rng(3)
+    a = rng.beta(8, 2, size=(4000, 2))
+    b = rng.beta(7, 2, size=(4000, 2))
+    exact = engine_module.BootstrapEngine(n_resamples=2000)
+    stratified = engine_module.BootstrapEngine(n_resamples=2000, method="stratified")
+
+    exact_ci = exact.difference_intervals(exact.resample_means("a", a), exact.resample_means("b", b))
+    strat_ci = stratified.difference_intervals(stratified.resample_means("a", a),
+                                               stratified.resample_means("b", b))
+    assert np.allclose(exact_ci, strat_ci, atol=2e-3)
+    difference = a.mean(axis=0) - b.mean(axis=0)
+    assert ((exact_ci[:, 0] < difference) & (difference < exact_ci[:, 1])).all()
+
+
+def test_large_samples_stay_exact_with_bounded_chunks(engine_module, monkeypatch):
+    monkeypatch.setattr(engine_module.BootstrapEngine, "_stratified_means",
+                        lambda *args: pytest.fail("the approximation must be opted in"))
+    values = np.random.default_rng(4).beta(8, 2, size=(5000, 2))
+    # Every resample is wider than a chunk, so its indices are drawn piece by piece
+    means = engine_module.BootstrapEngine(n_resamples=400, chunk_elements=1024).resample_means("a", values)
+    assert means.shape == (400, 2)
+    standard_error = values.std(axis=0) / np.sqrt(len(values))
+    assert np.allclose(means.mean(axis=0), values.mean(axis=0), atol=4 * standard_error / np.sqrt(400))
+    assert np.allclose(means.std(axis=0), standard_error, rtol=0.15)
+
+    with pytest.raises(ValueError):
+        engine_module.BootstrapEngine(method="normal")
+
+
+def test_statistical_analysis_with_bootstrap_stores_intervals(engine_module, engine):
+    engine.score_evaluation_results()
+    analyses = engine.perform_statistical_analysis(bootstrap=True, n_resamples=500, seed=1)
+    first = engine.bootstrap_tool_means(engine_module.BootstrapEngine(n_resamples=500, seed=1))
+    second = engine.bootstrap_tool_means(engine_module.BootstrapEngine(n_resamples=500, seed=1))
+    assert all(np.array_equal(first[tool], second[tool]) for tool in first)
+
+    for analysis in analyses:
+        low, high = analysis.confidence_intervals["score_difference"]
+        assert low <= high
+        assert set(analysis.confidence_intervals) == {"score_difference", "code_quality_score",
+                                                      "functionality_score", "performance_score",
+                                                      "maintainability_score", "innovation_score"}
+
+    conn = sqlite3.connect(engine.db_path)
+    stored = conn.execute("SELECT confidence_intervals FROM comparative_analysis").fetchall()
+    conn.close()
+    assert all(json.loads(row[0])["score_difference"] for row in stored)
+
+
+def test_rollups_track_written_scores(engine_module, engine):
+    engine.score_evaluation_results(limit=120, batch_size=25)
+    engine.score_evaluation_results(batch_size=25)
+    conn = sqlite3.connect(engine.db_path)
+    incremental = engine_module.load_scoring_rollups(conn)
+    conn.close()
+
+    engine.score_evaluation_results(batch_size=25, full_rescore=True)
+    conn = sqlite3.connect(engine.db_path)
+    rebuilt = engine_module.load_scoring_rollups(conn)
+    df = pd.read_sql_query("SELECT * FROM scoring_metrics", conn)
+    conn.close()
+
+    keys = engine_module.ROLLUP_KEYS + ["dimension"]
+    expected = engine_module.summarize_rollups(df).sort_values(keys).reset_index(drop=True)
+    for rollups in (incremental, rebuilt):
+        rollups = rollups.sort_values(keys).reset_index(drop=True)
+        assert rollups[keys + ["n"]].equals(expected[keys + ["n"]])
+        for column in ["total", "total_sq", "min_value", "max_value"]:
+            assert np.allclose(rollups[column], expected[column])
+
+
+def test_insights_from_rollups_match_raw_scores(engine):
+    engine.score_evaluation_results()
+    insights = engine.generate_performance_insights()
+
+    conn = sqlite3.connect(engine.db_path)
+    df = pd.read_sql_query("SELECT * FROM scoring_metrics", conn)
+    conn.close()
+
+    assert sorted(insight.tool for insight in insights) == sorted(df["tool"].unique())
+    for insight in insights:
+        data = df[df["tool"] == insight.tool]
+        category_means = data.groupby("category")["overall_score"].mean().sort_values(ascending=False)
+        assert insight.strengths == [c.replace("-", " ").title() for c in category_means.head(2).index]
+        assert insight.weaknesses == [c.replace("-", " ").title() for c in category_means.tail(2).index]
+
+        trends = insight.performance_trends
+        assert np.isclose(trends["avg_overall_score"], data["overall_score"].mean())
+        assert np.isclose(trends["score_consistency"], 1 - data["overall_score"].std())
+        correlation = data["complexity_level"].corr(data["overall_score"])
+        assert np.isclose(trends["complexity_scaling"], min(max(0, 1 + correlation), 1.0))
+        assert trends["language_versatility"] == data["language"].nunique() / 5.0
+
+
+def test_executive_dashboard_reads_rollups(engine):
+    engine.score_evaluation_results()
+    engine.perform_statistical_analysis()
+    engine.generate_performance_insights()
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert "**Total Evaluations Completed**: 200" in report
+    for tool in ("claude-code", "gemini-cli"):
+        assert f"#### {tool}" in report
+
+
+def test_dashboard_streams_many_tool_pairs(engine):
+    engine.score_evaluation_results()
+    conn = sqlite3.connect(engine.db_path)
+    conn.executemany(
+        "INSERT INTO comparative_analysis (id, tool_a, tool_b, winner, confidence, "
+        "statistical_significance, recommendation, is_current) VALUES (?, ?, ?, ?, 0.9, ?, 'Use the winner', 1)",
+        [(f"pair_{i}", f"tool_{i}", f"tool_{i + 1}", "gemini-cli" if i % 3 else f"tool_{i}", i % 2)
+         for i in range(3000)],
+    )
+    conn.commit()
+    conn.close()
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert report.count("- Winner: ") == 3000
+    assert report.index("**tool_0 vs tool_1**") < report.index("**tool_2999 vs tool_3000**")
+    assert "**Current Leader**: gemini-cli" in report
+    assert not list(engine.reports_dir.glob("*.partial"))
+
+
+IMPORT_BUDGET_SECONDS = 0.5
+HEAVY_MODULES = ("matplotlib", "seaborn", "scipy", "sklearn")
+
+
+def test_cold_import_stays_within_budget():
+    """Importing the engine must not pull in the plotting or statistics stacks."""
+    script = f"""
+import importlib.util, json, sys, time
+import numpy, pandas
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("engine", {str(SCRIPTS_DIR / "scoring-analytics-engine.py")!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+    result = json.loads(subprocess.run([sys.executable, "-c", script], check=True,
+                                       capture_output=True, text=True).stdout)
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_subcommands_dispatch_to_phases(engine_module, engine, capsys):
+    engine_module.main(["--eval-root", str(engine.eval_root), "score", "--batch-size", "50"])
+    assert "Calculated scores for 200 results" in capsys.readouterr().out
+
+    engine_module.main(["--eval-root", str(engine.eval_root), "analyze"])
+    assert "Completed 3 statistical comparisons" in capsys.readouterr().out
+
+    assert engine_module.build_parser().parse_args(["score", "--limit", "5"]).limit == 5
+    with pytest.raises(SystemExit):
+        engine_module.build_parser().parse_args(["pipeline", "--limit", "5"])
+
+
+def test_visualization_panels_are_cached_by_input(engine_module, engine, monkeypatch):
+    engine.score_evaluation_results(limit=150)
+    first_path = engine.create_comprehensive_visualizations(dpi=20)
+    panels = {path.name: path.stat().st_mtime_ns for path in (engine.visualizations_dir / "panels").glob("*.png")}
+    assert first_path.endswith(".png") and len(panels) == 12
+
+    rendered = []
+    monkeypatch.setattr(engine_module, "render_panel", lambda *panel: rendered.append(panel[0]))
+    engine.create_comprehensive_visualizations(dpi=20)
+    assert rendered == []
+
+    engine.score_evaluation_results()
+    monkeypatch.undo()
+    engine.create_comprehensive_visualizations(workers=2, dpi=20)
+    refreshed = {path.name for path in (engine.visualizations_dir / "panels").glob("*.png")}
+    assert len(refreshed) == 12
+    assert refreshed != set(panels)
+
+
+def test_panel_hash_tracks_values(engine_module):
+    frame = pd.DataFrame({"tool": ["a", "b"], "overall_score": [0.5, 0.7]})
+    same = frame.copy()
+    changed = frame.assign(overall_score=[0.5, 0.71])
+    assert engine_module.content_hash(frame) == engine_module.content_hash(same)
+    assert engine_module.content_hash(frame) != engine_module.content_hash(changed)
+    assert engine_module.content_hash(("x", frame)) != engine_module.content_hash(("y", frame))
+    grid = np.zeros(2000)
+    nudged = grid.copy()
+    nudged[1000] = 1.0
+    assert engine_module.content_hash(grid) != engine_module.content_hash(nudged)
+
+
+def test_aggregated_panels_summarize_rows(engine_module, engine):
+    engine.score_evaluation_results()
+    df = engine.score_frames.get()
+    raw = engine_module.panel_inputs(df, {})
+    binned = engine_module.panel_inputs(df, {}, aggregate=True, bins=10)
+
+    histogram = binned["score_histogram"]
+    assert histogram["counts"].to_numpy().sum() == len(df)
+    assert set(histogram["counts"].index) == set(df["tool"].unique())
+
+    scatter = binned["complexity_scatter"]
+    assert scatter["count"].sum() == len(df) and len(scatter) <= df["tool"].nunique() * 5 * 5
+
+    cells = binned["innovation_quality"]
+    assert cells["counts"].sum() == len(df) and cells["means"].shape == (10, 10)
+    occupied = cells["counts"] > 0
+    assert np.all((cells["means"][occupied] >= df["overall_score"].min() - 1e-6)
+                  & (cells["means"][occupied] <= df["overall_score"].max() + 1e-6))
+    assert raw["summary_table"].equals(binned["summary_table"])
+
+    path = engine.create_comprehensive_visualizations(dpi=20, mode="aggregate")
+    assert path.endswith(".png")
+
+
+def test_pipeline_runner_orders_skips_and_records_phases(engine_module, engine):
+    events, traced = [], []
+    inputs = {"value": 1}
+
+    def phase(name):
+        def run():
+            events.append(name)
+            traced.append(tracemalloc.is_tracing())
+            return f"{name} done"
+        return run
+
+    def phases():
+        return [
+            engine_module.PipelinePhase("source", phase("source"), inputs=lambda: inputs["value"]),
+            engine_module.PipelinePhase("left", phase("left"), depends_on=["source"]),
+            engine_module.PipelinePhase("right", phase("right"), depends_on=["source"]),
+            engine_module.PipelinePhase("sink", phase("sink"), depends_on=["left", "right"]),
+        ]
+
+    outcomes = engine_module.PipelineRunner(engine.db_path).run(phases())
+    assert events[0] == "source" and events[-1] == "sink" and set(events[1:3]) == {"left", "right"}
+    assert all(outcome.status == "completed" for outcome in outcomes.values())
+
+    events.clear()
+    outcomes = engine_module.PipelineRunner(engine.db_path).run(phases())
+    assert events == []
+    assert outcomes["sink"].result == "sink done"
+
+    inputs["value"] = 2
+    engine_module.PipelineRunner(engine.db_path).run(phases())
+    assert sorted(events) == ["left", "right", "sink", "source"]
+
+    conn = sqlite3.connect(engine.db_path)
+    rows = conn.execute('''
+        SELECT json_extract(results_summary, '$.status'), execution_time,
+               json_extract(results_summary, '$.peak_memory_bytes')
+        FROM analytics_metadata WHERE analysis_type = 'pipeline_phase'
+    ''').fetchall()
+    conn.close()
+    assert [status for status, _, _ in rows].count("skipped") == 4
+    assert all(wall >= 0 and peak >= 0 for _, wall, peak in rows)
+    assert all(peak > 0 for status, _, peak in rows if status == "completed")
+    assert not any(traced)
+
+
+def test_pipeline_runner_rejects_cycles(engine_module, engine):
+    phases = [
+        engine_module.PipelinePhase("a", lambda: None, depends_on=["b"]),
+        engine_module.PipelinePhase("b", lambda: None, depends_on=["a"]),
+    ]
+    with pytest.raises(ValueError):
+        engine_module.PipelineRunner(engine.db_path).run(phases)
+
+
+def test_profiled_pipeline_runs_phases_sequentially(engine_module, engine, tmp_path):
+    lock = threading.Lock()
+    running, overlaps = [], []
+
+    def phase(name):
+        def run():
+            with lock:
+                running.append(name)
+                overlaps.append(len(running))
+            sum(i * i for i in range(20000))
+            time.sleep(0.02)
+            with lock:
+                running.remove(name)
+            return name
+        return run
+
+    phases = [engine_module.PipelinePhase(name, phase(name)) for name in ("first", "second", "third")]
+    profiler = engine_module.PhaseProfiler(tmp_path / "profiles")
+    outcomes = engine_module.PipelineRunner(engine.db_path, force=True, profiler=profiler).run(phases)
+
+    assert all(outcome.status == "completed" for outcome in outcomes.values())
+    assert max(overlaps) == 1
+    for name in ("first", "second", "third"):
+        stats = pstats.Stats(str(tmp_path / "profiles" / f"{name}.pstats"))
+        assert any(function == "run" for _, _, function in stats.stats)
+        collapsed = (tmp_path / "profiles" / f"{name}.collapsed").read_text().splitlines()
+        assert collapsed and all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+        assert any("run (" in line for line in collapsed)
+        assert (tmp_path / "profiles" / f"{name}.allocations.txt").exists()
+
+
+def test_complete_pipeline_skips_unchanged_phases(engine):
+    first = engine.run_complete_analytics_pipeline(workers=1)
+    assert first["scoring_metrics"] == "200 metrics calculated"
+    assert "skipped_phases" not in first
+
+    second = engine.run_complete_analytics_pipeline()
+    assert second["skipped_phases"].split(", ") == [
+        "scoring_metrics", "statistical_analysis", "performance_insights", "clustering", "visualizations",
+        "executive_dashboard"]
+    assert second["visualizations"] == first["visualizations"]
+
+
+def test_exclusive_phases_run_alone(engine_module, engine):
+    lock = threading.Lock()
+    running, overlaps = set(), {}
+
+    def phase(name):
+        def run():
+            with lock:
+                running.add(name)
+            time.sleep(0.05)
+            with lock:
+                overlaps[name] = set(running) - {name}
+                running.discard(name)
+        return run
+
+    PipelinePhase = engine_module.PipelinePhase
+    phases = [
+        PipelinePhase("source", phase("source")),
+        PipelinePhase("left", phase("left"), depends_on=["source"]),
+        PipelinePhase("forking", phase("forking"), depends_on=["source"], exclusive=True),
+        PipelinePhase("right", phase("right"), depends_on=["source"]),
+    ]
+    engine_module.PipelineRunner(engine.db_path, force=True).run(phases)
+    assert overlaps["forking"] == set()
+    assert "forking" not in overlaps["left"] | overlaps["right"]
+
+
+def test_pipeline_with_worker_processes_completes(engine):
+    """Forking phases run alone, so their worker pools cannot inherit held locks."""
+    script = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("scoring_analytics_engine",
+                                              {str(SCRIPTS_DIR / "scoring-analytics-engine.py")!r})
+module = sys.modules["scoring_analytics_engine"] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+engine = module.ScoringAnalyticsEngine({str(engine.eval_root)!r})
+results = engine.run_complete_analytics_pipeline(workers=2, bootstrap=True, n_resamples=500, omnibus="kruskal")
+print(results["visualizations"])
+"""
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True,
+                            timeout=300)
+    assert result.stdout.strip().endswith(".png")
+
+
+def _history(engine, table):
+    conn = sqlite3.connect(engine.db_path)
+    rows = conn.execute(f"SELECT COUNT(*), SUM(is_current) FROM {table}").fetchone()
+    conn.close()
+    return rows
+
+
+def _retention_with_analyzed_tables(engine, **options):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("ANALYZE sqlite_schema")
+    conn.execute("DELETE FROM sqlite_stat1")
+    conn.commit()
+    conn.close()
+
+    summary = engine.apply_retention(**options)
+    conn = sqlite3.connect(engine.db_path)
+    tables = {table for (table,) in conn.execute("SELECT DISTINCT tbl FROM sqlite_stat1")}
+    conn.close()
+    return summary, tables
+
+
+def test_current_rows_replace_previous_and_retention_compacts(engine):
+    engine.score_evaluation_results()
+    for _ in range(4):
+        engine.perform_statistical_analysis()
+        engine.generate_performance_insights()
+
+    assert _history(engine, "comparative_analysis") == (12, 3)
+    assert _history(engine, "performance_insights") == (60, 15)
+
+    summary, analyzed = _retention_with_analyzed_tables(engine, mode="latest", keep_latest=2)
+    assert summary["comparative_analysis"] == 6 and summary["performance_insights"] == 30
+    assert _history(engine, "comparative_analysis") == (6, 3)
+    assert analyzed == {"comparative_analysis", "performance_insights"}
+
+    # Every remaining run happened today, so daily mode keeps only the current rows
+    engine.apply_retention(mode="daily", days=30)
+    assert _history(engine, "comparative_analysis") == (3, 3)
+    assert _history(engine, "performance_insights") == (15, 15)
+
+    # Nothing left to remove, so no table is analyzed again
+    summary, analyzed = _retention_with_analyzed_tables(engine, mode="daily", days=30)
+    assert summary["comparative_analysis"] == summary["performance_insights"] == 0
+    assert analyzed == set()
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert report.count(" vs ") == 3
+
+
+def test_legacy_history_gets_current_flags(engine_module, engine):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("DROP TABLE performance_insights")
+    conn.execute('''
+        CREATE TABLE performance_insights (
+            id TEXT PRIMARY KEY, tool TEXT NOT NULL, insight_type TEXT NOT NULL,
+            insight_value TEXT NOT NULL, confidence REAL, supporting_data TEXT,
+            generated_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.executemany("INSERT INTO performance_insights (id, tool, insight_type, insight_value) VALUES (?, ?, ?, ?)",
+                     [(f"i{i}", "claude-code", "strengths", "[]") for i in range(3)])
+    conn.commit()
+    conn.close()
+
+    engine_module.ScoringAnalyticsEngine(str(engine.eval_root))
+    assert _history(engine, "performance_insights") == (3, 1)
+
+
+def test_omnibus_tests_match_scipy(engine_module, engine):
+    from scipy import stats
+
+    engine.score_evaluation_results()
+    conn = sqlite3.connect(engine.db_path)
+    df = pd.read_sql_query("SELECT tool, overall_score FROM scoring_metrics", conn)
+    conn.close()
+
+    kruskal = engine.perform_omnibus_analysis("kruskal")
+    anova = engine.perform_omnibus_analysis("anova")
+    groups = [df.loc[df["tool"] == tool, "overall_score"] for tool in kruskal.tools]
+
+    expected_h, expected_kruskal_p = stats.kruskal(*groups)
+    assert np.isclose(kruskal.statistic, expected_h) and np.isclose(kruskal.p_value, expected_kruskal_p)
+    expected_f, expected_anova_p = stats.f_oneway(*groups)
+    assert np.isclose(anova.statistic, expected_f) and np.isclose(anova.p_value, expected_anova_p)
+
+    d = np.array(anova.effect_size_matrix)
+    assert np.allclose(d, -d.T)
+    a, b = groups[0], groups[1]
+    pooled = np.sqrt(((len(a) - 1) * a.var() + (len(b) - 1) * b.var()) / (len(a) + len(b) - 2))
+    assert np.isclose(d[0, 1], (a.mean() - b.mean()) / pooled)
+
+    _, raw_p = stats.ttest_ind(a, b)
+    assert np.isclose(anova.pairwise_p_values[0][1], min(raw_p * 3, 1.0))
+
+
+def test_statistical_analysis_records_omnibus(engine):
+    engine.score_evaluation_results()
+    engine.perform_statistical_analysis(omnibus="anova")
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert "**All tools (anova on overall_score)**: 3 tools" in report
+
+
+def test_statistical_analysis_skips_omnibus_without_two_varied_tools(engine_module, engine):
+    engine.score_evaluation_results()
+    conn = sqlite3.connect(engine.db_path)
+    tools = [tool for (tool,) in conn.execute("SELECT DISTINCT tool FROM scoring_metrics ORDER BY tool")]
+    # Leave one score for every tool but the first, so only one tool has a variance
+    conn.execute('''
+        DELETE FROM scoring_metrics WHERE tool != ? AND rowid NOT IN (
+            SELECT MIN(rowid) FROM scoring_metrics GROUP BY tool)
+    ''', (tools[0],))
+    engine_module.rebuild_scoring_statistics(conn)
+    conn.commit()
+    conn.close()
+
+    analyses = engine.perform_statistical_analysis(omnibus="kruskal")
+    assert len(analyses) == len(tools) * (len(tools) - 1) // 2
+    with pytest.raises(ValueError):
+        engine.perform_omnibus_analysis("kruskal")
+
+
+def test_tdigest_quantiles_and_merge(engine_module):
+    rng = np.random.default_rng(5)
+    values = rng.beta(8, 3, size=60_000)
+    whole = engine_module.TDigest.from_values(values)
+    merged = engine_module.TDigest()
+    for chunk in np.array_split(values, 12):
+        merged = merged.merge(engine_module.TDigest.from_values(chunk))
+
+    quantiles = np.array([0.01, 0.5, 0.9, 0.99])
+    expected = np.quantile(values, quantiles)
+    for sketch in (whole, merged):
+        assert sketch.count == len(values)
+        assert len(sketch.means) < 300
+        assert np.allclose(sketch.quantile(quantiles), expected, atol=2e-3)
+    restored = engine_module.TDigest.from_row(merged.to_blob(), merged.min_value, merged.max_value, 200.0)
+    assert np.array_equal(restored.quantile(quantiles), merged.quantile(quantiles))
+
+
+def test_persisted_sketches_track_written_scores(engine_module, engine):
+    engine.score_evaluation_results(limit=120, batch_size=25)
+    engine.score_evaluation_results(batch_size=25)
+
+    conn = sqlite3.connect(engine.db_path)
+    sketches = engine_module.load_scoring_sketches(conn)
+    df = pd.read_sql_query("SELECT * FROM scoring_metrics", conn)
+    conn.close()
+
+    for tool, tool_data in df.groupby("tool"):
+        for dimension in engine_module.STATISTICS_DIMENSIONS:
+            sketch = sketches[(tool, dimension)]
+            assert sketch.count == len(tool_data)
+            assert sketch.min_value == tool_data[dimension].min()
+            assert np.isclose(sketch.quantile(0.5), tool_data[dimension].median(), atol=0.02)
+
+    engine.score_evaluation_results(batch_size=25, full_rescore=True)
+    conn = sqlite3.connect(engine.db_path)
+    assert all(sketch.count == (df["tool"] == tool).sum()
+               for (tool, _), sketch in engine_module.load_scoring_sketches(conn).items())
+    conn.close()
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert report.count("**Score Percentiles (p50 / p90 / p99)**") == 3
+
+
+def test_features_are_extracted_once_and_rescoring_reads_only_features(engine_module, engine):
+    assert engine.score_evaluation_results() == 200
+    conn = sqlite3.connect(engine.db_path)
+    query = "SELECT result_id, overall_score FROM scoring_metrics ORDER BY result_id"
+    before = conn.execute(query).fetchall()
+    conn.execute("UPDATE evaluation_results SET response = '', metrics = '{broken'")
+    conn.commit()
+    conn.close()
+
+    assert engine.refresh_scoring_features() == 0
+    engine.score_evaluation_results(full_rescore=True)
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute(query).fetchall() == before
+    conn.close()
+
+
+def test_feature_version_bump_reextracts(engine_module, engine, monkeypatch):
+    assert engine.refresh_scoring_features() == 200
+    monkeypatch.setattr(engine_module, "FEATURE_VERSION", engine_module.FEATURE_VERSION + 1)
+    assert engine.refresh_scoring_features() == 200
+
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute("SELECT COUNT(*), MIN(feature_version) FROM scoring_features").fetchone() == (
+        200, engine_module.FEATURE_VERSION)
+    conn.close()
+
+
+def test_factor_overrides_from_config(engine_module, engine):
+    features, _ = engine_module.VectorizedScorer.extract_features(pd.DataFrame(make_evaluation_rows(50)))
+    config = dict(engine.scoring_config, factors={"tool_performance": {"claude-code": 0.5}})
+    default = engine_module.VectorizedScorer(engine.scoring_config).score_frame(features)
+    overridden = engine_module.VectorizedScorer(config).score_frame(features)
+
+    claude = (features["tool"] == "claude-code").to_numpy()
+    assert (overridden.loc[claude, "performance_score"] < default.loc[claude, "performance_score"]).all()
+    pd.testing.assert_frame_equal(overridden[~claude], default[~claude])
+
+
+def test_weights_only_change_reweights_stored_scores(engine_module, engine):
+    engine.score_evaluation_results()
+    conn = sqlite3.connect(engine.db_path)
+    timestamps = conn.execute("SELECT DISTINCT scoring_timestamp FROM scoring_metrics").fetchall()
+    conn.close()
+    weights = {"code_quality": 0.1, "functionality": 0.4, "performance": 0.1,
+               "maintainability": 0.3, "innovation": 0.1}
+    engine.scoring_config = dict(engine.scoring_config, weights=weights)
+    assert engine.changed_scoring_config_sections() == ["weights"]
+
+    assert engine.score_evaluation_results() == 0
+    assert engine.changed_scoring_config_sections() == []
+
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute("SELECT DISTINCT scoring_timestamp FROM scoring_metrics").fetchall() == timestamps
+    stored = pd.read_sql_query("SELECT result_id, tool, overall_score FROM scoring_metrics ORDER BY result_id", conn)
+    statistics = engine_module.load_scoring_statistics(conn)
+    conn.close()
+
+    features = pd.concat(engine.iter_scoring_features(full_rescore=True))
+    expected = engine_module.VectorizedScorer(engine.scoring_config).score_frame(features)
+    expected = expected.assign(result_id=features["id"].values).sort_values("result_id")
+    np.testing.assert_array_equal(stored["overall_score"].to_numpy(), expected["overall_score"].to_numpy())
+    for tool, tool_scores in stored.groupby("tool"):
+        assert statistics[tool]["overall_score"].mean == pytest.approx(tool_scores["overall_score"].mean())
+
+
+def test_non_weight_config_change_triggers_full_rescore(engine):
+    engine.score_evaluation_results()
+    engine.scoring_config = dict(engine.scoring_config, factors={"tool_performance": {"claude-code": 0.5}})
+    assert engine.changed_scoring_config_sections() == ["factors"]
+    assert engine.score_evaluation_results() == 200
+    assert engine.score_evaluation_results() == 0
+
+
+CODE_RESPONSE = '''Here is the implementation:
+
+```python
+def load(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield line  # comment with def fake()
+
+def parse(text):
+    return text.split(",")
+```
+'''
+
+
+def test_code_metrics_of_a_response(engine_module):
+    metrics = engine_module.analyze_response(CODE_RESPONSE, "rust")
+    assert (metrics.code_blocks, metrics.loc, metrics.functions, metrics.max_nesting) == (1, 7, 2, 4)
+    assert metrics.duplication == 0.0
+    assert 0.0 < metrics.structure_score < 1.0
+
+    duplicated = engine_module.analyze_response(
+        "```rust\nfn a() {\n    let total = x + y;\n    let total = x + y;\n}\n```")
+    assert (duplicated.functions, duplicated.max_nesting) == (1, 1)
+    assert duplicated.duplication == 0.5
+
+    plain = engine_module.analyze_response("no code here", "python")
+    assert plain.structure_score == engine_module.DEFAULT_STRUCTURE_SCORE
+    assert plain.innovation_base == engine_module.DEFAULT_INNOVATION_BASE
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_code_metrics_are_memoized_by_response_hash(engine_module, engine, workers):
+    conn = sqlite3.connect(engine.db_path)
+    conn.execute("UPDATE evaluation_results SET response = ? WHERE rowid % 4 = 0", (CODE_RESPONSE,))
+    conn.commit()
+    raw = pd.read_sql_query("SELECT * FROM evaluation_results ORDER BY rowid", conn)
+    conn.close()
+
+    engine.refresh_scoring_features()
+    distinct_responses = raw["response"].nunique()
+    assert engine.refresh_code_metrics(workers) == distinct_responses
+    assert engine.refresh_code_metrics(workers) == 0
+
+    engine.score_evaluation_results(workers=workers)
+    conn = sqlite3.connect(engine.db_path)
+    stored = pd.read_sql_query("SELECT result_id, maintainability_score, innovation_score FROM scoring_metrics "
+                               "ORDER BY result_id", conn)
+    assert conn.execute("SELECT COUNT(*) FROM code_metrics").fetchone()[0] == distinct_responses
+    conn.close()
+
+    scorer = engine_module.VectorizedScorer(engine.scoring_config)
+    features, _ = scorer.extract_features(raw)
+    expected = scorer.score_frame(features).assign(result_id=raw["id"].values).sort_values("result_id")
+    np.testing.assert_allclose(stored["maintainability_score"], expected["maintainability_score"])
+    np.testing.assert_allclose(stored["innovation_score"], expected["innovation_score"])
+
+    code_rows = raw["response"].eq(CODE_RESPONSE).to_numpy()
+    row = raw[code_rows].iloc[0]
+    assert engine.calculate_maintainability_score(row, json.loads(row["metrics"] or "{}")) == pytest.approx(
+        expected.set_index("result_id").loc[row["id"], "maintainability_score"])
+
+
+def test_score_trends_rolling_means_and_change_points(engine_module, engine):
+    rng = np.random.default_rng(3)
+    start = pd.Timestamp.now().normalize() - pd.Timedelta(days=13)
+    rows = []
+    for day in range(14):
+        for tool in ("claude-code", "gemini-cli"):
+            shift = 0.1 if tool == "claude-code" and day >= 7 else 0.0
+            for i in range(30):
+                timestamp = (start + pd.Timedelta(days=day, minutes=i)).isoformat()
+                rows.append((f"{tool}_{day}_{i}", f"{tool}_{day}_{i}", tool, "python", "apis", 1,
+                             0.7 + shift + rng.normal(0, 0.02), timestamp))
+    conn = sqlite3.connect(engine.db_path)
+    conn.executemany(
+        "INSERT INTO scoring_metrics (id, result_id, tool, language, category, complexity_level, "
+        "overall_score, scoring_timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    engine_module.rebuild_scoring_rollups(conn)
+    conn.commit()
+    plan = " ".join(str(row[-1]) for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT tool, overall_score FROM scoring_metrics WHERE scoring_timestamp >= ?", ("",)))
+    conn.close()
+    assert "idx_scoring_metrics_timestamp" in plan
+
+    trends = engine.analyze_score_trends(days=30)
+    assert len(trends) == 28
+
+    raw = pd.DataFrame(rows, columns=["id", "result_id", "tool", "language", "category", "complexity",
+                                      "overall_score", "timestamp"])
+    raw["day"] = raw["timestamp"].str[:10]
+    daily = raw.groupby(["tool", "day"])["overall_score"].agg(["sum", "count"])
+    rolling = daily.groupby(level="tool").rolling(7, min_periods=1).sum().droplevel(0)
+    np.testing.assert_allclose(trends["rolling_mean"], (rolling["sum"] / rolling["count"]).to_numpy())
+
+    claude = trends[trends["tool"] == "claude-code"]
+    assert claude.loc[claude["change_point"], "bucket"].iloc[0] == (start + pd.Timedelta(days=7)).strftime("%Y-%m-%d")
+    assert not trends.loc[trends["tool"] == "gemini-cli", "change_point"].any()
+    assert claude["ewma"].iloc[-1] > claude["ewma"].iloc[0]
+
+    weekly = engine.analyze_score_trends(days=30, granularity="week")
+    assert weekly.groupby("tool")["n"].sum().tolist() == [420, 420]
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert "- **claude-code**: trending upward" in report
+
+
+def test_full_rescore_keeps_trend_history(engine):
+    engine.score_evaluation_results()
+    conn = sqlite3.connect(engine.db_path)
+    # Spread the first scoring over the last ten days
+    conn.execute("""UPDATE scoring_metrics SET scoring_timestamp =
+                    strftime('%Y-%m-%dT%H:%M:%f', 'now', '-' || (rowid % 10) || ' days')""")
+    conn.commit()
+    query = "SELECT result_id, scoring_timestamp FROM scoring_metrics ORDER BY result_id"
+    first_scored = conn.execute(query).fetchall()
+    conn.close()
+    before = engine.analyze_score_trends(days=30)
+
+    assert engine.score_evaluation_results(full_rescore=True) == 200
+
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute(query).fetchall() == first_scored
+    conn.close()
+    after = engine.analyze_score_trends(days=30)
+    assert after["bucket"].nunique() == 10
+    pd.testing.assert_frame_equal(after[["tool", "bucket", "n"]], before[["tool", "bucket", "n"]])
+
+
+def test_clustering_streams_chunks_and_stores_profiles(engine, engine_module):
+    engine.score_evaluation_results()
+    summary = engine.cluster_tool_profiles(n_clusters=3, chunk_size=64)
+    assert (summary["rows"], summary["clusters"]) == (200, 3)
+    assert "sklearn" in sys.modules
+
+    conn = sqlite3.connect(engine.db_path)
+    assignments = pd.read_sql_query("SELECT result_id, cluster FROM score_clusters", conn)
+    scores = pd.read_sql_query(f"SELECT result_id, tool, {', '.join(engine_module.SCORE_DIMENSIONS)} "
+                               "FROM scoring_metrics", conn).merge(assignments, on="result_id")
+    conn.close()
+    assert len(assignments) == 200
+
+    centroids = engine.load_cluster_centroids().set_index("cluster").sort_index()
+    assert centroids["size"].tolist() == assignments["cluster"].value_counts().sort_index().tolist()
+    for cluster, members in scores.groupby("cluster"):
+        tool_counts = json.loads(centroids.loc[cluster, "tool_counts"])
+        assert tool_counts == {tool: int(count) for tool, count in members["tool"].value_counts().items()} | {
+            tool: 0 for tool in set(scores["tool"]) - set(members["tool"])}
+
+    report = open(engine.generate_executive_dashboard()).read()
+    assert report.count("**Profile ") == 3
+
+
+def test_score_frame_cache_is_typed_shared_and_invalidated(engine_module, engine):
+    engine.score_evaluation_results()
+    cache = engine.score_frames
+
+    frame = cache.get()
+    assert len(frame) == 200
+    assert isinstance(frame["tool"].dtype, pd.CategoricalDtype)
+    assert frame["complexity_level"].dtype == np.int8
+    conn = sqlite3.connect(engine.db_path)
+    stored = pd.read_sql_query("SELECT overall_score FROM scoring_metrics", conn)["overall_score"]
+    conn.close()
+    assert frame["overall_score"].dtype == np.float64
+    assert np.array_equal(np.sort(frame["overall_score"].to_numpy()), np.sort(stored.to_numpy()))
+
+    engine.perform_statistical_analysis(bootstrap=True, n_resamples=50, omnibus="kruskal")
+    engine.generate_performance_insights()
+    assert cache.get() is frame and cache.loads == 1
+
+    engine.scoring_config = dict(engine.scoring_config, factors={"tool_performance": {"claude-code": 0.5}})
+    engine.score_evaluation_results()
+    reloaded = cache.get()
+    assert cache.loads == 2 and reloaded is not frame
+    assert reloaded["performance_score"].mean() < frame["performance_score"].mean()
+
+    cache.clear()
+    assert cache.frame is None and cache.conn is None